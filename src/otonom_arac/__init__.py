@@ -0,0 +1,4 @@
+# Dosya: src/otonom_arac/__init__.py
+# SAÜTONOM otonom araç simülasyonu.
+# Çekirdek (algorithms, map, car, simulation) sadece numpy gerektirir;
+# ui katmanı ve create_assets pygame ister.
@@ -0,0 +1,3 @@
+# Dosya: src/otonom_arac/algorithms/__init__.py
+# Yol bulma algoritmaları (BFS, DFS, A*, artımlı ve hiyerarşik planlayıcılar).
+# pygame gerektirmez.
@@ -0,0 +1,297 @@
+# Dosya: src/otonom_arac/algorithms/benchmark.py
+#
+# Yol bulma benchmark'ı.
+# Her algoritmayı GAME_MAP ve üretilmiş haritalar (40x25 ... 2000x2000)
+# üzerinde, dinamik engelli ve engelsiz koşturur; sorgu başına süre,
+# saniyede açılan düğüm, bellek ve arama sayaçlarını JSON olarak kaydeder.
+# Önceki bir sonuç dosyası verilirse (--baseline) gerilemeleri raporlar.
+#
+# Kullanım (src klasöründen):
+#   python -m otonom_arac.algorithms.benchmark --output ../benchmarks/current.json
+#   python -m otonom_arac.algorithms.benchmark --sizes 40x25 200x200 --baseline ../benchmarks/baseline.json
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from otonom_arac.algorithms.pathfinding import ALGORITHMS, INCREMENTAL_ALGORITHMS, PathFinder, SearchStats
+from otonom_arac.map.map_data import GAME_MAP
+from otonom_arac.map.map_generator import generate_city_map, pick_obstacles_on_path
+
+DEFAULT_SIZES = ["40x25", "200x200", "1000x1000", "2000x2000"]
+RESULT_FORMAT_VERSION = 1
+
+# Bu kadar kareden büyük haritalarda sorgu sadece bir kez tekrarlanır
+LARGE_MAP_CELLS = 250_000
+
+
+def parse_size(text):
+    cols, rows = text.lower().split("x")
+    return int(rows), int(cols)
+
+
+def find_tile(game_map, value):
+    for r, row in enumerate(game_map):
+        for c, v in enumerate(row):
+            if v == value:
+                return (r, c)
+    return None
+
+
+def build_maps(sizes, seed):
+    """(ad, harita) listesi: önce GAME_MAP, sonra üretilen haritalar."""
+    maps = [("GAME_MAP", GAME_MAP)]
+    for size in sizes:
+        rows, cols = parse_size(size)
+        maps.append((f"city_{cols}x{rows}", generate_city_map(rows, cols, seed=seed)))
+    return maps
+
+
+def prepare_query(pathfinder, algorithm, start, goal, obstacles):
+    """
+    Artımlı algoritmalarda (D* Lite) her tekrar sıfırdan başlar; engelli
+    senaryoda önce engelsiz plan yapılır, ölçülen sorgu engel sonrası
+    yeniden planlamadır.
+    """
+    if algorithm not in INCREMENTAL_ALGORITHMS:
+        return
+    pathfinder.reset_incremental()
+    if obstacles:
+        pathfinder.search(algorithm, start, goal)
+
+
+def measure_peak_memory(pathfinder, algorithm, start, goal, obstacles):
+    """Tek bir sorgunun tepe bellek kullanımı (KB). Süre ölçümünden ayrı yapılır."""
+    prepare_query(pathfinder, algorithm, start, goal, obstacles)
+    tracemalloc.start()
+    try:
+        pathfinder.search(algorithm, start, goal, obstacles)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024.0
+
+
+def bench_query(map_name, game_map, pathfinder, algorithm, start, goal,
+                obstacles, repeat, with_memory):
+    times = []
+    stats = None
+    for _ in range(repeat):
+        prepare_query(pathfinder, algorithm, start, goal, obstacles)
+        stats = SearchStats()
+        pathfinder.search(algorithm, start, goal, obstacles, stats)
+        times.append(stats.elapsed)
+
+    median = statistics.median(times)
+    result = {
+        "map": map_name,
+        "rows": len(game_map),
+        "cols": len(game_map[0]),
+        "algorithm": algorithm,
+        "obstacles": len(obstacles) if obstacles else 0,
+        "repeat": repeat,
+        "time_per_query_ms": median * 1000.0,
+        "min_time_ms": min(times) * 1000.0,
+        "nodes_expanded": stats.nodes_expanded,
+        "pushes": stats.pushes,
+        "peak_frontier": stats.peak_frontier,
+        "nodes_per_sec": stats.nodes_expanded / median if median > 0 else 0.0,
+        "path_length": stats.path_length,
+        "found": stats.found,
+        "peak_memory_kb": None,
+    }
+
+    if with_memory:
+        result["peak_memory_kb"] = measure_peak_memory(
+            pathfinder, algorithm, start, goal, obstacles
+        )
+    return result
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, algorithms=None, repeat=5,
+                  obstacle_ratio=0.05, seed=0, with_memory=True, verbose=True):
+    """Tüm harita/algoritma/engel kombinasyonlarını koşturup sonuç sözlüğü döndürür."""
+    if algorithms is None:
+        algorithms = list(ALGORITHMS)
+
+    results = []
+    for map_name, game_map in build_maps(sizes, seed):
+        # Ölçülen her sorgu gerçekten aransın diye rota önbelleği kapalı
+        pathfinder = PathFinder(game_map, route_cache_size=0)
+        start = find_tile(game_map, 3)
+        goal = find_tile(game_map, 4)
+        if not start or not goal:
+            continue
+
+        cells = len(game_map) * len(game_map[0])
+        map_repeat = 1 if cells > LARGE_MAP_CELLS else repeat
+
+        # Engeller engelsiz en kısa rotanın üzerine konur ki yeniden planlama zorlansın
+        free_path = pathfinder.search("BFS", start, goal)
+        count = max(1, int(len(free_path) * obstacle_ratio))
+        scenarios = [None]
+        obstacles = pick_obstacles_on_path(game_map, free_path, count, seed=seed)
+        if obstacles:
+            scenarios.append(obstacles)
+
+        for obstacles in scenarios:
+            scenario = [
+                bench_query(
+                    map_name, game_map, pathfinder, algorithm, start, goal,
+                    obstacles, map_repeat, with_memory
+                )
+                for algorithm in algorithms
+            ]
+            add_a_star_ratios(scenario)
+            results.extend(scenario)
+            if verbose:
+                for result in scenario:
+                    print_result(result)
+
+    return {
+        "format_version": RESULT_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def add_a_star_ratios(scenario):
+    """Aynı senaryodaki A* sonucuna göre açılan/eklenen düğüm oranları."""
+    reference = next((r for r in scenario if r["algorithm"] == "A*"), None)
+    for result in scenario:
+        result["expanded_vs_a_star"] = None
+        result["pushes_vs_a_star"] = None
+        if reference is None:
+            continue
+        if reference["nodes_expanded"]:
+            result["expanded_vs_a_star"] = result["nodes_expanded"] / reference["nodes_expanded"]
+        if reference["pushes"]:
+            result["pushes_vs_a_star"] = result["pushes"] / reference["pushes"]
+
+
+# --------------------------------------------------------
+# Karşılaştırma
+# --------------------------------------------------------
+def result_key(result):
+    return (result["map"], result["algorithm"], result["obstacles"])
+
+
+def compare(baseline, current, tolerance=0.25):
+    """
+    İki sonuç dosyasını karşılaştırır; gerileme mesajlarının listesini döndürür.
+    - Süre, baseline'dan tolerance oranından fazla uzadıysa
+    - Açılan düğüm sayısı arttıysa
+    - Rota uzunluğu değiştiyse
+    """
+    old = {result_key(r): r for r in baseline["results"]}
+    regressions = []
+
+    for new in current["results"]:
+        key = result_key(new)
+        ref = old.get(key)
+        if ref is None:
+            continue
+
+        name = f"{key[0]} / {key[1]} / engel={key[2]}"
+        if new["time_per_query_ms"] > ref["time_per_query_ms"] * (1.0 + tolerance):
+            regressions.append(
+                f"{name}: süre {ref['time_per_query_ms']:.3f} ms -> {new['time_per_query_ms']:.3f} ms"
+            )
+        if new["nodes_expanded"] > ref["nodes_expanded"]:
+            regressions.append(
+                f"{name}: açılan düğüm {ref['nodes_expanded']} -> {new['nodes_expanded']}"
+            )
+        if new["path_length"] != ref["path_length"]:
+            regressions.append(
+                f"{name}: rota uzunluğu {ref['path_length']} -> {new['path_length']}"
+            )
+
+    return regressions
+
+
+def print_result(result):
+    memory = result["peak_memory_kb"]
+    memory_text = f"{memory:10.1f} KB" if memory is not None else "         - KB"
+    ratio = result.get("expanded_vs_a_star")
+    ratio_text = f" A*'a göre düğüm x{ratio:.2f}" if ratio is not None else ""
+    print(
+        f"{result['map']:>16} {result['algorithm']:>14} engel={result['obstacles']:<4}"
+        f" {result['time_per_query_ms']:10.3f} ms"
+        f" {result['nodes_expanded']:>9} düğüm"
+        f" {result['nodes_per_sec']:12.0f} düğüm/sn"
+        f" {memory_text}"
+        f" rota={result['path_length']}"
+        f"{ratio_text}"
+    )
+
+
+def save_results(data, path):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Yol bulma benchmark'ı")
+    parser.add_argument("--sizes", nargs="*", default=DEFAULT_SIZES,
+                        help="Üretilecek haritalar, SÜTUNxSATIR (ör. 40x25 2000x2000)")
+    parser.add_argument("--algos", nargs="*", default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--obstacle-ratio", type=float, default=0.05,
+                        help="Rota uzunluğuna göre engel oranı")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="tracemalloc ile bellek ölçümünü atla")
+    parser.add_argument("--output", default=None,
+                        help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", default=None,
+                        help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Süre gerilemesi için izin verilen oran")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    data = run_benchmark(
+        sizes=args.sizes,
+        algorithms=args.algos,
+        repeat=args.repeat,
+        obstacle_ratio=args.obstacle_ratio,
+        seed=args.seed,
+        with_memory=not args.no_memory,
+    )
+
+    if args.output:
+        save_results(data, args.output)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), data, args.tolerance)
+        if regressions:
+            print("\n⚠️  Gerilemeler:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("\n✅ Baseline'a göre gerileme yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
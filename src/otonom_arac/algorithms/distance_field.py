@@ -0,0 +1,245 @@
+# Dosya: src/otonom_arac/algorithms/distance_field.py
+#
+# Hedef köklü mesafe alanı (distance field).
+# Bir hedeften geriye doğru tek bir BFS yapılır ve her karenin hedefe olan
+# adım sayısı düz bir tamsayı dizisinde saklanır. Aynı hedefe giden bütün
+# araçlar rotalarını bu diziden, mesafesi her adımda bir azalan komşuyu
+# seçerek O(rota uzunluğu) sürede çıkarır.
+# Dinamik engel eklenince/kaldırılınca alan baştan hesaplanmaz; sadece
+# mesafesi değişen kareler yerel olarak düzeltilir.
+
+import heapq
+import time
+from array import array
+from collections import deque
+
+# Hedefe ulaşılamayan (veya engelli) kare
+UNREACHED = -1
+
+
+class DistanceField:
+    """
+    Tek bir hedefe olan mesafeler.
+    pathfinder: derlenmiş haritayı (offsets / adjacency / cols) sağlayan PathFinder.
+    Alan ilk plan() çağrısında kurulur; kurulumun süresi ve genişletilen
+    düğümleri o çağrının SearchStats'ına yazılır.
+    """
+
+    def __init__(self, pathfinder, goal):
+        self.pathfinder = pathfinder
+        self.goal = goal
+        self.map_version = None   # None: alan henüz kurulmadı
+        self.blocked = set()
+        self.dist = None
+        self.expanded = 0
+        self.pushes = 0
+        self.peak = 0
+
+    # --------------------------------------------------------
+    def reset(self):
+        """Alanı boş engel kümesiyle baştan hesaplar (harita değişince de çağrılır)."""
+        pf = self.pathfinder
+        self.map_version = pf.map_version
+        self.cols = pf.cols
+        self.goal_id = pf.cell_id(self.goal)
+        self.blocked = set()
+        self.dist = array("i", [UNREACHED]) * (pf.rows * pf.cols)
+
+        self.expanded = 0
+        self.pushes = 0
+        self.peak = 0
+        self.build()
+
+    def neighbors(self, cell):
+        pf = self.pathfinder
+        return pf.adjacency[pf.offsets[cell]:pf.offsets[cell + 1]]
+
+    # --------------------------------------------------------
+    # Tam hesaplama: hedeften geriye BFS
+    # --------------------------------------------------------
+    def build(self):
+        dist = self.dist
+        for i in range(len(dist)):
+            dist[i] = UNREACHED
+
+        goal_id = self.goal_id
+        if goal_id in self.blocked:
+            return
+
+        pf = self.pathfinder
+        offsets, adjacency = pf.offsets, pf.adjacency
+        blocked = self.blocked
+
+        dist[goal_id] = 0
+        queue = deque([goal_id])
+        self.pushes += 1
+        while queue:
+            current = queue.popleft()
+            self.expanded += 1
+            through = dist[current] + 1
+            for i in range(offsets[current], offsets[current + 1]):
+                nxt = adjacency[i]
+                if dist[nxt] == UNREACHED and nxt not in blocked:
+                    dist[nxt] = through
+                    queue.append(nxt)
+                    self.pushes += 1
+            if len(queue) > self.peak:
+                self.peak = len(queue)
+
+    # --------------------------------------------------------
+    # Yerel düzeltmeler
+    # --------------------------------------------------------
+    def block(self, cell):
+        """
+        cell engellendi. Hedefe giden her en kısa yolu cell'den geçen kareler
+        (etkilenenler) bulunur, mesafeleri silinir ve etkilenmeyen
+        komşularından başlayarak yeniden hesaplanır.
+        """
+        blocked = self.blocked
+        blocked.add(cell)
+        if cell == self.goal_id:
+            self.build()
+            return
+
+        dist = self.dist
+        if dist[cell] == UNREACHED:
+            return
+
+        # Seviye seviye ilerlendiği için bir karenin tüm ebeveynleri
+        # (mesafesi bir eksik komşuları) o kareye sıra gelmeden işlenmiş olur.
+        affected = {cell}
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            self.expanded += 1
+            child_dist = dist[current] + 1
+            for nxt in self.neighbors(current):
+                if nxt in affected or nxt in blocked or dist[nxt] != child_dist:
+                    continue
+                has_other_parent = False
+                for parent in self.neighbors(nxt):
+                    if (dist[parent] == child_dist - 1 and parent not in affected
+                            and parent not in blocked):
+                        has_other_parent = True
+                        break
+                if not has_other_parent:
+                    affected.add(nxt)
+                    queue.append(nxt)
+
+        for a in affected:
+            dist[a] = UNREACHED
+
+        # Etkilenen kareleri sınırdaki sağlam komşulardan tohumla
+        heap = []
+        for a in affected:
+            if a == cell:
+                continue
+            best = -1
+            for nxt in self.neighbors(a):
+                d = dist[nxt]
+                if d != UNREACHED and nxt not in blocked and (best == -1 or d + 1 < best):
+                    best = d + 1
+            if best != -1:
+                heap.append((best, a))
+        heapq.heapify(heap)
+        self.pushes += len(heap)
+
+        while heap:
+            d, current = heapq.heappop(heap)
+            if dist[current] != UNREACHED and dist[current] <= d:
+                continue
+            dist[current] = d
+            self.expanded += 1
+            for nxt in self.neighbors(current):
+                if nxt in blocked:
+                    continue
+                if dist[nxt] == UNREACHED or dist[nxt] > d + 1:
+                    heapq.heappush(heap, (d + 1, nxt))
+                    self.pushes += 1
+            if len(heap) > self.peak:
+                self.peak = len(heap)
+
+    def unblock(self, cell):
+        """cell açıldı. Mesafesi en küçük komşusundan alınır, azalma dalga halinde yayılır."""
+        blocked = self.blocked
+        blocked.discard(cell)
+        if cell == self.goal_id:
+            self.build()
+            return
+
+        dist = self.dist
+        best = -1
+        for nxt in self.neighbors(cell):
+            d = dist[nxt]
+            if d != UNREACHED and (best == -1 or d + 1 < best):
+                best = d + 1
+        if best == -1:
+            return
+
+        dist[cell] = best
+        queue = deque([cell])
+        self.pushes += 1
+        while queue:
+            current = queue.popleft()
+            self.expanded += 1
+            through = dist[current] + 1
+            for nxt in self.neighbors(current):
+                if nxt in blocked:
+                    continue
+                if dist[nxt] == UNREACHED or dist[nxt] > through:
+                    dist[nxt] = through
+                    queue.append(nxt)
+                    self.pushes += 1
+            if len(queue) > self.peak:
+                self.peak = len(queue)
+
+    def sync(self, dynamic_obstacles):
+        """Alanı verilen engel kümesine getirir; sadece değişen kareler işlenir."""
+        pf = self.pathfinder
+        if pf.map_version != self.map_version:
+            self.reset()
+
+        blocked = pf.blocked_ids(dynamic_obstacles)
+        for cell in list(self.blocked - blocked):
+            self.unblock(cell)
+        for cell in blocked - self.blocked:
+            self.block(cell)
+
+    # --------------------------------------------------------
+    # Sorgular
+    # --------------------------------------------------------
+    def distance(self, node):
+        """node'dan hedefe adım sayısı; ulaşılamıyorsa -1."""
+        if self.map_version != self.pathfinder.map_version:
+            self.reset()
+        return self.dist[self.pathfinder.cell_id(node)]
+
+    def plan(self, start, dynamic_obstacles=None, stats=None):
+        """start'tan hedefe rota ((satır, sütun) listesi, start dahil)."""
+        started = time.perf_counter()
+        self.expanded = self.pushes = self.peak = 0
+        self.sync(dynamic_obstacles)   # ilk çağrıda tam hesaplama da burada (ölçüme dahil)
+        path = self.extract_path(self.pathfinder.cell_id(start))
+
+        if stats is not None:
+            stats.record("Distance Field", started, self.expanded, self.pushes, self.peak, path)
+        return path
+
+    def extract_path(self, start_id):
+        """Mesafesi bir eksik ilk komşuya (yukarı, aşağı, sol, sağ sırasıyla) inilir."""
+        dist = self.dist
+        d = dist[start_id]
+        if d == UNREACHED:
+            return []
+
+        cols = self.cols
+        path = [divmod(start_id, cols)]
+        current = start_id
+        while d > 0:
+            d -= 1
+            for nxt in self.neighbors(current):
+                if dist[nxt] == d:
+                    current = nxt
+                    break
+            path.append(divmod(current, cols))
+        return path
@@ -0,0 +1,334 @@
+# Dosya: src/otonom_arac/algorithms/hierarchical.py
+#
+# Hiyerarşik yol bulma (HPA*).
+# Izgara cluster_size x cluster_size boyutunda kümelere bölünür. Komşu iki
+# kümenin sınırında, iki tarafı da yürünebilir olan her kesintisiz aralık
+# için bir geçit (iki kare, aralarındaki maliyet 1) açılır.
+# Aynı kümedeki geçitler arası mesafeler, kümenin içinde kalan BFS ile
+# bulunur (geçit ilk kez açıldığında, sonra saklanır). Sorgu önce bu soyut
+# graf üzerinde A* ile çözülür, sonra her küme içindeki parça yerel olarak
+# kare kare açılır.
+# Dinamik engel bir kümeye düşünce o kümenin sınırları engelli kareler
+# kapalı sayılarak yeniden taranır (engel bir geçide düşebilir ya da açık bir
+# aralığı ikiye bölebilir); geçitleri değişen kümelerin saklanan mesafeleri ve
+# yerel rotaları silinir.
+#
+# Kaynak: Botea, Müller & Schaeffer, "Near Optimal Hierarchical Path-Finding" (2004).
+
+import heapq
+import time
+from collections import deque
+
+INF = float("inf")
+
+
+class HierarchicalPlanner:
+    """
+    pathfinder: derlenmiş haritayı (walkable / offsets / adjacency) sağlayan PathFinder.
+    Bulunan rotalar en kısa rotaya yakındır ama her zaman en kısa değildir.
+    """
+
+    def __init__(self, pathfinder, cluster_size=16):
+        self.pathfinder = pathfinder
+        self.cluster_size = cluster_size
+        self.build()
+
+    # --------------------------------------------------------
+    # Kümeler ve geçitler
+    # --------------------------------------------------------
+    def build(self):
+        pf = self.pathfinder
+        self.map_version = pf.map_version
+        self.rows, self.cols = pf.rows, pf.cols
+        size = self.cluster_size
+        self.cluster_rows = (self.rows + size - 1) // size
+        self.cluster_cols = (self.cols + size - 1) // size
+
+        count = self.cluster_rows * self.cluster_cols
+        self.cluster_nodes = [[] for _ in range(count)]  # küme -> geçit kareleri
+        self.inter_edges = {}    # geçit karesi -> karşı kümedeki geçit kareleri
+        self.intra_edges = {}    # küme -> {geçit: [(geçit, maliyet)]} (geçit açıldıkça)
+        self.local_paths = {}    # küme -> {(a, b): kare id listesi}
+        self.blocked = set()
+
+        self.borders = []            # sınır -> [(a, b), ...] karşılıklı kare çiftleri
+        self.border_entrances = []   # sınır -> o sınırdaki geçit çiftleri
+        self.cluster_borders = [[] for _ in range(count)]  # küme -> sınır indeksleri
+
+        cols = self.cols
+
+        # Dikey sınırlar (sol küme | sağ küme)
+        for c in range(size, cols, size):
+            for r0 in range(0, self.rows, size):
+                self.add_border(
+                    [(r * cols + c - 1, r * cols + c) for r in range(r0, min(r0 + size, self.rows))]
+                )
+        # Yatay sınırlar (üst küme / alt küme)
+        for r in range(size, self.rows, size):
+            for c0 in range(0, cols, size):
+                self.add_border(
+                    [((r - 1) * cols + c, r * cols + c) for c in range(c0, min(c0 + size, cols))]
+                )
+
+    def add_border(self, pairs):
+        border = len(self.borders)
+        self.borders.append(pairs)
+        self.border_entrances.append([])
+        a, b = pairs[0]
+        self.cluster_borders[self.cluster_of(a)].append(border)
+        self.cluster_borders[self.cluster_of(b)].append(border)
+        self.scan_border(border)
+
+    def border_clusters(self, border):
+        a, b = self.borders[border][0]
+        return self.cluster_of(a), self.cluster_of(b)
+
+    def scan_border(self, border):
+        """
+        Sınır boyunca iki tarafı da açık (yürünebilir ve engelsiz) her aralığın
+        ortasına bir geçit koyar.
+        """
+        walkable = self.pathfinder.walkable
+        blocked = self.blocked
+        entrances = self.border_entrances[border]
+        run = []
+        for a, b in self.borders[border] + [(None, None)]:
+            if (a is not None and walkable[a] and walkable[b]
+                    and a not in blocked and b not in blocked):
+                run.append((a, b))
+                continue
+            if run:
+                a_mid, b_mid = run[len(run) // 2]
+                self.add_node(a_mid)
+                self.add_node(b_mid)
+                self.inter_edges[a_mid].append(b_mid)
+                self.inter_edges[b_mid].append(a_mid)
+                entrances.append((a_mid, b_mid))
+                run = []
+
+    def clear_border(self, border):
+        """Sınırın geçitlerini kaldırır; başka sınırda geçidi olmayan düğümler silinir."""
+        for a, b in self.border_entrances[border]:
+            self.inter_edges[a].remove(b)
+            self.inter_edges[b].remove(a)
+            for cell in (a, b):
+                if not self.inter_edges[cell]:
+                    del self.inter_edges[cell]
+                    self.cluster_nodes[self.cluster_of(cell)].remove(cell)
+        self.border_entrances[border] = []
+
+    def add_node(self, cell):
+        if cell not in self.inter_edges:
+            self.inter_edges[cell] = []
+            self.cluster_nodes[self.cluster_of(cell)].append(cell)
+
+    def cluster_of(self, cell):
+        r, c = divmod(cell, self.cols)
+        size = self.cluster_size
+        return (r // size) * self.cluster_cols + c // size
+
+    # --------------------------------------------------------
+    # Küme içi arama
+    # --------------------------------------------------------
+    def local_bfs(self, source, cluster, targets=None):
+        """
+        Kümeden çıkmadan source'tan BFS. (mesafe, önceki) sözlükleri döner.
+        targets verilirse hepsi bulununca durur.
+        """
+        pf = self.pathfinder
+        offsets, adjacency = pf.offsets, pf.adjacency
+        blocked = self.blocked
+        cols, size = self.cols, self.cluster_size
+        top = (cluster // self.cluster_cols) * size
+        left = (cluster % self.cluster_cols) * size
+        bottom, right = top + size, left + size
+
+        dist = {source: 0}
+        came_from = {source: -1}
+        remaining = len(targets) if targets else -1
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            self.expanded += 1
+            if targets and current in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            through = dist[current] + 1
+            for i in range(offsets[current], offsets[current + 1]):
+                nxt = adjacency[i]
+                if nxt in dist or nxt in blocked:
+                    continue
+                r, c = divmod(nxt, cols)
+                if top <= r < bottom and left <= c < right:
+                    dist[nxt] = through
+                    came_from[nxt] = current
+                    queue.append(nxt)
+        return dist, came_from
+
+    @staticmethod
+    def trace(came_from, cell):
+        cells = []
+        while cell != -1:
+            cells.append(cell)
+            cell = came_from[cell]
+        cells.reverse()
+        return cells
+
+    def node_edges(self, node):
+        """node'dan aynı kümedeki diğer geçitlere mesafeler; ilk istekte hesaplanır."""
+        cluster = self.cluster_of(node)
+        edges = self.intra_edges.setdefault(cluster, {})
+        result = edges.get(node)
+        if result is None:
+            dist, _ = self.local_bfs(node, cluster)
+            result = [
+                (other, dist[other]) for other in self.cluster_nodes[cluster]
+                if other != node and other in dist
+            ]
+            edges[node] = result
+        return result
+
+    def local_path(self, a, b, cluster):
+        """Aynı kümedeki iki geçit arası kare rotası (a ve b dahil), saklanır."""
+        paths = self.local_paths.setdefault(cluster, {})
+        cells = paths.get((a, b))
+        if cells is None:
+            _, came_from = self.local_bfs(a, cluster, {b})
+            cells = self.trace(came_from, b)
+            paths[(a, b)] = cells
+        return cells
+
+    # --------------------------------------------------------
+    # Engel senkronu: sadece değişen kümeler ve komşuları güncellenir
+    # --------------------------------------------------------
+    def sync(self, blocked):
+        changed = (blocked - self.blocked) | (self.blocked - blocked)
+        if not changed:
+            return
+        self.blocked = set(blocked)
+
+        clusters = {self.cluster_of(cell) for cell in changed}
+        borders = {border for cluster in clusters for border in self.cluster_borders[cluster]}
+        for border in sorted(borders):
+            self.clear_border(border)
+            self.scan_border(border)
+            # Sınırın iki yanındaki kümelerin geçit listesi değişmiş olabilir
+            clusters.update(self.border_clusters(border))
+
+        for cluster in clusters:
+            self.intra_edges.pop(cluster, None)
+            self.local_paths.pop(cluster, None)
+
+    # --------------------------------------------------------
+    # Sorgu
+    # --------------------------------------------------------
+    def find_path(self, start_id, goal_id, blocked=frozenset(), stats=None):
+        """start_id'den goal_id'ye (satır, sütun) listesi; bulunamazsa []."""
+        started = time.perf_counter()
+        self.expanded, self.pushes, self.peak = 0, 0, 0
+        self.sync(blocked)
+
+        cells = []
+        if start_id == goal_id:
+            cells = [start_id]
+        elif goal_id not in self.blocked:
+            cells = self.search(start_id, goal_id)
+
+        cols = self.cols
+        path = [divmod(c, cols) for c in cells]
+        if stats is not None:
+            stats.record("HPA*", started, self.expanded, self.pushes, self.peak, path)
+        return path
+
+    def search(self, start_id, goal_id):
+        blocked = self.blocked
+        cols = self.cols
+        goal_r, goal_c = divmod(goal_id, cols)
+        start_cluster = self.cluster_of(start_id)
+        goal_cluster = self.cluster_of(goal_id)
+
+        # Başlangıç ve hedefi kendi kümelerinin geçitlerine bağla
+        start_dist, start_from = self.local_bfs(start_id, start_cluster)
+        goal_dist, goal_from = self.local_bfs(goal_id, goal_cluster)
+
+        best_cost, best_end = INF, None
+        if start_cluster == goal_cluster and goal_id in start_dist:
+            best_cost, best_end = start_dist[goal_id], "direct"
+
+        targets = {
+            n: goal_dist[n] for n in self.cluster_nodes[goal_cluster]
+            if n in goal_dist and n not in blocked
+        }
+
+        open_set = []
+        g_cost = {}
+        came_from = {}   # geçit -> önceki geçit (başlangıç bağlantısı için -1)
+        for n in self.cluster_nodes[start_cluster]:
+            if n in start_dist and n not in blocked:
+                g_cost[n] = start_dist[n]
+                came_from[n] = -1
+                r, c = divmod(n, cols)
+                heapq.heappush(
+                    open_set, (start_dist[n] + abs(goal_r - r) + abs(goal_c - c), -start_dist[n], n)
+                )
+        self.pushes += len(open_set)
+
+        # Eşit f'lerde derindeki (g'si büyük) geçit önce açılır; ızgarada çok
+        # sayıda eşit uzunlukta rota olduğundan bu, açılan küme sayısını azaltır.
+        closed = set()
+        while open_set:
+            f, _, node = heapq.heappop(open_set)
+            if f >= best_cost:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expanded += 1
+
+            g = g_cost[node]
+            if node in targets and g + targets[node] < best_cost:
+                best_cost, best_end = g + targets[node], node
+
+            neighbors = [(nxt, 1) for nxt in self.inter_edges[node]]
+            neighbors += self.node_edges(node)
+            for nxt, cost in neighbors:
+                if nxt in blocked or nxt in closed:
+                    continue
+                new_cost = g + cost
+                if new_cost < g_cost.get(nxt, INF):
+                    g_cost[nxt] = new_cost
+                    came_from[nxt] = node
+                    r, c = divmod(nxt, cols)
+                    heapq.heappush(
+                        open_set, (new_cost + abs(goal_r - r) + abs(goal_c - c), -new_cost, nxt)
+                    )
+                    self.pushes += 1
+            if len(open_set) > self.peak:
+                self.peak = len(open_set)
+
+        if best_end is None:
+            return []
+        if best_end == "direct":
+            return self.trace(start_from, goal_id)
+
+        # Soyut rotayı kare kare aç
+        chain = []
+        node = best_end
+        while node != -1:
+            chain.append(node)
+            node = came_from[node]
+        chain.reverse()
+
+        cells = self.trace(start_from, chain[0])
+        for a, b in zip(chain, chain[1:]):
+            cluster = self.cluster_of(a)
+            if b in self.inter_edges[a] and self.cluster_of(b) != cluster:
+                cells.append(b)
+            else:
+                cells.extend(self.local_path(a, b, cluster)[1:])
+        # Hedef bağlantısı: goal_from hedeften geçide doğru, ters çevrilir
+        tail = self.trace(goal_from, chain[-1])
+        tail.reverse()
+        cells.extend(tail[1:])
+        return cells
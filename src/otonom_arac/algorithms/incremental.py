@@ -0,0 +1,219 @@
+# Dosya: src/otonom_arac/algorithms/incremental.py
+#
+# D* Lite: artımlı (incremental) yeniden planlama.
+# Arama hedeften başlangıca doğru yapılır ve g/rhs tabloları çağrılar arasında
+# saklanır. Dinamik engel eklenip kaldırıldığında sadece o karelerin etrafı
+# güncellenir; araç ilerledikçe başlangıç karesi değişebilir (km düzeltmesi).
+#
+# Kaynak: Koenig & Likhachev, "D* Lite" (AAAI 2002).
+
+import heapq
+import time
+
+INF = float("inf")
+
+
+class DStarLite:
+    """
+    Tek bir hedefe yönelik artımlı planlayıcı.
+    pathfinder: derlenmiş haritayı (offsets / adjacency / cols) sağlayan PathFinder.
+    """
+
+    def __init__(self, pathfinder, goal):
+        self.pathfinder = pathfinder
+        self.goal = goal
+        self.reset()
+
+    # --------------------------------------------------------
+    def reset(self):
+        """Tüm arama durumunu siler (harita değiştiğinde de çağrılır)."""
+        pf = self.pathfinder
+        self.map_version = pf.map_version
+        self.cols = pf.cols
+        self.goal_id = pf.cell_id(self.goal)
+
+        self.g = {}
+        self.rhs = {self.goal_id: 0}
+        self.open_heap = []
+        self.open_keys = {}
+        self.km = 0
+        self.blocked = set()
+        self.last_start = None
+
+        self.expanded = 0
+        self.pushes = 0
+        self.peak = 0
+
+        self.push(self.goal_id, (0, 0))
+
+    # --------------------------------------------------------
+    # Yardımcılar
+    # --------------------------------------------------------
+    def heuristic(self, a, b):
+        ar, ac = divmod(a, self.cols)
+        br, bc = divmod(b, self.cols)
+        return abs(ar - br) + abs(ac - bc)
+
+    def neighbors(self, cell):
+        pf = self.pathfinder
+        return pf.adjacency[pf.offsets[cell]:pf.offsets[cell + 1]]
+
+    def calculate_key(self, cell, start_id):
+        m = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (m + self.heuristic(start_id, cell) + self.km, m)
+
+    def push(self, cell, key):
+        self.open_keys[cell] = key
+        heapq.heappush(self.open_heap, (key[0], key[1], cell))
+        self.pushes += 1
+        if len(self.open_keys) > self.peak:
+            self.peak = len(self.open_keys)
+
+    def top_key(self):
+        """Kuyruktaki en küçük geçerli anahtar (eskimiş kayıtlar atılır)."""
+        heap = self.open_heap
+        while heap:
+            k1, k2, cell = heap[0]
+            if self.open_keys.get(cell) == (k1, k2):
+                return (k1, k2)
+            heapq.heappop(heap)
+        return (INF, INF)
+
+    def recompute_rhs(self, cell):
+        """rhs(cell) = min(1 + g(komşu)); engelli kareler hesaba girmez."""
+        if cell == self.goal_id:
+            return
+        best = INF
+        blocked = self.blocked
+        if cell not in blocked:
+            g = self.g
+            for nxt in self.neighbors(cell):
+                if nxt in blocked:
+                    continue
+                cost = g.get(nxt, INF) + 1
+                if cost < best:
+                    best = cost
+        self.rhs[cell] = best
+
+    def update_key(self, cell, start_id):
+        """Tutarsız kareyi kuyruğa koyar/anahtarını yeniler, tutarlıysa çıkarır."""
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self.push(cell, self.calculate_key(cell, start_id))
+        else:
+            self.open_keys.pop(cell, None)
+
+    def update_vertex(self, cell, start_id):
+        self.recompute_rhs(cell)
+        self.update_key(cell, start_id)
+
+    # --------------------------------------------------------
+    # ComputeShortestPath (makaledeki optimize sürüm)
+    # --------------------------------------------------------
+    def compute_shortest_path(self, start_id):
+        g, rhs = self.g, self.rhs
+        blocked = self.blocked
+        goal_id = self.goal_id
+        while True:
+            top = self.top_key()
+            if top[0] == INF:
+                break
+            start_rhs = rhs.get(start_id, INF)
+            if not (top < self.calculate_key(start_id, start_id) or start_rhs != g.get(start_id, INF)):
+                break
+
+            _, _, cell = heapq.heappop(self.open_heap)
+            del self.open_keys[cell]
+            self.expanded += 1
+
+            new_key = self.calculate_key(cell, start_id)
+            g_old = g.get(cell, INF)
+            rhs_cell = rhs.get(cell, INF)
+
+            if top < new_key:
+                self.push(cell, new_key)
+            elif g_old > rhs_cell:
+                # Aşırı tutarlı: g düşer, komşuların rhs'i iyileşebilir
+                g[cell] = rhs_cell
+                if cell in blocked:
+                    continue
+                through = rhs_cell + 1
+                for pred in self.neighbors(cell):
+                    if pred == goal_id or pred in blocked:
+                        continue
+                    if rhs.get(pred, INF) > through:
+                        rhs[pred] = through
+                        self.update_key(pred, start_id)
+            else:
+                # Eksik tutarlı: g sonsuza çıkar, bu kareye dayanan komşular yeniden hesaplanır
+                g[cell] = INF
+                through = g_old + 1
+                for pred in self.neighbors(cell):
+                    if rhs.get(pred, INF) == through:
+                        self.recompute_rhs(pred)
+                    self.update_key(pred, start_id)
+                self.recompute_rhs(cell)
+                self.update_key(cell, start_id)
+
+    # --------------------------------------------------------
+    # Dışarıdan çağrılan plan fonksiyonu
+    # --------------------------------------------------------
+    def plan(self, start, dynamic_obstacles=None, stats=None):
+        """
+        start'tan hedefe rota döndürür ((satır, sütun) listesi, start dahil).
+        Önceki çağrıya göre değişen engeller ve başlangıç karesi artımlı işlenir.
+        """
+        started = time.perf_counter()
+        pf = self.pathfinder
+        if pf.map_version != self.map_version:
+            self.reset()
+
+        self.expanded = self.pushes = self.peak = 0
+        start_id = pf.cell_id(start)
+
+        # Araç ilerlediyse anahtar düzeltmesi (km)
+        if self.last_start is not None and self.last_start != start_id:
+            self.km += self.heuristic(self.last_start, start_id)
+        self.last_start = start_id
+
+        # Engel farkını bul ve etkilenen kareleri güncelle
+        blocked = pf.blocked_ids(dynamic_obstacles)
+        changed = (blocked - self.blocked) | (self.blocked - blocked)
+        if changed:
+            self.blocked = set(blocked)
+            for cell in changed:
+                self.update_vertex(cell, start_id)
+                for nxt in self.neighbors(cell):
+                    self.update_vertex(nxt, start_id)
+
+        self.compute_shortest_path(start_id)
+        path = self.extract_path(start_id)
+
+        if stats is not None:
+            stats.record("D* Lite", started, self.expanded, self.pushes, self.peak, path)
+        return path
+
+    def extract_path(self, start_id):
+        g = self.g
+        if g.get(start_id, INF) == INF:
+            return []
+
+        blocked = self.blocked
+        cols = self.cols
+        path = [divmod(start_id, cols)]
+        current = start_id
+        # Her adımda g değeri 1 azalmak zorunda; döngüye karşı üst sınır
+        for _ in range(len(g) + 1):
+            if current == self.goal_id:
+                return path
+            best, best_cost = -1, INF
+            for nxt in self.neighbors(current):
+                if nxt in blocked:
+                    continue
+                cost = g.get(nxt, INF) + 1
+                if cost < best_cost:
+                    best, best_cost = nxt, cost
+            if best == -1:
+                return []
+            current = best
+            path.append(divmod(current, cols))
+        return []
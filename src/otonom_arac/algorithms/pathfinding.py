@@ -0,0 +1,731 @@
+# Dosya: src/otonom_arac/algorithms/pathfinding.py
+import heapq
+import time
+from array import array
+from collections import deque
+
+import numpy as np
+
+from otonom_arac.algorithms.distance_field import DistanceField
+from otonom_arac.algorithms.hierarchical import HierarchicalPlanner
+from otonom_arac.algorithms.incremental import DStarLite
+from otonom_arac.algorithms.road_graph import RoadGraph
+from otonom_arac.algorithms.route_cache import RouteCache
+from otonom_arac.map.occupancy import OccupancyGrid
+
+
+# Aracın girebildiği kare kodları: yol, başlangıç, hedef, kavşak, ışık, yaya geçidi
+WALKABLE_TILES = (0, 3, 4, 5, 6, 7)
+
+# Komşu sırası: yukarı, aşağı, sol, sağ (arama sonuçları bu sıraya bağlı)
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Kare kodu -> yürünebilir mi (bytes.translate ile satır satır dönüştürmek için)
+_WALKABLE_LOOKUP = bytes(1 if v in WALKABLE_TILES else 0 for v in range(256))
+
+# Komşuluk tablosu bu kadar karelik satır dilimleriyle derlenir (geçici bellek sınırı)
+COMPILE_CHUNK_CELLS = 1 << 20
+
+# Simülasyonun kullandığı algoritma adı -> PathFinder metodu
+ALGORITHMS = {
+    "BFS": "bfs",
+    "DFS": "dfs",
+    "A*": "a_star",
+    "JPS": "jump_point_search",
+    "Bidirectional BFS": "bidirectional_bfs",
+    "Bidirectional A*": "bidirectional_a_star",
+    "D* Lite": "d_star_lite",
+    "Distance Field": "distance_field",
+    "Road Graph": "road_graph",
+    "HPA*": "hpa_star",
+}
+
+# Çağrılar arasında arama durumu saklayan algoritmalar
+INCREMENTAL_ALGORITHMS = ("D* Lite", "Distance Field")
+
+# En kısa rotayı garanti etmeyen algoritmalar: engel değişince önbellekteki
+# rotaları "hâlâ en kısa" kuralıyla korunamaz, her değişiklikte silinir
+APPROXIMATE_ALGORITHMS = ("DFS", "HPA*")
+
+
+def compile_adjacency(walkable, rows, cols):
+    """
+    Yürünebilirlik dizisinden CSR komşuluk tablosu: i. karenin komşuları
+    adjacency[offsets[i]:offsets[i + 1]], sıra yukarı, aşağı, sol, sağ.
+    NumPy ile satır dilimleri halinde vektörel kurulur (5000x5000 haritada
+    kare başına Python döngüsü saniyeler sürer); sonuç array("i") olarak
+    döner, aramalar eleman eleman okurken NumPy skaler maliyeti olmaz.
+    """
+    grid = np.zeros((rows + 2, cols + 2), dtype=bool)   # kenarları boş çerçeve
+    grid[1:-1, 1:-1] = np.frombuffer(walkable, dtype=np.uint8).reshape(rows, cols)
+
+    counts = np.zeros(rows * cols + 1, dtype=np.intc)
+    parts = []
+    step = max(1, COMPILE_CHUNK_CELLS // cols)
+    for r0 in range(0, rows, step):
+        r1 = min(rows, r0 + step)
+        here = grid[r0 + 1:r1 + 1, 1:-1]
+        moves = (
+            (here & grid[r0:r1, 1:-1], -cols),          # yukarı
+            (here & grid[r0 + 2:r1 + 2, 1:-1], cols),   # aşağı
+            (here & grid[r0 + 1:r1 + 1, :-2], -1),      # sol
+            (here & grid[r0 + 1:r1 + 1, 2:], 1),        # sağ
+        )
+        ids = np.arange(r0 * cols, r1 * cols, dtype=np.intc).reshape(r1 - r0, cols)
+        neighbors = np.stack([np.where(ok, ids + delta, -1) for ok, delta in moves], axis=-1)
+        neighbors = neighbors.ravel()
+        parts.append(neighbors[neighbors >= 0])
+        counts[r0 * cols + 1:r1 * cols + 1] = sum(ok.astype(np.intc) for ok, _ in moves).ravel()
+
+    offsets = array("i")
+    offsets.frombytes(np.cumsum(counts, dtype=np.intc).tobytes())
+    adjacency = array("i")
+    if parts:
+        adjacency.frombytes(np.concatenate(parts).astype(np.intc).tobytes())
+    return offsets, adjacency
+
+
+class SearchStats:
+    """
+    Bir aramanın sayaçları. Arama fonksiyonlarına stats=SearchStats()
+    verilirse, arama bitince bu alanlar doldurulur.
+    """
+
+    def __init__(self):
+        self.algorithm = None
+        self.nodes_expanded = 0    # kuyruktan/yığından/heap'ten çıkarılan düğüm
+        self.pushes = 0            # sınır listesine (frontier) eklenen düğüm
+        self.peak_frontier = 0     # sınır listesinin en büyük boyutu
+        self.elapsed = 0.0         # saniye
+        self.path_length = 0
+        self.found = False
+        self.cached = False        # sonuç rota önbelleğinden geldi
+
+    def as_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "nodes_expanded": self.nodes_expanded,
+            "pushes": self.pushes,
+            "peak_frontier": self.peak_frontier,
+            "elapsed": self.elapsed,
+            "path_length": self.path_length,
+            "found": self.found,
+            "cached": self.cached,
+        }
+
+    def record(self, algorithm, started, expanded, pushes, peak, path):
+        self.algorithm = algorithm
+        self.elapsed = time.perf_counter() - started
+        self.nodes_expanded = expanded
+        self.pushes = pushes
+        self.peak_frontier = peak
+        self.path_length = len(path)
+        self.found = bool(path)
+
+
+class PathFinder:
+    """
+    Harita kurulumda bir kez derlenir:
+    - walkable: satır-öncelikli düz bytearray (hücre id = r * cols + c)
+    - offsets / adjacency: CSR biçiminde komşuluk tablosu; id hücresinin
+      yürünebilir komşuları adjacency[offsets[id]:offsets[id + 1]] aralığında.
+    Aramalar tamsayı hücre id'leri üzerinde çalışır, dışarıya yine
+    (satır, sütun) listesi döner.
+    """
+
+    def __init__(self, game_map, route_cache_size=256, compiled=None):
+
+        self.map = game_map
+        self.map_version = 0
+        self.incremental_planners = {}  # hedef -> DStarLite
+        self.distance_fields = {}       # hedef -> DistanceField
+        self.compressed_graph = None    # RoadGraph (harita değişince yeniden kurulur)
+        self.hierarchical = None        # HierarchicalPlanner (büyük haritalar için)
+        self.route_cache = RouteCache(route_cache_size, APPROXIMATE_ALGORITHMS)  # 0 = kapalı
+        if compiled is None:
+            self.compile_map()
+        else:
+            self.share_compiled(compiled)
+
+    # --------------------------------------------------------
+    # Haritayı düz dizilere derle
+    # --------------------------------------------------------
+    def compile_map(self):
+        """Harita değiştiyse yeniden çağrılmalı; map_version bir artar."""
+        game_map = self.map
+        rows = self.rows = len(game_map)
+        cols = self.cols = len(game_map[0])
+        size = rows * cols
+
+        tiles = getattr(game_map, "tiles", None)
+        if tiles is not None:
+            # TileMap: düz uint8 dizisi tek seferde dönüştürülür
+            walkable = bytearray(tiles.tobytes().translate(_WALKABLE_LOOKUP))
+        else:
+            walkable = bytearray(size)
+            for r, row in enumerate(game_map):
+                walkable[r * cols:(r + 1) * cols] = bytes(row).translate(_WALKABLE_LOOKUP)
+
+        offsets, adjacency = compile_adjacency(walkable, rows, cols)
+
+        self.walkable = walkable
+        self.offsets = offsets
+        self.adjacency = adjacency
+        self.map_version += 1
+        self.route_cache.clear()
+
+    def share_compiled(self, other):
+        """
+        Aynı haritanın başka bir PathFinder'da derlenmiş dizilerini kopyalamadan
+        kullanır (aramalar bu dizileri sadece okur). Arka plan iş parçacıkları
+        büyük haritayı bir daha derlemez; önbellek ve planlayıcılar ayrı kalır.
+        """
+        self.rows, self.cols = other.rows, other.cols
+        self.walkable = other.walkable
+        self.offsets = other.offsets
+        self.adjacency = other.adjacency
+        self.map_version = other.map_version
+
+    # --------------------------------------------------------
+    # (satır, sütun) <-> hücre id
+    # --------------------------------------------------------
+    def cell_id(self, node):
+        return node[0] * self.cols + node[1]
+
+    def cell_of(self, cell):
+        return divmod(cell, self.cols)
+
+    def blocked_ids(self, dynamic_obstacles):
+        """Dinamik engel karelerini id kümesine çevirir."""
+        if not dynamic_obstacles:
+            return frozenset()
+        # OccupancyGrid engel id'lerini zaten artımlı tutuyor
+        if isinstance(dynamic_obstacles, OccupancyGrid) and dynamic_obstacles.cols == self.cols:
+            return dynamic_obstacles.obstacle_ids.keys()
+        cols = self.cols
+        return {r * cols + c for r, c in dynamic_obstacles}
+
+    # --------------------------------------------------------
+    # Yürünebilir kare kontrolü
+    # --------------------------------------------------------
+    def is_walkable(self, r, c):
+        return self.walkable[r * self.cols + c] == 1
+
+    # --------------------------------------------------------
+    # Komşu kareleri bul
+    # --------------------------------------------------------
+    def get_neighbors(self, node, dynamic_obstacles=None):
+        cell = self.cell_id(node)
+        blocked = self.blocked_ids(dynamic_obstacles)
+        adjacency = self.adjacency
+        return [
+            self.cell_of(adjacency[i])
+            for i in range(self.offsets[cell], self.offsets[cell + 1])
+            if adjacency[i] not in blocked
+        ]
+
+    # --------------------------------------------------------
+    # PATH YENİDEN OLUŞTURMA
+    # --------------------------------------------------------
+    def reconstruct_path(self, came_from, current):
+        """came_from: id -> önceki id (başlangıç için -1). (satır, sütun) listesi döner."""
+        cols = self.cols
+        path = []
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = came_from[current]
+        path.reverse()
+        return path
+
+    # --------------------------------------------------------
+    # BFS
+    # --------------------------------------------------------
+    def bfs(self, start, goal, dynamic_obstacles=None, stats=None):
+        started = time.perf_counter()
+        offsets, adjacency = self.offsets, self.adjacency
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+
+        queue = deque([start_id])
+        came_from = {start_id: -1}
+        expanded, pushes, peak = 0, 1, 1
+        path = []
+
+        while queue:
+            current = queue.popleft()
+            expanded += 1
+
+            if current == goal_id:
+                path = self.reconstruct_path(came_from, goal_id)
+                break
+
+            # Dinamik engelleri de hesaba kat
+            for i in range(offsets[current], offsets[current + 1]):
+                next_node = adjacency[i]
+                if next_node not in came_from and next_node not in blocked:
+                    came_from[next_node] = current
+                    queue.append(next_node)
+                    pushes += 1
+
+            if len(queue) > peak:
+                peak = len(queue)
+
+        if stats is not None:
+            stats.record("BFS", started, expanded, pushes, peak, path)
+        return path
+
+    # --------------------------------------------------------
+    # DFS
+    # --------------------------------------------------------
+    def dfs(self, start, goal, dynamic_obstacles=None, stats=None):
+        started = time.perf_counter()
+        offsets, adjacency = self.offsets, self.adjacency
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+
+        stack = [start_id]
+        came_from = {start_id: -1}
+        expanded, pushes, peak = 0, 1, 1
+        path = []
+
+        while stack:
+            current = stack.pop()
+            expanded += 1
+
+            if current == goal_id:
+                path = self.reconstruct_path(came_from, goal_id)
+                break
+
+            # Dinamik engelleri de hesaba kat
+            for i in range(offsets[current], offsets[current + 1]):
+                next_node = adjacency[i]
+                if next_node not in came_from and next_node not in blocked:
+                    came_from[next_node] = current
+                    stack.append(next_node)
+                    pushes += 1
+
+            if len(stack) > peak:
+                peak = len(stack)
+
+        if stats is not None:
+            stats.record("DFS", started, expanded, pushes, peak, path)
+        return path
+
+    # --------------------------------------------------------
+    # HEURISTIC (Manhattan)
+    # --------------------------------------------------------
+    def heuristic(self, a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    # --------------------------------------------------------
+    # A* (Dinamik engel destekli)
+    # --------------------------------------------------------
+    def a_star(self, start, goal, dynamic_obstacles=None, stats=None):
+        started = time.perf_counter()
+        offsets, adjacency, cols = self.offsets, self.adjacency, self.cols
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+        goal_r, goal_c = goal
+
+        # (öncelik, id): id sırası (satır, sütun) sırasıyla aynı olduğundan
+        # eşitlikler eskisi gibi bozulur.
+        open_set = []
+        heapq.heappush(open_set, (0, start_id))
+
+        came_from = {start_id: -1}
+        cost_so_far = {start_id: 0}
+        expanded, pushes, peak = 0, 1, 1
+        path = []
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            expanded += 1
+
+            # Hedef bulundu
+            if current == goal_id:
+                path = self.reconstruct_path(came_from, goal_id)
+                break
+
+            # Komşular
+            new_cost = cost_so_far[current] + 1
+            for i in range(offsets[current], offsets[current + 1]):
+                next_node = adjacency[i]
+                if next_node in blocked:
+                    continue
+
+                old_cost = cost_so_far.get(next_node)
+                if old_cost is None or new_cost < old_cost:
+                    cost_so_far[next_node] = new_cost
+                    r, c = divmod(next_node, cols)
+                    priority = new_cost + abs(goal_r - r) + abs(goal_c - c)
+                    heapq.heappush(open_set, (priority, next_node))
+                    came_from[next_node] = current
+                    pushes += 1
+
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        if stats is not None:
+            stats.record("A*", started, expanded, pushes, peak, path)
+        return path
+
+    # --------------------------------------------------------
+    # JUMP POINT SEARCH (4 komşulu ızgara)
+    # --------------------------------------------------------
+    def jump(self, cell, step, goal_id, blocked):
+        """
+        cell'den step yönünde düz ilerler. Hedefe ya da yana dönülebilen
+        (dik komşusu açık) bir kareye gelince (kare, mesafe) döner; yol
+        kapanırsa (-1, 0). Aradaki kareler sadece düz devam edebildiği için
+        en kısa rota yalnızca bu durak karelerinde döner.
+        """
+        walkable, cols = self.walkable, self.cols
+        size = len(walkable)
+        horizontal = step == 1 or step == -1
+        distance = 0
+        while True:
+            if horizontal:
+                c = cell % cols
+                if (step == 1 and c == cols - 1) or (step == -1 and c == 0):
+                    return -1, 0
+            nxt = cell + step
+            if nxt < 0 or nxt >= size or not walkable[nxt] or nxt in blocked:
+                return -1, 0
+            cell = nxt
+            distance += 1
+
+            if cell == goal_id:
+                return cell, distance
+            if horizontal:
+                up, down = cell - cols, cell + cols
+                if (up >= 0 and walkable[up] and up not in blocked) or \
+                        (down < size and walkable[down] and down not in blocked):
+                    return cell, distance
+            else:
+                c = cell % cols
+                if (c > 0 and walkable[cell - 1] and cell - 1 not in blocked) or \
+                        (c < cols - 1 and walkable[cell + 1] and cell + 1 not in blocked):
+                    return cell, distance
+
+    def jump_point_search(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        A* ile aynı uzunlukta rota; ama düz koridorlar tek adımda atlanır,
+        heap'e sadece durak kareleri girer.
+        """
+        started = time.perf_counter()
+        cols = self.cols
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+        goal_r, goal_c = goal
+
+        # yukarı, aşağı, sol, sağ
+        steps = (-cols, cols, -1, 1)
+
+        open_set = [(0, start_id)]
+        came_from = {start_id: -1}
+        cost_so_far = {start_id: 0}
+        expanded, pushes, peak = 0, 1, 1
+        path = []
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            expanded += 1
+
+            if current == goal_id:
+                path = self.reconstruct_jumps(came_from, goal_id)
+                break
+
+            current_cost = cost_so_far[current]
+            for step in steps:
+                next_node, distance = self.jump(current, step, goal_id, blocked)
+                if next_node == -1:
+                    continue
+
+                new_cost = current_cost + distance
+                old_cost = cost_so_far.get(next_node)
+                if old_cost is None or new_cost < old_cost:
+                    cost_so_far[next_node] = new_cost
+                    r, c = divmod(next_node, cols)
+                    priority = new_cost + abs(goal_r - r) + abs(goal_c - c)
+                    heapq.heappush(open_set, (priority, next_node))
+                    came_from[next_node] = current
+                    pushes += 1
+
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        if stats is not None:
+            stats.record("JPS", started, expanded, pushes, peak, path)
+        return path
+
+    def reconstruct_jumps(self, came_from, current):
+        """Durak kareleri arasındaki düz parçaları kare kare doldurur."""
+        cols = self.cols
+        cells = [current]
+        while came_from[current] != -1:
+            prev = came_from[current]
+            if prev // cols == current // cols:
+                step = 1 if prev > current else -1
+            else:
+                step = cols if prev > current else -cols
+            while current != prev:
+                current += step
+                cells.append(current)
+        cells.reverse()
+        return [divmod(cell, cols) for cell in cells]
+
+    # --------------------------------------------------------
+    # ÇİFT YÖNLÜ ARAMALAR
+    # --------------------------------------------------------
+    def join_paths(self, forward_from, backward_from, meet_a, meet_b):
+        """start..meet_a (ileri ağaç) + meet_b..goal (geri ağaç) birleşimi."""
+        cols = self.cols
+        head = self.reconstruct_path(forward_from, meet_a)
+        tail = []
+        current = meet_b
+        while current != -1:
+            tail.append(divmod(current, cols))
+            current = backward_from[current]
+        if head and tail and head[-1] == tail[0]:
+            tail = tail[1:]
+        return head + tail
+
+    def bidirectional_bfs(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        Başlangıçtan ve hedeften aynı anda BFS. Her turda küçük olan sınır bir
+        seviye genişletilir; seviye içinde bulunan en iyi buluşma alınır, bu
+        yüzden rota tek yönlü BFS kadar kısadır.
+        """
+        started = time.perf_counter()
+        offsets, adjacency = self.offsets, self.adjacency
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+
+        expanded, pushes, peak = 0, 0, 0
+        path = []
+
+        if start_id == goal_id:
+            path = [start]
+        elif goal_id not in blocked:
+            forward_from, backward_from = {start_id: -1}, {goal_id: -1}
+            forward_dist, backward_dist = {start_id: 0}, {goal_id: 0}
+            forward, backward = deque([start_id]), deque([goal_id])
+            pushes = 2
+            best, meet = None, None
+
+            while forward and backward and best is None:
+                # Küçük sınırı genişlet
+                if len(forward) <= len(backward):
+                    frontier, came_from, dist = forward, forward_from, forward_dist
+                    other_dist, is_forward = backward_dist, True
+                else:
+                    frontier, came_from, dist = backward, backward_from, backward_dist
+                    other_dist, is_forward = forward_dist, False
+
+                for _ in range(len(frontier)):
+                    current = frontier.popleft()
+                    expanded += 1
+                    through = dist[current] + 1
+                    for i in range(offsets[current], offsets[current + 1]):
+                        next_node = adjacency[i]
+                        if next_node in blocked:
+                            continue
+                        if next_node in other_dist:
+                            total = through + other_dist[next_node]
+                            if best is None or total < best:
+                                best = total
+                                meet = (current, next_node) if is_forward else (next_node, current)
+                        if next_node not in came_from:
+                            came_from[next_node] = current
+                            dist[next_node] = through
+                            frontier.append(next_node)
+                            pushes += 1
+
+                if len(forward) + len(backward) > peak:
+                    peak = len(forward) + len(backward)
+
+            if meet is not None:
+                path = self.join_paths(forward_from, backward_from, meet[0], meet[1])
+
+        if stats is not None:
+            stats.record("Bidirectional BFS", started, expanded, pushes, peak, path)
+        return path
+
+    def bidirectional_a_star(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        İleri arama hedefe, geri arama başlangıca Manhattan sezgiseliyle ilerler.
+        mu: şimdiye kadar bulunan en kısa buluşma. İki heap'ten birinin en
+        küçük f'i mu'ya ulaşınca daha kısa bir rota kalmamıştır.
+        """
+        started = time.perf_counter()
+        offsets, adjacency, cols = self.offsets, self.adjacency, self.cols
+        blocked = self.blocked_ids(dynamic_obstacles)
+        start_id, goal_id = self.cell_id(start), self.cell_id(goal)
+        start_r, start_c = start
+        goal_r, goal_c = goal
+
+        expanded, pushes, peak = 0, 0, 0
+        path = []
+
+        if start_id == goal_id:
+            path = [start]
+        elif goal_id not in blocked:
+            forward_from, backward_from = {start_id: -1}, {goal_id: -1}
+            forward_cost, backward_cost = {start_id: 0}, {goal_id: 0}
+            forward_open = [(abs(goal_r - start_r) + abs(goal_c - start_c), start_id)]
+            backward_open = [(forward_open[0][0], goal_id)]
+            forward_closed, backward_closed = set(), set()
+            pushes = 2
+            mu, meet = float("inf"), None
+
+            while forward_open and backward_open:
+                if forward_open[0][0] >= mu or backward_open[0][0] >= mu:
+                    break
+
+                if len(forward_open) <= len(backward_open):
+                    open_set, closed = forward_open, forward_closed
+                    came_from, cost_so_far = forward_from, forward_cost
+                    other_cost, is_forward = backward_cost, True
+                    target_r, target_c = goal_r, goal_c
+                else:
+                    open_set, closed = backward_open, backward_closed
+                    came_from, cost_so_far = backward_from, backward_cost
+                    other_cost, is_forward = forward_cost, False
+                    target_r, target_c = start_r, start_c
+
+                _, current = heapq.heappop(open_set)
+                if current in closed:
+                    continue
+                closed.add(current)
+                expanded += 1
+
+                new_cost = cost_so_far[current] + 1
+                for i in range(offsets[current], offsets[current + 1]):
+                    next_node = adjacency[i]
+                    if next_node in blocked:
+                        continue
+
+                    old_cost = cost_so_far.get(next_node)
+                    if old_cost is None or new_cost < old_cost:
+                        cost_so_far[next_node] = new_cost
+                        came_from[next_node] = current
+                        r, c = divmod(next_node, cols)
+                        priority = new_cost + abs(target_r - r) + abs(target_c - c)
+                        heapq.heappush(open_set, (priority, next_node))
+                        pushes += 1
+
+                    if next_node in other_cost:
+                        total = cost_so_far[next_node] + other_cost[next_node]
+                        if total < mu:
+                            mu = total
+                            meet = next_node
+
+                if len(forward_open) + len(backward_open) > peak:
+                    peak = len(forward_open) + len(backward_open)
+
+            if meet is not None:
+                path = self.join_paths(forward_from, backward_from, meet, meet)
+
+        if stats is not None:
+            stats.record("Bidirectional A*", started, expanded, pushes, peak, path)
+        return path
+
+    # --------------------------------------------------------
+    # D* Lite (artımlı yeniden planlama)
+    # --------------------------------------------------------
+    def d_star_lite(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        Her hedef için bir DStarLite planlayıcısı saklanır; aynı hedefe yapılan
+        sonraki çağrılarda sadece değişen engeller ve araç konumu işlenir.
+        """
+        planner = self.incremental_planners.get(goal)
+        if planner is None:
+            planner = DStarLite(self, goal)
+            self.incremental_planners[goal] = planner
+        return planner.plan(start, dynamic_obstacles, stats)
+
+    # --------------------------------------------------------
+    # Hedef köklü mesafe alanı (aynı hedefe giden herkes paylaşır)
+    # --------------------------------------------------------
+    def get_distance_field(self, goal):
+        field = self.distance_fields.get(goal)
+        if field is None:
+            field = DistanceField(self, goal)
+            self.distance_fields[goal] = field
+        return field
+
+    def distance_field(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        Hedef başına bir kez hesaplanan mesafe alanından rota çıkarır;
+        engel değiştiyse alan önce yerel olarak düzeltilir.
+        """
+        return self.get_distance_field(goal).plan(start, dynamic_obstacles, stats)
+
+    # --------------------------------------------------------
+    # Sıkıştırılmış yol ağı üzerinde arama
+    # --------------------------------------------------------
+    def get_road_graph(self):
+        graph = self.compressed_graph
+        if graph is None or graph.map_version != self.map_version:
+            graph = self.compressed_graph = RoadGraph(self)
+        return graph
+
+    def road_graph(self, start, goal, dynamic_obstacles=None, stats=None):
+        """Koridorları kenar sayan graf üzerinde A*; rota kare listesine açılır."""
+        graph = self.get_road_graph()
+        blocked = self.blocked_ids(dynamic_obstacles)
+        return graph.find_path(self.cell_id(start), self.cell_id(goal), blocked, stats)
+
+    # --------------------------------------------------------
+    # Hiyerarşik arama (HPA*)
+    # --------------------------------------------------------
+    def get_hierarchical(self):
+        planner = self.hierarchical
+        if planner is None or planner.map_version != self.map_version:
+            planner = self.hierarchical = HierarchicalPlanner(self)
+        return planner
+
+    def hpa_star(self, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        Kümeler arası soyut graf üzerinde A*, sonra küme içinde yerel açılım.
+        Rota en kısaya yakındır; engel değişince sadece ilgili kümeler yenilenir.
+        """
+        planner = self.get_hierarchical()
+        blocked = self.blocked_ids(dynamic_obstacles)
+        return planner.find_path(self.cell_id(start), self.cell_id(goal), blocked, stats)
+
+    def reset_incremental(self):
+        """Saklanan artımlı arama durumlarını ve mesafe alanlarını siler."""
+        self.incremental_planners = {}
+        self.distance_fields = {}
+
+    # --------------------------------------------------------
+    # Ada göre arama (simülasyon ve benchmark buradan çağırır)
+    # --------------------------------------------------------
+    def search(self, algorithm, start, goal, dynamic_obstacles=None, stats=None):
+        """
+        algorithm: ALGORITHMS sözlüğündeki adlardan biri ("BFS", "DFS", "A*", ...).
+        Sonuç rota önbelleğinden gelebilir; dönen rota paylaşılan bir tuple'dır.
+        """
+        method_name = ALGORITHMS.get(algorithm)
+        if method_name is None:
+            raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+
+        cache = self.route_cache
+        if not cache.enabled:
+            return tuple(getattr(self, method_name)(start, goal, dynamic_obstacles, stats))
+
+        started = time.perf_counter()
+        key = (
+            tuple(start), tuple(goal), algorithm, self.map_version,
+            cache.obstacle_key(dynamic_obstacles, self.cols),
+        )
+        path = cache.get(key)
+        if path is not None:
+            if stats is not None:
+                stats.record(algorithm, started, 0, 0, 0, path)
+                stats.cached = True
+            return path
+
+        path = getattr(self, method_name)(start, goal, dynamic_obstacles, stats)
+        return cache.put(key, path)
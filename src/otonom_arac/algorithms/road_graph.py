@@ -0,0 +1,258 @@
+# Dosya: src/otonom_arac/algorithms/road_graph.py
+#
+# Yol ağı sıkıştırma.
+# Haritadaki yollar çoğunlukla bir kare genişliğinde uzun koridorlardır.
+# Koridorlar, düğümler (kavşaklar, çıkmaz uçlar, özel kareler) arasında
+# ağırlıklı kenarlara indirgenir; arama bu küçük graf üzerinde yapılır ve
+# bulunan rota yeniden kare listesine açılır.
+#
+# Düğüm: yürünebilir komşu sayısı 2 olmayan kare, ya da başlangıç (3),
+# hedef (4), kavşak (5) veya ışık (6) karesi.
+# Kenar: iki düğüm arasındaki koridor; ağırlığı adım sayısıdır, ara kareleri
+# (uçlar hariç) sırayla saklanır.
+
+import heapq
+import time
+
+# Koridorun ortasında olsa bile düğüm sayılan kare kodları
+NODE_TILES = (3, 4, 5, 6)
+
+
+class RoadGraph:
+    """
+    pathfinder: derlenmiş haritayı (walkable / offsets / adjacency) sağlayan PathFinder.
+    Graf harita sürümüne bağlıdır; harita değişince yeniden kurulur.
+    Dinamik engeller graf kurulumunu etkilemez, sorgu sırasında hesaba katılır.
+    """
+
+    def __init__(self, pathfinder):
+        self.pathfinder = pathfinder
+        self.build()
+
+    # --------------------------------------------------------
+    # Graf kurulumu
+    # --------------------------------------------------------
+    def build(self):
+        pf = self.pathfinder
+        self.map_version = pf.map_version
+        self.cols = cols = pf.cols
+        offsets, adjacency = pf.offsets, pf.adjacency
+
+        self.edge_ends = []     # kenar -> (u, v)
+        self.edge_cells = []    # kenar -> u'dan v'ye ara kareler (tuple)
+        self.node_edges = {}    # düğüm -> [(komşu düğüm, ağırlık, kenar, ileri mi)]
+        self.cell_edge = {}     # ara kare -> (kenar, kenar içindeki sıra)
+
+        nodes = self.node_edges
+        for r, row in enumerate(pf.map):
+            base = r * cols
+            for c, tile in enumerate(row):
+                cell = base + c
+                if not pf.walkable[cell]:
+                    continue
+                if tile in NODE_TILES or offsets[cell + 1] - offsets[cell] != 2:
+                    nodes[cell] = []
+
+        for node in list(nodes):
+            self.trace_from(node)
+
+        # Düğümsüz kapalı döngüler: bir karesini düğüm yapıp tekrar izle
+        for cell in range(pf.rows * cols):
+            if pf.walkable[cell] and cell not in nodes and cell not in self.cell_edge:
+                nodes[cell] = []
+                self.trace_from(cell)
+
+        self.node_count = len(nodes)
+        self.edge_count = len(self.edge_ends)
+
+    def trace_from(self, node):
+        """node'dan çıkan her koridoru bir sonraki düğüme kadar izler."""
+        pf = self.pathfinder
+        offsets, adjacency = pf.offsets, pf.adjacency
+        nodes = self.node_edges
+
+        for i in range(offsets[node], offsets[node + 1]):
+            first = adjacency[i]
+            if first in nodes:
+                # Doğrudan komşu iki düğüm: kenarı bir kez ekle
+                if node < first:
+                    self.add_edge(node, first, ())
+                continue
+            if first in self.cell_edge:
+                continue
+
+            cells = []
+            prev, current = node, first
+            while current not in nodes:
+                cells.append(current)
+                a = adjacency[offsets[current]]
+                b = adjacency[offsets[current] + 1]
+                prev, current = current, (b if a == prev else a)
+            self.add_edge(node, current, tuple(cells))
+
+    def add_edge(self, u, v, cells):
+        edge = len(self.edge_ends)
+        self.edge_ends.append((u, v))
+        self.edge_cells.append(cells)
+        cost = len(cells) + 1
+        self.node_edges[u].append((v, cost, edge, True))
+        if u != v:
+            self.node_edges[v].append((u, cost, edge, False))
+        for index, cell in enumerate(cells):
+            self.cell_edge[cell] = (edge, index)
+
+    # --------------------------------------------------------
+    # Başlangıç/hedef karesini grafa bağlama
+    # --------------------------------------------------------
+    def attach(self, cell, blocked):
+        """
+        cell düğümse [(cell, 0, ())]; koridor içindeyse kenarın iki ucuna
+        (uç, maliyet, cell'den uca giden ara kareler) bağlantıları.
+        Arada engel olan taraf listeye girmez.
+        """
+        if cell in self.node_edges:
+            return [(cell, 0, ())]
+
+        edge, index = self.cell_edge[cell]
+        u, v = self.edge_ends[edge]
+        cells = self.edge_cells[edge]
+        links = []
+
+        toward_u = cells[index - 1::-1] if index > 0 else ()
+        if not any(c in blocked for c in toward_u):
+            links.append((u, index + 1, toward_u))
+
+        toward_v = cells[index + 1:]
+        if not any(c in blocked for c in toward_v):
+            links.append((v, len(cells) - index, toward_v))
+        return links
+
+    def direct_segment(self, start_id, goal_id, blocked):
+        """İkisi de aynı koridordaysa aradaki kareler (start, goal hariç), yoksa None."""
+        s = self.cell_edge.get(start_id)
+        g = self.cell_edge.get(goal_id)
+        if s is None or g is None or s[0] != g[0]:
+            return None
+        cells = self.edge_cells[s[0]]
+        i, j = s[1], g[1]
+        between = cells[i + 1:j] if i < j else cells[j + 1:i][::-1]
+        if any(c in blocked for c in between):
+            return None
+        return between
+
+    # --------------------------------------------------------
+    # Arama (graf üzerinde A*)
+    # --------------------------------------------------------
+    def find_path(self, start_id, goal_id, blocked=frozenset(), stats=None):
+        """
+        start_id'den goal_id'ye (satır, sütun) listesi; bulunamazsa [].
+        Kenar ağırlığı adım sayısı olduğu için Manhattan sezgiseli kabul
+        edilebilirdir; sonuç ızgara üzerindeki en kısa rota kadar uzundur.
+        """
+        started = time.perf_counter()
+        cols = self.cols
+        expanded, pushes, peak = 0, 0, 0
+        path = []
+
+        if start_id == goal_id:
+            path = [divmod(start_id, cols)]
+        elif goal_id not in blocked:
+            path = self.search(start_id, goal_id, blocked)
+            expanded, pushes, peak = self.last_counts
+
+        if stats is not None:
+            stats.record("Road Graph", started, expanded, pushes, peak, path)
+        return path
+
+    def search(self, start_id, goal_id, blocked):
+        cols = self.cols
+        goal_r, goal_c = divmod(goal_id, cols)
+        node_edges = self.node_edges
+        edge_cells = self.edge_cells
+
+        # Ara karesinde engel olan kenarlar
+        cell_edge = self.cell_edge
+        blocked_edges = {cell_edge[c][0] for c in blocked if c in cell_edge}
+
+        # Hedefe bağlanan düğümler: düğüm -> (kalan maliyet, ara kareler)
+        targets = {}
+        for node, cost, cells in self.attach(goal_id, blocked):
+            if node not in blocked:
+                targets[node] = (cost, cells[::-1])
+
+        best_cost, best_end = float("inf"), None
+        direct = self.direct_segment(start_id, goal_id, blocked)
+        if direct is not None:
+            best_cost, best_end = len(direct) + 1, "direct"
+
+        open_set = []
+        g_cost = {}
+        came_from = {}   # düğüm -> (önceki düğüm veya -1, ara kareler)
+        for node, cost, cells in self.attach(start_id, blocked):
+            if node in blocked and node != start_id:
+                continue
+            if cost < g_cost.get(node, float("inf")):
+                g_cost[node] = cost
+                came_from[node] = (-1, cells)
+                r, c = divmod(node, cols)
+                heapq.heappush(open_set, (cost + abs(goal_r - r) + abs(goal_c - c), node))
+
+        expanded, pushes, peak = 0, len(open_set), len(open_set)
+        closed = set()
+
+        while open_set:
+            f, node = heapq.heappop(open_set)
+            if f >= best_cost:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+
+            g = g_cost[node]
+            target = targets.get(node)
+            if target is not None and g + target[0] < best_cost:
+                best_cost, best_end = g + target[0], node
+
+            for nxt, cost, edge, forward in node_edges[node]:
+                if nxt in blocked or nxt in closed or edge in blocked_edges:
+                    continue
+                new_cost = g + cost
+                if new_cost < g_cost.get(nxt, float("inf")):
+                    g_cost[nxt] = new_cost
+                    cells = edge_cells[edge]
+                    came_from[nxt] = (node, cells if forward else cells[::-1])
+                    r, c = divmod(nxt, cols)
+                    heapq.heappush(open_set, (new_cost + abs(goal_r - r) + abs(goal_c - c), nxt))
+                    pushes += 1
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        self.last_counts = (expanded, pushes, peak)
+        if best_end is None:
+            return []
+        if best_end == "direct":
+            cells = (start_id,) + direct + (goal_id,)
+            return [divmod(c, cols) for c in cells]
+        return self.expand(start_id, goal_id, best_end, came_from, targets[best_end][1])
+
+    def expand(self, start_id, goal_id, end_node, came_from, tail):
+        """Düğüm zincirini ara kareleriyle birlikte kare listesine açar."""
+        chain = []
+        node = end_node
+        while node != -1:
+            prev, cells = came_from[node]
+            chain.append((node, cells))
+            node = prev
+
+        cells_out = [start_id]
+        for node, cells in reversed(chain):
+            cells_out.extend(cells)
+            if node != start_id:
+                cells_out.append(node)
+        cells_out.extend(tail)
+        if cells_out[-1] != goal_id:
+            cells_out.append(goal_id)
+
+        cols = self.cols
+        return [divmod(c, cols) for c in cells_out]
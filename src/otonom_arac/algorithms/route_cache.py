@@ -0,0 +1,180 @@
+# Dosya: src/otonom_arac/algorithms/route_cache.py
+#
+# Rota sorgu önbelleği (LRU).
+# Anahtar: (başlangıç, hedef, algoritma, harita sürümü, engel anahtarı).
+# Rotalar değiştirilemez tuple olarak saklanır ve aynı nesne paylaşılır.
+#
+# Engel anahtarı:
+# - engel yoksa ()
+# - OccupancyGrid ise (grid.token, grid.version); grid değişince önbellek
+#   dinleyici olarak haber alır ve sadece etkilenen kayıtları siler,
+#   geçerli kalanları yeni sürüme taşır
+# - başka bir koleksiyonsa engel id'lerinin frozenset'i (içerik anahtarı)
+#
+# Kayıtlar engel anahtarına göre kovalara da ayrılır; bir engel değişikliği
+# sadece o anahtarın kovasını dolaşır. Izgaralar zayıf referansla tutulur:
+# önbellek ızgarayı canlı tutmaz, ızgara silinince kayıtları ve kovası atılır.
+# detach() (Simulation.reset ve clear() çağırır) dinleyiciyi de söker.
+#
+# Korunma kuralı rotanın en kısa olduğunu varsayar. approximate içindeki
+# algoritmaların (DFS, HPA*) sonucu arama geçmişine bağlı olduğundan, onların
+# engelli kayıtları her engel değişikliğinde silinir.
+
+import weakref
+from collections import OrderedDict
+
+from otonom_arac.map.occupancy import OccupancyGrid
+
+
+class RouteCache:
+    def __init__(self, max_size=256, approximate=()):
+        self.max_size = max_size
+        self.approximate = frozenset(approximate)
+        self.entries = OrderedDict()   # anahtar -> rota tuple'ı
+        self.buckets = {}              # engel anahtarı -> o anahtarlı kayıtlar
+        self.grids = {}                # grid.token -> (zayıf referans, dinleyici)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0       # boyut sınırı yüzünden atılan
+        self.invalidations = 0   # engel değişikliği yüzünden atılan
+
+    # ------------------------------------------------------
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def clear(self):
+        for token in list(self.grids):
+            self.forget(token)
+        self.entries.clear()
+        self.buckets.clear()
+
+    def as_dict(self):
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    # ------------------------------------------------------
+    # Anahtar
+    # ------------------------------------------------------
+    def obstacle_key(self, dynamic_obstacles, cols):
+        if not dynamic_obstacles:
+            return ()
+        if isinstance(dynamic_obstacles, OccupancyGrid):
+            token = dynamic_obstacles.token
+            if token not in self.grids:
+                self.attach(dynamic_obstacles)
+            return (token, dynamic_obstacles.version)
+        return frozenset(r * cols + c for r, c in dynamic_obstacles)
+
+    # ------------------------------------------------------
+    # Izgara dinleyicileri
+    # ------------------------------------------------------
+    def attach(self, grid):
+        token = grid.token
+        # Dinleyici ızgarayı değil jetonu tutar; ızgara silinince
+        # zayıf referansın geri çağrısı kayıtlarını atar
+        listener = lambda cell, added: self.obstacle_changed(token, cell, added)
+        ref = weakref.ref(grid, lambda _, token=token: self.forget(token))
+        self.grids[token] = (ref, listener)
+        grid.add_listener(listener)
+
+    def detach(self, grid):
+        """Izgaranın dinleyicisini söker ve ona bağlı kayıtları atar."""
+        self.forget(grid.token)
+
+    def forget(self, token):
+        ref, listener = self.grids.pop(token, (None, None))
+        grid = ref() if ref is not None else None
+        if grid is not None:
+            grid.remove_listener(listener)
+        for obstacle_key in [k for k in self.buckets if type(k) is tuple and k and k[0] == token]:
+            for key in self.buckets.pop(obstacle_key):
+                del self.entries[key]
+
+    # ------------------------------------------------------
+    # Okuma / yazma
+    # ------------------------------------------------------
+    def get(self, key):
+        path = self.entries.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return path
+
+    def put(self, key, path):
+        path = tuple(path)
+        self.store(key, path)
+        self.trim()
+        return path
+
+    def store(self, key, path):
+        self.entries[key] = path
+        self.entries.move_to_end(key)
+        self.buckets.setdefault(key[4], {})[key] = None
+
+    def discard(self, key):
+        del self.entries[key]
+        bucket = self.buckets[key[4]]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[key[4]]
+
+    def trim(self):
+        while len(self.entries) > self.max_size:
+            self.discard(next(iter(self.entries)))
+            self.evictions += 1
+
+    # ------------------------------------------------------
+    # Hassas geçersizleştirme
+    # ------------------------------------------------------
+    def still_valid(self, key, path, cell, added):
+        """
+        Engel eklendi: rota o kareden geçmiyorsa aynen geçerlidir (mesafeler
+        ancak artabilir). Rota yoksa yine yoktur.
+        Engel kalktı: o kareden geçen bir yol en az
+        manhattan(başlangıç, kare) + manhattan(kare, hedef) adımdır; bu,
+        mevcut rotadan kısa olamıyorsa rota korunur. Rota yoksa artık
+        bulunabilir, silinir.
+        En kısa rotayı garanti etmeyen algoritmaların rotası hiç korunmaz.
+        """
+        if key[2] in self.approximate:
+            return False
+        if added:
+            return cell not in path
+        if not path:
+            return False
+        (sr, sc), (gr, gc), r, c = key[0], key[1], cell[0], cell[1]
+        through = abs(sr - r) + abs(sc - c) + abs(r - gr) + abs(c - gc)
+        return through >= len(path) - 1
+
+    def obstacle_changed(self, token, cell, added):
+        """OccupancyGrid dinleyicisi: grid.version zaten artmış olarak çağrılır."""
+        grid = self.grids[token][0]()
+        size_before = len(grid) - 1 if added else len(grid) + 1
+        old_key = () if size_before == 0 else (token, grid.version - 1)
+        new_key = () if len(grid) == 0 else (token, grid.version)
+
+        for key in list(self.buckets.get(old_key, ())):
+            path = self.entries[key]
+            valid = self.still_valid(key, path, cell, added)
+            if old_key == ():
+                # Engelsiz sorgular için geçerli kalır; sadece kopyalanır
+                if valid:
+                    self.store(key[:4] + (new_key,), path)
+                continue
+            self.discard(key)
+            if valid:
+                self.store(key[:4] + (new_key,), path)
+            else:
+                self.invalidations += 1
+
+        self.trim()
@@ -0,0 +1,3 @@
+# Dosya: src/otonom_arac/car/__init__.py
+# Araç kinematiği (Car) ve numpy tabanlı filo (Fleet).
+# pygame gerektirmez; çizim ui/car_renderer.py ve ui/fleet_renderer.py içindedir.
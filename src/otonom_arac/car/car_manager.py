@@ -1,7 +1,5 @@
-# Dosya: src/car/car_manager.py
-import pygame
-import os
-from simulation.settings import *
+# Dosya: src/otonom_arac/car/car_manager.py
+from otonom_arac.simulation.settings import TILE_SIZE
 
 
 class Car:
@@ -10,19 +8,7 @@ class Car:
         self.row = start_row
         self.col = start_col
 
-        # Araç görselini yükle
-        asset_path = os.path.join("assets", "car.png")
-        try:
-            self.original_image = pygame.image.load(asset_path)
-        except FileNotFoundError:
-            self.original_image = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            self.original_image.fill((255, 0, 0))
-
-        # Boyutlandır
-        self.original_image = pygame.transform.scale(
-            self.original_image, (TILE_SIZE, TILE_SIZE)
-        )
-        self.image = self.original_image
+        # Yön açısı (görsel döndürme ui/car_renderer.py'de yapılır)
         self.angle = 0
 
         # Piksel konumu
@@ -38,6 +24,7 @@ class Car:
         self.crosswalk_cooldown_max = 30  # ~0.5 sn
         self.crosswalk_cooldown = 0
         self.speed = self.base_speed
+        self.current_speed = 0.0
         self.is_waiting_red = False
         
 
@@ -93,11 +80,19 @@ class Car:
         # Bulunduğum karede kırmızı ışık varsa, bu frame'de hiç hareket etmiyorum.
         self.is_waiting_red = False  # her frame başında reset
 
-        for tl in traffic_lights:
-            if tl.row == current_row and tl.col == current_col and tl.state == "RED":
-                self.is_waiting_red = True
-                self.current_speed = 0.0
-                return False
+        # traffic_lights bir OccupancyGrid ise ışık O(1) bulunur, liste ise taranır.
+        if hasattr(traffic_lights, "light_at"):
+            tl = traffic_lights.light_at(current_row, current_col)
+        else:
+            tl = next(
+                (t for t in traffic_lights if t.row == current_row and t.col == current_col),
+                None,
+            )
+
+        if tl is not None and tl.state == "RED":
+            self.is_waiting_red = True
+            self.current_speed = 0.0
+            return False
 
         # Takip edilecek bir yol yoksa ya da sona geldiysem hareket etmiyorum.
         if not self.path or self.path_index >= len(self.path):
@@ -164,20 +159,5 @@ class Car:
             else:  # Dikey hareket baskın
                 self.angle = 180 if dy > 0 else 0
 
-            self.image = pygame.transform.rotate(
-                self.original_image, self.angle)
-
         return False
 
-
-    # ---------------------------------------------------------
-    def draw(self, screen):
-        """Aracı ekran üzerine çizer."""
-        rect = self.image.get_rect(
-            center=(
-                self.pixel_x + TILE_SIZE // 2,
-                self.pixel_y + TILE_SIZE // 2,
-            )
-        )
-        screen.blit(self.image, rect)  # bu fonksiyon ekrana çizmeyi yapar
- 
\ No newline at end of file
@@ -0,0 +1,267 @@
+# Dosya: src/otonom_arac/car/fleet.py
+#
+# Çok araçlı (filo) simülasyon.
+# Her araç için ayrı bir Car nesnesi yerine tüm araçların durumu NumPy
+# dizilerinde tutulur (konum, hız, rota indeksi, bekleme, yaya geçidi
+# sayacı) ve tek bir vektörel adımda ilerletilir. Kurallar Car.update ile
+# aynıdır: kırmızı ışıkta bekle, sıradaki karede engel varsa dur ve yeniden
+# planlama iste, kavşak/ışıkta yavaşla, yaya geçidinde ve sonrasında yavaş git.
+
+import numpy as np
+from otonom_arac.simulation.settings import TILE_SIZE
+
+
+class Fleet:
+    """
+    Rotalar tek bir düz hücre id dizisinde (path_cells) tutulur;
+    i. aracın rotası path_cells[path_start[i] : path_start[i] + path_len[i]].
+    Hücre id = satır * cols + sütun.
+    """
+
+    def __init__(self, game_map, tile_size=TILE_SIZE, capacity=64):
+        self.rows = len(game_map)
+        self.cols = len(game_map[0])
+        self.tile_size = tile_size
+        tiles = getattr(game_map, "tiles", None)
+        if tiles is not None:
+            # TileMap: kare dizisi kopyalanmadan okunur
+            self.tiles = np.frombuffer(tiles, dtype=np.uint8)
+        else:
+            self.tiles = np.array(game_map, dtype=np.uint8).ravel()
+
+        # Car ile aynı hız ayarları
+        self.base_speed = 4.0
+        self.transition_speed = 2.5
+        self.crosswalk_speed = 1.0
+        self.crosswalk_cooldown_max = 30
+
+        self.count = 0
+        self.allocate(capacity)
+
+        self.path_cells = np.zeros(1024, dtype=np.int32)
+        self.path_used = 0
+
+        # Hücre başına ışık indeksi (-1 = ışık yok)
+        self.light_of_cell = np.full(self.rows * self.cols, -1, dtype=np.int32)
+
+    # ---------------------------------------------------------
+    # Dizi yönetimi
+    # ---------------------------------------------------------
+    def allocate(self, capacity):
+        """Araç dizilerini capacity boyutunda (eski değerleri koruyarak) ayırır."""
+        def grow(name, dtype, fill=0):
+            new = np.full(capacity, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+        grow("pixel_x", np.float64)
+        grow("pixel_y", np.float64)
+        grow("row", np.int32)
+        grow("col", np.int32)
+        grow("speed", np.float64)
+        grow("current_speed", np.float64)
+        grow("angle", np.int16)
+        grow("path_start", np.int64)
+        grow("path_len", np.int32)
+        grow("path_index", np.int32)
+        grow("crosswalk_cooldown", np.int32)
+        grow("is_waiting_red", np.bool_)
+        grow("goal", np.int64, -1)
+        self.capacity = capacity
+
+    def store_path(self, path):
+        """Rotayı path_cells sonuna ekler, başlangıç offsetini döndürür."""
+        cells = np.fromiter(
+            (r * self.cols + c for r, c in path), dtype=np.int32, count=len(path)
+        )
+        needed = self.path_used + len(cells)
+        if needed > len(self.path_cells):
+            self.compact_paths(extra=len(cells))
+            needed = self.path_used + len(cells)
+        start = self.path_used
+        self.path_cells[start:needed] = cells
+        self.path_used = needed
+        return start
+
+    def compact_paths(self, extra=0):
+        """Artık kullanılmayan eski rotaları atıp path_cells'i sıkıştırır/büyütür."""
+        n = self.count
+        live = int(self.path_len[:n].sum())
+        size = len(self.path_cells)
+        while size < 2 * (live + extra):
+            size *= 2
+
+        new_cells = np.zeros(size, dtype=np.int32)
+        pos = 0
+        for i in range(n):
+            length = int(self.path_len[i])
+            start = int(self.path_start[i])
+            new_cells[pos:pos + length] = self.path_cells[start:start + length]
+            self.path_start[i] = pos
+            pos += length
+
+        self.path_cells = new_cells
+        self.path_used = pos
+
+    # ---------------------------------------------------------
+    # Araç ekleme / rota verme
+    # ---------------------------------------------------------
+    def add_vehicle(self, path, goal):
+        """Rotanın ilk karesinde yeni araç oluşturur; araç indeksini döndürür."""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        self.count += 1
+        self.goal[i] = goal[0] * self.cols + goal[1]
+        self.speed[i] = self.base_speed
+        self.set_path(i, path)
+        return i
+
+    def set_path(self, i, path):
+        """Car.set_path ile aynı: rota yüklenir, araç ilk kareye yerleşir."""
+        self.path_len[i] = 0  # sıkıştırmada eski rota taşınmasın
+        self.path_start[i] = self.store_path(path)
+        self.path_len[i] = len(path)
+        self.path_index[i] = 0
+
+        if path:
+            r, c = path[0]
+            self.row[i], self.col[i] = r, c
+            self.pixel_x[i] = c * self.tile_size
+            self.pixel_y[i] = r * self.tile_size
+
+    def path_of(self, i):
+        start = int(self.path_start[i])
+        cells = self.path_cells[start:start + int(self.path_len[i])]
+        return [divmod(int(cell), self.cols) for cell in cells]
+
+    def set_traffic_lights(self, traffic_lights):
+        self.light_of_cell.fill(-1)
+        for i, tl in enumerate(traffic_lights):
+            self.light_of_cell[tl.row * self.cols + tl.col] = i
+
+    # ---------------------------------------------------------
+    def arrived(self):
+        n = self.count
+        return self.path_index[:n] >= self.path_len[:n]
+
+    def all_arrived(self):
+        return bool(self.arrived().all())
+
+    # ---------------------------------------------------------
+    # VEKTÖREL ADIM
+    # ---------------------------------------------------------
+    def step(self, traffic_lights=None, dynamic_obstacles=None):
+        """
+        Bütün araçları tek seferde bir kare ilerletir.
+        Sıradaki karesinde dinamik engel olduğu için yeniden rota
+        gereken araçların indekslerini döndürür.
+        """
+        n = self.count
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        T = self.tile_size
+        cols = self.cols
+        px = self.pixel_x[:n]
+        py = self.pixel_y[:n]
+        path_index = self.path_index[:n]
+        path_len = self.path_len[:n]
+        cooldown = self.crosswalk_cooldown[:n]
+
+        # Aracın şu an bulunduğu kare
+        cur_row = (py // T).astype(np.int64)
+        cur_col = (px // T).astype(np.int64)
+        cur_cell = cur_row * cols + cur_col
+
+        # Kırmızı ışıkta bekleyenler (Car.update'teki ilk kontrol)
+        waiting = np.zeros(n, dtype=np.bool_)
+        if traffic_lights:
+            red = np.fromiter(
+                (tl.state == "RED" for tl in traffic_lights), dtype=np.bool_,
+                count=len(traffic_lights)
+            )
+            if red.any():
+                light = self.light_of_cell[cur_cell]
+                on_light = light >= 0
+                waiting[on_light] = red[light[on_light]]
+        self.is_waiting_red[:n] = waiting
+
+        # Rotası olan ve ışıkta beklemeyen araçlar hareket aday
+        moving = (~waiting) & (path_index < path_len)
+        safe_index = np.minimum(path_index, np.maximum(path_len - 1, 0))
+        slot = np.minimum(self.path_start[:n] + safe_index, len(self.path_cells) - 1)
+        target = self.path_cells[slot].astype(np.int64)
+
+        # Sıradaki karede dinamik engel -> yeniden rota
+        replan = np.zeros(n, dtype=np.bool_)
+        if dynamic_obstacles:
+            mask = getattr(dynamic_obstacles, "obstacle_mask", None)
+            if mask is not None:
+                # OccupancyGrid: hücre başına 0/1 dizisi, kopyasız okunur
+                blocked = np.frombuffer(mask, dtype=np.uint8)[target] == 1
+            else:
+                obstacle_cells = np.array(
+                    [r * cols + c for r, c in dynamic_obstacles], dtype=np.int64
+                )
+                blocked = np.isin(target, obstacle_cells)
+            replan = moving & blocked
+            moving &= ~replan
+
+        # --- HIZ KONTROLÜ (HAREKETTEN ÖNCE) ---
+        target_tile = self.tiles[target]
+        current_tile = self.tiles[cur_cell]
+
+        speed = np.where(
+            (target_tile == 5) | (target_tile == 6),
+            self.transition_speed, self.base_speed
+        )
+        on_crosswalk = (current_tile == 7) | (target_tile == 7)
+        cooling = moving & ~on_crosswalk & (cooldown > 0)
+
+        cooldown[moving & on_crosswalk] = self.crosswalk_cooldown_max
+        cooldown[cooling] -= 1
+        speed = np.where(on_crosswalk | cooling, self.crosswalk_speed, speed)
+
+        self.speed[:n] = np.where(moving, speed, self.speed[:n])
+        self.current_speed[:n] = np.where(moving, speed, 0.0)
+
+        # Hedefe olan mesafe ve yön
+        target_row = target // cols
+        target_col = target % cols
+        target_x = (target_col * T).astype(np.float64)
+        target_y = (target_row * T).astype(np.float64)
+        dx = target_x - px
+        dy = target_y - py
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+
+        # Yeterince yaklaşanlar hedef kareye "yapışır"
+        snap = moving & (distance < speed)
+        px[snap] = target_x[snap]
+        py[snap] = target_y[snap]
+        self.row[:n][snap] = target_row[snap]
+        self.col[:n][snap] = target_col[snap]
+        path_index[snap] += 1
+
+        # Diğerleri normalleştirilmiş vektörle ilerler
+        glide = moving & ~snap
+        if glide.any():
+            d = distance[glide]
+            s = speed[glide]
+            gdx = dx[glide]
+            gdy = dy[glide]
+            px[glide] += (gdx / d) * s
+            py[glide] += (gdy / d) * s
+
+            # Hareket yönüne göre açı
+            horizontal = np.abs(gdx) > np.abs(gdy)
+            self.angle[:n][glide] = np.where(
+                horizontal,
+                np.where(gdx > 0, -90, 90),
+                np.where(gdy > 0, 180, 0),
+            )
+
+        return np.flatnonzero(replan)
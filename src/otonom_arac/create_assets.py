@@ -0,0 +1,354 @@
+# Dosya: src/otonom_arac/create_assets.py
+#
+# Kare görsellerini (yol parçaları, bina, su, ışık, engel, araç, başlangıç/hedef)
+# üreten derleme adımı.
+# - Ekran açmaz; pygame sadece yüzey çizimi ve PNG yazmak için kullanılır.
+# - Her görsel ayrı bir "tarif" fonksiyonudur; tarifler süreç havuzunda paralel çizilir.
+# - assets/manifest.json her çıktı için tarif özetini (fonksiyon kaynağı,
+#   kullandığı renk/sabitler, parametreler, kare boyutu) ve dosya özetini tutar.
+#   İkisi de değişmediyse görsel yeniden çizilmez.
+# - Tek geçişte birden çok kare boyutu üretilebilir. Tarifler 40 piksellik
+#   tasarıma göre yazılmıştır, diğer boyutlarda ölçüler orantılı ölçeklenir.
+#   40 piksel assets/ altına, diğer boyutlar assets/<boyut>/ altına yazılır.
+#
+# Kullanım (src klasöründen):
+#   python -m otonom_arac.create_assets                      # 40 px, sadece değişenler
+#   python -m otonom_arac.create_assets --sizes 28 40 56     # birden çok boyut
+#   python -m otonom_arac.create_assets --force              # hepsini yeniden çiz
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+TILE_SIZE = 40          # tasarım (ve varsayılan çıktı) boyutu
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+MANIFEST = "manifest.json"
+
+# --- KAMPÜS/SAÜ TEMASI RENKLERİ ---
+ROAD_COLOR = (50, 50, 50)       # Koyu Asfalt
+LINE_COLOR = (255, 255, 255)    # Beyaz Şeritler
+BUILDING_COLOR = (160, 82, 45)  # Sienna (Daha doğal bir tuğla rengi)
+WATER_COLOR = (0, 119, 190)     # Ocean Blue
+WATER_RIPPLE = (0, 150, 220)    # Su dalgası
+CAR_COLOR = (220, 20, 60)       # Crimson Red (Spor Kırmızı)
+LINE_WIDTH = 3
+
+
+def scaler(size):
+    """40 piksellik tasarım ölçüsünü size boyutuna çeviren fonksiyon (40'ta birebir)."""
+    def px(value):
+        return value if size == TILE_SIZE else max(1, round(value * size / TILE_SIZE))
+    return px
+
+
+def create_base_surface(size):
+    s = pygame.Surface((size, size))
+    s.fill(ROAD_COLOR)
+    return s
+
+
+def draw_arm(surface, direction, size):
+    px = scaler(size)
+    mid = size // 2
+    width = px(LINE_WIDTH)
+    if direction == "UP":
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid), (mid, mid - px(8)), width)
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid - px(14)), (mid, 0), width)
+    elif direction == "DOWN":
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid), (mid, mid + px(8)), width)
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid + px(14)), (mid, size), width)
+    elif direction == "LEFT":
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid), (mid - px(8), mid), width)
+        pygame.draw.line(surface, LINE_COLOR, (mid - px(14), mid), (0, mid), width)
+    elif direction == "RIGHT":
+        pygame.draw.line(surface, LINE_COLOR, (mid, mid), (mid + px(8), mid), width)
+        pygame.draw.line(surface, LINE_COLOR, (mid + px(14), mid), (size, mid), width)
+
+
+# ------------------------------------------------------
+# TARİFLER: (kare boyutu, parametreler) -> Surface
+# ------------------------------------------------------
+def draw_road(size, arms):
+    s = create_base_surface(size)
+    for direction in arms:
+        draw_arm(s, direction, size)
+    return s
+
+
+def draw_wall(size):
+    # --- BİNA (DAHA DETAYLI) ---
+    px = scaler(size)
+    s = pygame.Surface((size, size))
+    s.fill(BUILDING_COLOR)
+    # Çatı efekti (Hafif iç kare)
+    pygame.draw.rect(s, (160+20, 82+20, 45+20), (px(5), px(5), px(30), px(30)))
+    # Ortada havalandırma kutusu
+    pygame.draw.rect(s, (100, 50, 30), (px(15), px(15), px(10), px(10)))
+    return s
+
+
+def draw_water(size):
+    # --- SU (DALGALI EFEKT) ---
+    px = scaler(size)
+    s = pygame.Surface((size, size))
+    s.fill(WATER_COLOR)
+    # Küçük dalgalar çiz
+    for y in range(px(5), size, px(10)):
+        for x in range(0, size, px(15)):
+            offset = px(5) if (y // px(10)) % 2 == 0 else 0
+            pygame.draw.line(s, WATER_RIPPLE, (x + offset, y), (x + offset + px(8), y), px(2))
+    return s
+
+
+def draw_crosswalk(size):
+    # --- YAYA GEÇİDİ ZEMİNİ ---
+    s = pygame.Surface((size, size))
+    s.fill(ROAD_COLOR)
+    return s
+
+
+def draw_traffic_light(size):
+    # --- TRAFİK IŞIĞI (HİZALI VE DÜZGÜN) ---
+    px = scaler(size)
+    s = pygame.Surface((size, size), pygame.SRCALPHA)
+    s.fill((0, 0, 0, 0))  # Şeffaf
+
+    # 1. Ana Kasa (Siyah Dikdörtgen) - Tam ortada
+    box_w, box_h = px(16), px(36)
+    box_x = (size - box_w) // 2  # (40-16)/2 = 12
+    box_y = (size - box_h) // 2  # (40-36)/2 = 2
+    pygame.draw.rect(s, (20, 20, 20), (box_x, box_y, box_w, box_h), border_radius=px(4))
+    # Çerçeve
+    pygame.draw.rect(s, (50, 50, 50), (box_x, box_y, box_w, box_h), 1, border_radius=px(4))
+
+    # 2. Sönük Işık Yuvaları (Koyu Gri)
+    # Koordinatlar: Merkez X = 20
+    # Y Konumları: Kırmızı=10, Sarı=20, Yeşil=30
+    center_x = size // 2
+    pygame.draw.circle(s, (50, 0, 0), (center_x, px(10)), px(5))   # Kırmızı Yeri
+    pygame.draw.circle(s, (50, 50, 0), (center_x, px(20)), px(5))  # Sarı Yeri
+    pygame.draw.circle(s, (0, 50, 0), (center_x, px(30)), px(5))   # Yeşil Yeri
+    return s
+
+
+def draw_obstacle(size):
+    # --- DİNAMİK ENGEL: ÇUKUR (Pothole) ---
+    px = scaler(size)
+    s = pygame.Surface((size, size))
+    s.fill(ROAD_COLOR)  # Yol rengi zemin
+    # Çukurun dışı (Açık gri)
+    pygame.draw.ellipse(s, (70, 70, 70), (px(5), px(10), px(30), px(20)))
+    # Çukurun içi (Siyah/Koyu)
+    pygame.draw.ellipse(s, (20, 20, 20), (px(8), px(12), px(24), px(16)))
+    # Uyarı Dubası (Turuncu Konik - Üstten görünüm)
+    pygame.draw.circle(s, (255, 140, 0), (px(30), px(30)), px(6))
+    pygame.draw.circle(s, (255, 255, 255), (px(30), px(30)), px(3))
+    return s
+
+
+def draw_car(size):
+    # --- ARABA (DETAYLI) ---
+    px = scaler(size)
+    s = pygame.Surface((size, size), pygame.SRCALPHA)
+    # Gölge
+    pygame.draw.rect(s, (30, 30, 30), (px(12), px(6), px(20), px(32)), border_radius=px(5))
+    # Gövde
+    pygame.draw.rect(s, CAR_COLOR, (px(10), px(4), px(20), px(32)), border_radius=px(5))
+    # Ön Cam
+    pygame.draw.rect(s, (50, 50, 70), (px(11), px(10), px(18), px(5)))
+    # Arka Cam
+    pygame.draw.rect(s, (50, 50, 70), (px(11), px(28), px(18), px(4)))
+    # Tavan
+    pygame.draw.rect(s, (200, 0, 0), (px(11), px(16), px(18), px(11)))
+    # Farlar (Sarı)
+    pygame.draw.rect(s, (255, 255, 200), (px(10), px(2), px(5), px(3)))
+    pygame.draw.rect(s, (255, 255, 200), (px(25), px(2), px(5), px(3)))
+    return s
+
+
+def draw_start(size):
+    px = scaler(size)
+    s = pygame.Surface((size, size))
+    s.fill((255, 215, 0))
+    font = pygame.font.SysFont("Arial", px(24), bold=True)
+    s.blit(font.render("S", True, (0, 0, 0)), (px(12), px(8)))
+    return s
+
+
+def draw_target(size):
+    px = scaler(size)
+    s = pygame.Surface((size, size))
+    s.fill((220, 20, 60))
+    pygame.draw.circle(s, (255, 255, 255), (size // 2, size // 2), px(10))
+    return s
+
+
+# Çıktı dosyası -> (tarif, parametreler)
+RECIPES = {
+    "road_v.png": (draw_road, (("UP", "DOWN"),)),
+    "road_h.png": (draw_road, (("LEFT", "RIGHT"),)),
+    "road_ur.png": (draw_road, (("UP", "RIGHT"),)),
+    "road_rd.png": (draw_road, (("RIGHT", "DOWN"),)),
+    "road_dl.png": (draw_road, (("DOWN", "LEFT"),)),
+    "road_lu.png": (draw_road, (("LEFT", "UP"),)),
+    "road_t_down.png": (draw_road, (("LEFT", "RIGHT", "DOWN"),)),
+    "road_t_up.png": (draw_road, (("LEFT", "RIGHT", "UP"),)),
+    "road_t_left.png": (draw_road, (("UP", "DOWN", "LEFT"),)),
+    "road_t_right.png": (draw_road, (("UP", "DOWN", "RIGHT"),)),
+    "road_cross.png": (draw_road, (("UP", "DOWN", "LEFT", "RIGHT"),)),
+    "wall.png": (draw_wall, ()),
+    "water.png": (draw_water, ()),
+    "crosswalk.png": (draw_crosswalk, ()),
+    "traffic_light.png": (draw_traffic_light, ()),
+    "obstacle.png": (draw_obstacle, ()),
+    "car.png": (draw_car, ()),
+    "start.png": (draw_start, ()),
+    "target.png": (draw_target, ()),
+}
+
+
+# ------------------------------------------------------
+# TARİF ÖZETİ
+# ------------------------------------------------------
+def recipe_sources(func, seen=None):
+    """
+    Tarifin kendi kaynağı + kullandığı bu dosyadaki fonksiyonların kaynağı +
+    kullandığı sabitlerin (renkler, LINE_WIDTH ...) değerleri.
+    """
+    seen = set() if seen is None else seen
+    parts = [inspect.getsource(func)]
+    module = sys.modules[__name__].__dict__
+    for name in func.__code__.co_names:
+        if name in seen or name not in module:
+            continue
+        seen.add(name)
+        value = module[name]
+        if inspect.isfunction(value) and value.__module__ == __name__:
+            parts.extend(recipe_sources(value, seen))
+        elif isinstance(value, (int, float, str, tuple)):
+            parts.append(f"{name}={value!r}")
+    return parts
+
+
+def recipe_hash(filename, size):
+    func, args = RECIPES[filename]
+    digest = hashlib.sha1()
+    digest.update(f"{filename}:{size}:{args!r}:{pygame.version.ver}".encode())
+    for part in recipe_sources(func):
+        digest.update(part.encode())
+    return digest.hexdigest()
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def output_dir(size, asset_dir=ASSET_DIR):
+    return asset_dir if size == TILE_SIZE else os.path.join(asset_dir, str(size))
+
+
+def load_manifest(asset_dir):
+    path = os.path.join(asset_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(asset_dir, manifest):
+    with open(os.path.join(asset_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+# ------------------------------------------------------
+# ÇİZİM (işçi süreçte)
+# ------------------------------------------------------
+def init_worker():
+    pygame.font.init()
+
+
+def render(job):
+    """(dosya, boyut, çıktı yolu) -> (çıktı yolu, dosya özeti)."""
+    filename, size, path = job
+    func, args = RECIPES[filename]
+    surface = func(size, *args)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    pygame.image.save(surface, path)
+    return path, file_hash(path)
+
+
+def build(sizes=(TILE_SIZE,), asset_dir=ASSET_DIR, force=False, workers=None, verbose=True):
+    """Değişen görselleri paralel üretir; (üretilen, atlanan) sayılarını döndürür."""
+    started = time.perf_counter()
+    os.makedirs(asset_dir, exist_ok=True)
+    manifest = load_manifest(asset_dir)
+
+    jobs = []
+    hashes = {}
+    skipped = 0
+    for size in sizes:
+        for filename in RECIPES:
+            path = os.path.join(output_dir(size, asset_dir), filename)
+            key = os.path.relpath(path, asset_dir).replace(os.sep, "/")
+            recipe = recipe_hash(filename, size)
+            entry = manifest.get(key)
+            if (not force and entry is not None and entry.get("recipe") == recipe
+                    and os.path.exists(path) and file_hash(path) == entry.get("file")):
+                skipped += 1
+                continue
+            hashes[path] = (key, recipe)
+            jobs.append((filename, size, path))
+
+    def store(results):
+        for path, digest in results:
+            key, recipe = hashes[path]
+            manifest[key] = {"recipe": recipe, "file": digest}
+            if verbose:
+                print(f"{key} oluşturuldu.")
+
+    if jobs:
+        try:
+            if workers == 1 or len(jobs) == 1:
+                init_worker()
+                store(map(render, jobs))
+            else:
+                with Pool(processes=workers, initializer=init_worker) as pool:
+                    store(pool.imap_unordered(render, jobs))
+        finally:
+            # Yarıda kesilse (hata, Ctrl+C) bile o ana kadar biten görseller
+            # manifest'e yazılır; sonraki koşu onları yeniden çizmez.
+            save_manifest(asset_dir, manifest)
+
+    if verbose:
+        elapsed = time.perf_counter() - started
+        print(f"Görseller güncellendi: {len(jobs)} yeni, {skipped} değişmemiş ({elapsed:.2f} sn)")
+    return len(jobs), skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kare görsellerini üretir")
+    parser.add_argument("--sizes", nargs="*", type=int, default=[TILE_SIZE],
+                        help="Üretilecek kare boyutları (piksel)")
+    parser.add_argument("--out", default=ASSET_DIR, help="Çıktı klasörü")
+    parser.add_argument("--force", action="store_true", help="Değişmemiş olanları da yeniden çiz")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Süreç sayısı (varsayılan: tüm çekirdekler)")
+    args = parser.parse_args(argv)
+    build(args.sizes, args.out, args.force, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# Dosya: src/otonom_arac/main.py
+#
+# "python -m otonom_arac.main" (src klasöründen) veya paket kurulduysa "otonom-arac" ile çalışır.
+# pygame yalnızca pencereli koşuda (ui.game) içe aktarılır.
+import sys
+import argparse
+
+from otonom_arac.algorithms.pathfinding import ALGORITHMS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SAÜTONOM - Akıllı Araç Simülasyonu")
+    parser.add_argument("--headless", action="store_true",
+                        help="Pencere açmadan, gerçek zamandan hızlı koşturur")
+    parser.add_argument("--algo", default=None, choices=list(ALGORITHMS),
+                        help="Kullanılacak algoritma (ekransızda varsayılan A*; "
+                             "pencerede verilirse menü atlanır)")
+    parser.add_argument("--map", metavar="DOSYA", default=None,
+                        help="Ekransız ve pencereli koşunun haritası: .map dosyası, gömülü harita "
+                             "adı ya da üretilen şehir (ör. city_200x200@3); varsayılan campus")
+    parser.add_argument("--max-ticks", type=int, default=100000,
+                        help="Ekransız koşuda en fazla kaç adım ilerletileceği")
+    parser.add_argument("--fleet", type=int, default=0,
+                        help="Ana araca ek olarak simüle edilecek filo büyüklüğü")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Filo başlangıç konumları için rastgelelik tohumu")
+    parser.add_argument("--telemetry", metavar="DOSYA", default=None,
+                        help="Ekransız koşunun kare telemetrisini .jsonl veya .npz dosyasına yazar")
+    parser.add_argument("--record", metavar="DOSYA", default=None,
+                        help="Koşuyu tekrar oynatılabilir ikili kayda (.oarp) yazar")
+    parser.add_argument("--replay", metavar="DOSYA", default=None,
+                        help="Kayıtlı koşuyu oynatır (--headless ile en hızlı, yoksa pencerede)")
+    parser.add_argument("--plan-workers", type=int, default=None,
+                        help="Yeniden rotaları arka planda hesaplayan işçi sayısı "
+                             "(0 = senkron; varsayılan: pencerede 2, ekransızda 0). "
+                             "Ekransızda sonuç sabit gecikmeyle teslim edilir, "
+                             "adım metrikleri makine hızına bağlı olmaz")
+    parser.add_argument("--plan-processes", action="store_true",
+                        help="Rota işçileri iş parçacığı yerine ayrı süreç olsun")
+    parser.add_argument("--profile", action="store_true",
+                        help="Evre sürelerini ölçer, çıkışta p50/p95/p99 özetini yazdırır")
+    parser.add_argument("--profile-out", metavar="DOSYA", default=None,
+                        help="Profil özetini ayrıca JSON olarak bu dosyaya yazar")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profile = args.profile or args.profile_out is not None
+
+    if args.replay and args.headless:
+        from otonom_arac.simulation.replay import main as replay_main
+
+        return replay_main([args.replay])
+
+    game_map = None
+    if args.map:
+        from otonom_arac.simulation.sweep import load_map_spec
+
+        game_map = load_map_spec(args.map)
+
+    if args.headless:
+        from otonom_arac.simulation.engine import Simulation
+        from otonom_arac.simulation.profiler import FrameProfiler
+
+        sim = Simulation(game_map, fleet_size=args.fleet, seed=args.seed,
+                         telemetry=args.telemetry is not None,
+                         profiler=FrameProfiler() if profile else None)
+        if args.plan_workers:
+            from otonom_arac.simulation.planner_service import PlanningService
+            from otonom_arac.simulation.settings import PLAN_RECORD_DELAY
+
+            # Ekransızda teslim her zaman sabit gecikmelidir: adım (sim-zaman)
+            # metrikleri işçilerin ne kadar hızlı bitirdiğine bağlı kalmaz.
+            sim.planner = PlanningService(
+                sim.map, workers=args.plan_workers, processes=args.plan_processes,
+                fixed_delay=PLAN_RECORD_DELAY, pathfinder=sim.pathfinder,
+            )
+            sim.planner.start()
+        if sim.reset(args.algo or "A*"):
+            recorder = None
+            if args.record:
+                from otonom_arac.simulation.replay import Recorder
+
+                recorder = Recorder(sim, args.record)
+            sim.run(args.max_ticks)
+            if recorder is not None:
+                recorder.close()
+                print(f"⏺️ Kayıt yazıldı: {args.record}")
+            if sim.telemetry is not None:
+                sim.telemetry.export(args.telemetry)
+                print(f"📈 Telemetri yazıldı: {args.telemetry}")
+            if sim.profiler is not None:
+                sim.profiler.print_summary()
+                if args.profile_out:
+                    sim.profiler.dump(args.profile_out)
+        if sim.planner is not None:
+            sim.planner.shutdown()
+    else:
+        from otonom_arac.ui.game import Game
+
+        replay = None
+        if args.replay:
+            from otonom_arac.simulation.replay import Replay
+
+            replay = Replay(args.replay)
+        game = Game(fleet_size=args.fleet, seed=args.seed,
+                    profile=profile, profile_out=args.profile_out,
+                    record_path=args.record, replay=replay,
+                    plan_workers=args.plan_workers, plan_processes=args.plan_processes,
+                    algorithm=args.algo, game_map=game_map)
+        game.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+# Dosya: src/otonom_arac/map/__init__.py
+# Harita verisi, ikili harita dosyaları (maps/*.map), üretici ve doluluk ızgarası.
+# pygame gerektirmez.
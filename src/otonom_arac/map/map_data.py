@@ -0,0 +1,22 @@
+# Dosya: src/otonom_arac/map/map_data.py
+
+# --- SAÜ KAMPÜS YENİLENMİŞ HARİTA (40x25) ---
+# 0: Yol (Gri)
+# 1: Bina / Çim (Yeşil/Kahverengi)
+# 2: Su (Kanal)
+# 3: BAŞLANGIÇ (Sarı - Sağ Alt)
+# 4: HEDEF (Kırmızı - Sol Üst)
+# 5: Kavşak (Yol Ayrımı)
+# 6: TRAFİK IŞIĞI (Kırmızı/Yeşil)
+# 7: YAYA GEÇİDİ (YENİ EK)
+#
+# Harita ikili biçimde map/maps/campus.map dosyasında durur (bkz. map/tilemap.py)
+# ve mmap ile kopyasız yüklenir. Kareleri görmek için (src klasöründen):
+#   python -m otonom_arac.map.tilemap otonom_arac/map/maps/campus.map
+#
+# Düzen: sol ada (downtown, 0-12. sütunlar), kanal (13-21, köprülerle geçilir),
+# sağ ada (kampüs, 22-39). Hedef sol üstte (0, 1), başlangıç sağ altta (23, 34).
+
+from otonom_arac.map.tilemap import load_builtin_map
+
+GAME_MAP = load_builtin_map("campus")
@@ -0,0 +1,87 @@
+# Dosya: src/otonom_arac/map/map_generator.py
+#
+# Benchmark ve senaryo koşuları için GAME_MAP ile aynı kare kodlarını
+# (0-7) kullanan, istenen boyutta rastgele şehir haritası üretir.
+# Başlangıç (3) sağ altta, hedef (4) sol üstte; tıpkı GAME_MAP'teki gibi.
+
+import random
+
+
+def _road_lines(length, rng, min_gap, max_gap):
+    """1'den length-2'ye kadar, aralıkları rastgele yol hattı indeksleri."""
+    lines = [1]
+    pos = 1
+    while True:
+        pos += rng.randint(min_gap, max_gap)
+        if pos >= length - 2:
+            break
+        lines.append(pos)
+    if lines[-1] != length - 2:
+        lines.append(length - 2)
+    return lines
+
+
+def generate_city_map(rows, cols, seed=0, min_gap=3, max_gap=7,
+                      light_ratio=0.1, crosswalk_ratio=0.05):
+    """
+    rows x cols boyutunda ızgara şehir haritası döndürür (liste listesi).
+    Dış çerçeve bina (1), yollar yatay/dikey hatlar, kesişimler kavşak (5).
+    Yolların bir kısmı trafik ışığı (6) veya yaya geçidi (7) olur.
+    Tüm yollar birbirine bağlı olduğundan başlangıç-hedef arası yol her zaman var.
+    """
+    if rows < 4 or cols < 4:
+        raise ValueError("Harita en az 4x4 olmalı")
+
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+
+    row_lines = _road_lines(rows, rng, min_gap, max_gap)
+    col_lines = _road_lines(cols, rng, min_gap, max_gap)
+
+    for r in row_lines:
+        line = grid[r]
+        for c in range(1, cols - 1):
+            line[c] = 0
+
+    for c in col_lines:
+        for r in range(1, rows - 1):
+            grid[r][c] = 0
+
+    # Yatay ve dikey hatların kesişimleri kavşak (5)
+    for r in row_lines:
+        line = grid[r]
+        for c in col_lines:
+            line[c] = 5
+
+    # Düz yol karelerinin bir kısmına ışık ve yaya geçidi koy
+    for r in range(1, rows - 1):
+        line = grid[r]
+        for c in range(1, cols - 1):
+            if line[c] != 0:
+                continue
+            roll = rng.random()
+            if roll < light_ratio:
+                line[c] = 6
+            elif roll < light_ratio + crosswalk_ratio:
+                line[c] = 7
+
+    grid[rows - 2][cols - 2] = 3  # BAŞLANGIÇ (sağ alt)
+    grid[1][1] = 4                # HEDEF (sol üst)
+    return grid
+
+
+def pick_obstacles_on_path(game_map, path, count, seed=0):
+    """
+    Verilen rota üzerindeki düz yol karelerinden (0) count tanesini
+    dinamik engel olarak seçer. Başlangıç ve hedef karesi seçilmez.
+    """
+    candidates = [
+        cell for cell in path[1:-1]
+        if game_map[cell[0]][cell[1]] == 0
+    ]
+    if not candidates:
+        return []
+
+    rng = random.Random(seed)
+    count = min(count, len(candidates))
+    return rng.sample(candidates, count)
@@ -0,0 +1,105 @@
+# Dosya: src/otonom_arac/map/occupancy.py
+#
+# Hücre id'sine göre (id = satır * cols + sütun) indekslenmiş doluluk yapısı.
+# Trafik ışıkları ve dinamik engeller burada tutulur; her sorgu O(1).
+# Engeller eklendikçe/kaldırıldıkça yapı artımlı güncellenir, her
+# değişiklikte version bir artar ve dinleyicilere haber verilir.
+
+import itertools
+
+# Her ızgaraya süreç içinde tekil bir jeton verilir; önbellekler ızgarayı
+# id() yerine bununla tanır (silinen ızgaranın id'si yenisine verilebilir).
+_GRID_TOKENS = itertools.count(1)
+
+
+class OccupancyGrid:
+    """
+    Dinamik engel listesinin yerine geçer: `(r, c) in grid`, `for cell in grid`,
+    `len(grid)` eskisi gibi çalışır, ama üyelik testi doğrusal tarama değildir.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        size = rows * cols
+
+        # Engeller: hücre başına 0/1 (düz dizi) + sıralı id kümesi
+        self.obstacle_mask = bytearray(size)
+        self.obstacle_ids = {}   # id -> None (ekleme sırasını korumak için dict)
+
+        # Işıklar: hücre id -> ışık indeksi (ışıklar az; harita boyu dizi ayrılmaz)
+        self.light_index = {}
+        self.lights = []
+
+        self.token = next(_GRID_TOKENS)
+        self.version = 0
+        self.listeners = []
+
+    # ------------------------------------------------------
+    def cell_id(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def add_listener(self, callback):
+        """callback(cell, added): engel eklenince/kaldırılınca çağrılır."""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def notify(self, cell, added):
+        self.version += 1
+        for callback in self.listeners:
+            callback(cell, added)
+
+    # ------------------------------------------------------
+    # DİNAMİK ENGELLER
+    # ------------------------------------------------------
+    def add_obstacle(self, cell):
+        cid = self.cell_id(cell)
+        if self.obstacle_mask[cid]:
+            return False
+        self.obstacle_mask[cid] = 1
+        self.obstacle_ids[cid] = None
+        self.notify(cell, True)
+        return True
+
+    def remove_obstacle(self, cell):
+        cid = self.cell_id(cell)
+        if not self.obstacle_mask[cid]:
+            return False
+        self.obstacle_mask[cid] = 0
+        del self.obstacle_ids[cid]
+        self.notify(cell, False)
+        return True
+
+    def clear_obstacles(self):
+        for cid in list(self.obstacle_ids):
+            self.remove_obstacle(divmod(cid, self.cols))
+
+    def __contains__(self, cell):
+        r, c = cell
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return self.obstacle_mask[r * self.cols + c] == 1
+        return False
+
+    def __iter__(self):
+        cols = self.cols
+        return (divmod(cid, cols) for cid in list(self.obstacle_ids))
+
+    def __len__(self):
+        return len(self.obstacle_ids)
+
+    # ------------------------------------------------------
+    # TRAFİK IŞIKLARI
+    # ------------------------------------------------------
+    def set_traffic_lights(self, traffic_lights):
+        self.lights = list(traffic_lights)
+        cols = self.cols
+        self.light_index = {tl.row * cols + tl.col: i for i, tl in enumerate(self.lights)}
+
+    def light_at(self, r, c):
+        """(r, c) karesindeki trafik ışığı, yoksa None."""
+        i = self.light_index.get(r * self.cols + c)
+        return self.lights[i] if i is not None else None
+
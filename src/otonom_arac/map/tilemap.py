@@ -0,0 +1,163 @@
+# Dosya: src/otonom_arac/map/tilemap.py
+#
+# İkili harita biçimi ve bellek eşlemeli (mmap) yükleme.
+#
+# Dosya düzeni (little-endian):
+#   0   4 bayt  sihirli sözcük b"OAMP"
+#   4   2 bayt  biçim sürümü (1)
+#   6   2 bayt  ayrılmış (0)
+#   8   4 bayt  satır sayısı
+#   12  4 bayt  sütun sayısı
+#   16  satır * sütun bayt, satır-öncelikli uint8 kare kodları (0-7)
+#
+# Yükleme kopyasızdır: dosya mmap ile eşlenir, kareler doğrudan bu
+# belleğin üzerindeki memoryview ile okunur. Hücre başına Python nesnesi
+# oluşmaz; sadece satır başına bir memoryview dilimi tutulur.
+#
+# Kullanım (src klasöründen):
+#   python -m otonom_arac.map.tilemap otonom_arac/map/maps/campus.map     # başlık + kareleri yazdır
+
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"OAMP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+
+# Pakete gömülü haritalar
+MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+
+
+class TileMap:
+    """
+    Düz uint8 kare dizisi üzerinde 2B harita görünümü.
+    Liste listesi gibi kullanılır: tile_map[r][c], len(tile_map),
+    len(tile_map[0]), for row in tile_map. Ayrıca:
+    - tiles: satır-öncelikli düz memoryview (hücre id = r * cols + c)
+    - grid:  (rows, cols) biçimli memoryview, grid[r, c]
+    """
+
+    def __init__(self, buffer, rows, cols, offset=0, source=None):
+        if len(buffer) - offset < rows * cols:
+            raise ValueError("Harita verisi başlıktaki boyuttan kısa")
+        self.rows = rows
+        self.cols = cols
+        self.source = source
+        self.buffer = buffer
+        self.tiles = memoryview(buffer)[offset:offset + rows * cols]
+        self.grid = self.tiles.cast("B", (rows, cols))
+        self.row_views = [self.tiles[r * cols:(r + 1) * cols] for r in range(rows)]
+
+    # ------------------------------------------------------
+    # Liste listesi arayüzü
+    # ------------------------------------------------------
+    def __getitem__(self, r):
+        return self.row_views[r]
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        return iter(self.row_views)
+
+    def __reduce__(self):
+        # mmap süreçler arası taşınamaz; içerik kopyalanarak gönderilir
+        return (from_bytes, (self.rows, self.cols, self.tiles.tobytes()))
+
+    # ------------------------------------------------------
+    def tobytes(self):
+        return self.tiles.tobytes()
+
+    def to_lists(self):
+        return [list(row) for row in self.row_views]
+
+    def find_all(self, value):
+        """value kodlu karelerin (satır, sütun) listesi, satır-öncelikli sırayla."""
+        ids = np.flatnonzero(np.frombuffer(self.tiles, dtype=np.uint8) == value)
+        rows, cols = np.divmod(ids, self.cols)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def close(self):
+        """mmap ile açıldıysa eşlemeyi bırakır; sonra harita kullanılamaz."""
+        self.row_views = []
+        self.grid.release()
+        self.tiles.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+# ------------------------------------------------------
+# Oluşturma / kaydetme / yükleme
+# ------------------------------------------------------
+def from_bytes(rows, cols, data):
+    return TileMap(bytearray(data), rows, cols)
+
+
+def from_rows(game_map):
+    """Liste listesinden (veya başka bir TileMap'ten) bellek içi TileMap."""
+    if isinstance(game_map, TileMap):
+        return from_bytes(game_map.rows, game_map.cols, game_map.tobytes())
+    rows, cols = len(game_map), len(game_map[0])
+    data = bytearray(rows * cols)
+    for r, row in enumerate(game_map):
+        if len(row) != cols:
+            raise ValueError(f"{r}. satırın uzunluğu {len(row)}, beklenen {cols}")
+        data[r * cols:(r + 1) * cols] = bytes(row)
+    return TileMap(data, rows, cols)
+
+
+def save_map(path, game_map):
+    """Haritayı (liste listesi veya TileMap) ikili biçimde yazar."""
+    tile_map = game_map if isinstance(game_map, TileMap) else from_rows(game_map)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, tile_map.rows, tile_map.cols))
+        f.write(tile_map.tiles)
+
+
+def load_map(path):
+    """İkili haritayı mmap ile (salt okunur, kopyasız) açar."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapped) < HEADER.size:
+        mapped.close()
+        raise ValueError(f"Geçersiz harita dosyası: {path}")
+    magic, version, _, rows, cols = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        mapped.close()
+        raise ValueError(f"Geçersiz harita dosyası: {path}")
+    if version != FORMAT_VERSION:
+        mapped.close()
+        raise ValueError(f"Desteklenmeyen harita sürümü: {version}")
+
+    try:
+        return TileMap(mapped, rows, cols, offset=HEADER.size, source=path)
+    except ValueError:
+        mapped.close()
+        raise
+
+
+def load_builtin_map(name):
+    """map/maps klasöründeki gömülü haritayı yükler (ör. "campus")."""
+    return load_map(os.path.join(MAPS_DIR, name + ".map"))
+
+
+# ------------------------------------------------------
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Kullanım: python -m otonom_arac.map.tilemap <harita.map>")
+        return 2
+    tile_map = load_map(argv[0])
+    print(f"{argv[0]}: {tile_map.rows} satır x {tile_map.cols} sütun")
+    for r, row in enumerate(tile_map):
+        print(f"{r:4} " + "".join(str(v) for v in row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
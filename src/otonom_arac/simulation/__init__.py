@@ -0,0 +1,3 @@
+# Dosya: src/otonom_arac/simulation/__init__.py
+# Ekransız simülasyon çekirdeği, telemetri, profil, kayıt/oynatma ve toplu koşular.
+# pygame gerektirmez.
@@ -0,0 +1,521 @@
+# Dosya: src/otonom_arac/simulation/engine.py
+#
+# Ekrandan bağımsız simülasyon çekirdeği.
+# Burada pygame, ekran, ses veya font YOK; sadece sabit zaman adımıyla
+# ilerleyen araç/ışık/engel mantığı var. Pygame'li Game sınıfı bu çekirdeğin
+# üstünde çalışan isteğe bağlı bir görüntüleyicidir.
+
+import random
+import time
+from otonom_arac.simulation.settings import FPS
+from otonom_arac.car.car_manager import Car
+from otonom_arac.car.fleet import Fleet
+from otonom_arac.algorithms.pathfinding import PathFinder, SearchStats
+from otonom_arac.map.occupancy import OccupancyGrid
+from otonom_arac.simulation.telemetry import PLAN_FLEET, PLAN_INITIAL, PLAN_REPLAN, Telemetry
+
+# PlanningService'te ana aracın sahip anahtarı (filo araçları kendi indeksleriyle ister)
+MAIN_CAR = -1
+
+
+class SimulationMetrics:
+    """
+    Koşu özeti (süre, kare, yol uzunluğu, kırmızıda bekleme, rota hesapları).
+    telemetry verilirse her kare ve her rota hesabı ayrıca örnek olarak kaydedilir;
+    verilmezse kare başına sadece birkaç toplama yapılır.
+    """
+
+    def __init__(self, algorithm_name, telemetry=None):
+        self.algorithm_name = algorithm_name
+        self.start_time = time.time()
+        self.end_time = None
+        self.frame_count = 0
+        self.sim_time = 0.0
+        self.total_distance = 0
+        self.last_cell = None
+        self.finished = False
+
+        self.red_wait_frames = 0
+        self.replans = 0
+        self.plan_count = 0
+        self.planner_time = 0.0     # saniye, tüm rota hesapları
+        self.nodes_expanded = 0
+
+        self.telemetry = telemetry
+        if telemetry is not None:
+            telemetry.clear(algorithm=algorithm_name)
+
+    def update(self, car, dt=0.0):
+        self.frame_count += 1
+        self.sim_time += dt
+
+        cell = (car.row, car.col)
+        if self.last_cell is not None:
+            self.total_distance += abs(cell[0] - self.last_cell[0]) + abs(cell[1] - self.last_cell[1])
+
+        self.last_cell = cell
+
+        if car.is_waiting_red:
+            self.red_wait_frames += 1
+        if self.telemetry is not None:
+            self.telemetry.record_tick(self.frame_count, self.sim_time, car, self.replans)
+
+    def record_plan(self, kind, stats):
+        """Bir rota hesabının SearchStats'ını toplamlara (ve telemetriye) ekler."""
+        self.plan_count += 1
+        if kind == PLAN_REPLAN:
+            self.replans += 1
+        self.planner_time += stats.elapsed
+        self.nodes_expanded += stats.nodes_expanded
+        if self.telemetry is not None:
+            self.telemetry.record_plan(self.frame_count, kind, stats)
+
+    def finish(self, verbose=True):
+        if self.finished:
+            return
+
+        self.finished = True
+        self.end_time = time.time()
+
+        if verbose:
+            self.print_report()
+
+    def as_dict(self):
+        end_time = self.end_time if self.end_time is not None else time.time()
+        return {
+            "algorithm": self.algorithm_name,
+            "wall_time": end_time - self.start_time,
+            "sim_time": self.sim_time,
+            "frames": self.frame_count,
+            "path_length": self.total_distance,
+            "red_wait_frames": self.red_wait_frames,
+            "replans": self.replans,
+            "plans": self.plan_count,
+            "planner_time": self.planner_time,
+            "nodes_expanded": self.nodes_expanded,
+        }
+
+    def print_report(self):
+        report = self.as_dict()
+
+        print("\n==============================")
+        print("🚗 SİMÜLASYON RAPORU")
+        print("==============================")
+        print(f"Algoritma        : {report['algorithm']}")
+        print(f"Toplam Süre      : {report['wall_time']:.2f} saniye")
+        print(f"Simülasyon Süresi: {report['sim_time']:.2f} saniye")
+        print(f"Toplam Kare      : {report['frames']}")
+        print(f"Yol Uzunluğu     : {report['path_length']} birim")
+        print(f"Kırmızıda Bekleme: {report['red_wait_frames']} kare")
+        print(f"Yeniden Rota     : {report['replans']}")
+        print(f"Planlama Süresi  : {report['planner_time'] * 1000:.2f} ms "
+              f"({report['plans']} hesap, {report['nodes_expanded']} düğüm)")
+        print("==============================\n")
+
+
+# ------------------------------------------------------
+# TRAFİK IŞIĞI SINIFI
+# ------------------------------------------------------
+class TrafficLight:
+    """Trafik ışığının durum ve zaman kontrolünü yapıyorum."""
+
+    def __init__(self, row, col, red_time=4, green_time=2.5):
+        self.row = row
+        self.col = col
+        self.red_time = red_time
+        self.green_time = green_time
+        self.state = "RED"     # ilk durumda kırmızı
+        self.timer = 0.0
+
+    def update(self, dt):
+        """Her karede zamanlayıcıyı yeniliyorum."""
+        self.timer += dt
+
+        if self.state == "RED" and self.timer >= self.red_time:
+            self.state = "GREEN"
+            self.timer = 0.0
+
+        elif self.state == "GREEN" and self.timer >= self.green_time:
+            self.state = "RED"
+            self.timer = 0.0
+
+    def reset(self):
+        self.state = "RED"
+        self.timer = 0.0
+
+
+# ------------------------------------------------------
+# SİMÜLASYON ÇEKİRDEĞİ
+# ------------------------------------------------------
+class Simulation:
+    """
+    Sabit zaman adımlı (dt = 1 / FPS) simülasyon.
+    step() bir kareyi ilerletir; çizim yapmaz, saat beklemez.
+    Böylece aynı senaryo gerçek zamandan çok daha hızlı koşturulabilir.
+    """
+
+    def __init__(self, game_map=None, fps=FPS, obstacle_delay=6.0, verbose=True,
+                 fleet_size=0, seed=0, obstacle_offset=6, telemetry=None, profiler=None,
+                 planner=None):
+        if game_map is None:
+            # Varsayılan kampüs haritası ilk kullanımda yüklenir (içe aktarmada dosya okunmaz)
+            from otonom_arac.map.map_data import GAME_MAP
+            game_map = GAME_MAP
+        self.map = game_map
+        self.rows = len(game_map)
+        self.cols = len(game_map[0])
+
+        self.dt = 1.0 / fps
+        self.verbose = verbose
+
+        self.pathfinder = PathFinder(game_map)  # Yol bulma motoru
+
+        # Işık ve engellerin hücre indeksi (O(1) sorgu)
+        self.occupancy = OccupancyGrid(self.rows, self.cols)
+        # Işıklar bir kez kurulur; her koşuda sadece ilk durumlarına döner
+        self.traffic_lights = [TrafficLight(r, c) for r, c in self.find_all(6)]
+        self.occupancy.set_traffic_lights(self.traffic_lights)
+
+        # --- DURUM DEĞİŞKENLERİ ---
+        self.selected_algorithm = None
+        self.car = None
+        self.metrics = None
+        self.current_path = []
+        self.tick_count = 0
+
+        # Dinamik engel zamanlama (engeller occupancy içinde tutulur)
+        self.dynamic_obstacles = self.occupancy
+        self.obstacle_placed = False
+        self.obstacle_delay = obstacle_delay    # None = engel hiç konmaz
+        self.obstacle_offset = obstacle_offset  # aracın kaç kare önüne
+        self.obstacle_cell = None
+        self.replan_count = 0
+        self.time_in_game = 0.0
+
+        # Filo modu: ana aracın yanında dizilerle tutulan ek araçlar
+        self.fleet_size = fleet_size
+        self.seed = seed
+        self.fleet = None
+
+        # Kare başına telemetri: True ya da bir Telemetry nesnesi verilirse açılır
+        if telemetry is True:
+            telemetry = Telemetry()
+        self.telemetry = telemetry or None
+
+        # Evre süreleri (FrameProfiler); None iken ölçüm yapılmaz
+        self.profiler = profiler
+
+        # Koşu kaydı (replay.Recorder); bağlıysa her adım sonunda çağrılır
+        self.recorder = None
+
+        # Arka plan rota servisi (PlanningService); None iken yeniden rotalar
+        # adımın içinde, senkron hesaplanır
+        self.planner = planner
+
+    # ------------------------------------------------------
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def find_pos(self, value):
+        cells = self.find_all(value)
+        return cells[0] if cells else None
+
+    def find_all(self, value):
+        if hasattr(self.map, "find_all"):
+            return self.map.find_all(value)  # TileMap: bytes.find ile tarar
+        return [
+            (r, c)
+            for r, row in enumerate(self.map)
+            for c, v in enumerate(row)
+            if v == value
+        ]
+
+    def reset_traffic_lights(self):
+        """Bütün ışıkları ilk durumuna (kırmızı, sayaç 0) döndürür."""
+        for tl in self.traffic_lights:
+            tl.reset()
+
+    # ------------------------------------------------------
+    # SEÇİLİ ALGORİTMAYLA ROTA
+    # ------------------------------------------------------
+    def find_path(self, start, goal, dynamic_obstacles=None, stats=None):
+        return self.pathfinder.search(
+            self.selected_algorithm, start, goal, dynamic_obstacles, stats
+        )
+
+    # ------------------------------------------------------
+    # SİMÜLASYONU BAŞLAT
+    # ------------------------------------------------------
+    def reset(self, algo_name):
+        """
+        Yeni bir koşu başlatır. Başlangıç rotası bulunduysa True döner.
+        """
+        self.selected_algorithm = algo_name
+        self.tick_count = 0
+        self.metrics = None
+        self.current_path = []
+
+        # Başlangıçta HİÇ DİNAMİK ENGEL YOK. Önceki koşunun engelli rotaları
+        # önbellekten atılır; temizleme de önbelleği dolaşmaz.
+        self.pathfinder.route_cache.detach(self.occupancy)
+        self.occupancy.clear_obstacles()
+        self.obstacle_placed = False
+        self.obstacle_cell = None
+        self.replan_count = 0
+        self.time_in_game = 0.0
+        self.reset_traffic_lights()
+        self.pathfinder.reset_incremental()
+        if self.planner is not None:
+            self.planner.cancel_all()
+
+        start = self.find_pos(3)
+        goal = self.find_pos(4)
+
+        if not start or not goal:
+            self.log("Start veya hedef bulunamadı.")
+            return False
+
+        self.car = Car(start[0], start[1])
+
+        # Başlangıç rotasını, seçili algoritmaya göre ENGELSİZ hesapla
+        stats = SearchStats()
+        path = self.find_path(start, goal, stats=stats)
+        self.current_path = path
+
+        if not path:
+            self.log("Yol bulunamadı!")
+            return False
+
+        self.car.set_path(path)
+        self.metrics = SimulationMetrics(self.selected_algorithm, self.telemetry)
+        self.metrics.record_plan(PLAN_INITIAL, stats)
+
+        self.fleet = None
+        if self.fleet_size > 0:
+            self.spawn_fleet(self.fleet_size)
+        return True
+
+    # ------------------------------------------------------
+    # FİLO
+    # ------------------------------------------------------
+    def spawn_fleet(self, count):
+        """
+        Rastgele (seed'e bağlı) düz yol karelerine count araç koyar; her biri
+        haritadaki hedef karelerinden (4) birine seçili algoritmayla rota alır.
+        """
+        rng = random.Random(self.seed)
+        roads = self.find_all(0)
+        goals = self.find_all(4)
+
+        fleet = Fleet(self.map)
+        fleet.set_traffic_lights(self.traffic_lights)
+
+        attempts = 0
+        while fleet.count < count and roads and attempts < count * 4:
+            attempts += 1
+            start = rng.choice(roads)
+            goal = rng.choice(goals)
+            path = self.find_fleet_path(start, goal)
+            if path:
+                fleet.add_vehicle(path, goal)
+
+        self.fleet = fleet
+        self.log(f"🚙 Filo oluşturuldu: {fleet.count} araç")
+
+    def step_fleet(self):
+        """Filoyu tek vektörel adımda ilerletir, engele takılanlara yeni rota verir."""
+        fleet = self.fleet
+        replan = fleet.step(self.traffic_lights, self.dynamic_obstacles)
+
+        cols = fleet.cols
+        for i in replan:
+            start = (int(fleet.row[i]), int(fleet.col[i]))
+            goal = divmod(int(fleet.goal[i]), cols)
+            if self.planner is not None:
+                # Araç sonuç gelene kadar engelin önünde bekler
+                self.planner.request(int(i), self.selected_algorithm, start, goal,
+                                     self.occupancy, self.tick_count)
+                continue
+            path = self.find_fleet_path(start, goal, self.dynamic_obstacles)
+            if path:
+                fleet.set_path(i, path)
+
+    def find_fleet_path(self, start, goal, dynamic_obstacles=None):
+        stats = SearchStats()
+        path = self.find_path(start, goal, dynamic_obstacles, stats)
+        self.metrics.record_plan(PLAN_FLEET, stats)
+        return path
+
+    # ------------------------------------------------------
+    # Araç ilerledikten ve biraz süre geçtikten sonra önüne engel koy
+    # ------------------------------------------------------
+    def maybe_spawn_obstacle_after_delay(self):
+        """Dinamik engeli gecikmeyle yerleştirir."""
+        if self.obstacle_placed or self.obstacle_delay is None:
+            return
+        if not self.car or not self.car.path:
+            return
+
+        if self.time_in_game < self.obstacle_delay:
+            return
+
+        if self.car.path_index < 4:
+            return
+
+        idx = self.car.path_index + self.obstacle_offset
+        if idx >= len(self.car.path):
+            idx = len(self.car.path) - 2
+
+        chosen_cell = None
+        for i in range(idx, len(self.car.path) - 1):
+            r, c = self.car.path[i]
+            if self.map[r][c] == 0:
+                chosen_cell = (r, c)
+                break
+
+        if not chosen_cell:
+            return
+
+        self.occupancy.clear_obstacles()
+        self.occupancy.add_obstacle(chosen_cell)
+        self.obstacle_placed = True
+        self.obstacle_cell = chosen_cell
+        self.log(f"🔴 Dinamik engel yerleştirildi: {chosen_cell}")
+
+    # ------------------------------------------------------
+    # ENGEL SONRASI ROTAYI TEKRAR HESAPLA
+    # ------------------------------------------------------
+    def recalculate_path_after_obstacle(self):
+        if not self.car:
+            return
+
+        current_pos = (self.car.row, self.car.col)
+        goal = self.find_pos(4)
+
+        if not goal:
+            self.log("Hedef bulunamadı!")
+            return
+
+        if self.planner is not None:
+            # Arka planda hesaplanır; araç bu arada olduğu yerde bekler
+            self.car.current_speed = 0.0
+            if self.planner.request(MAIN_CAR, self.selected_algorithm, current_pos, goal,
+                                    self.occupancy, self.tick_count):
+                self.replan_count += 1
+                self.log("⏳ Yeni rota arka planda hesaplanıyor...")
+            return
+
+        # Seçili algoritmaya göre, artık ENGEL varken yeniden rota hesapla
+        self.replan_count += 1
+        stats = SearchStats()
+        new_path = self.find_path(current_pos, goal, self.dynamic_obstacles, stats)
+        self.metrics.record_plan(PLAN_REPLAN, stats)
+
+        self.apply_replan(new_path)
+
+    def apply_replan(self, new_path):
+        if new_path:
+            self.log("✅ Yeni rota bulundu.")
+            self.current_path = new_path
+            self.car.set_path(new_path)
+        else:
+            self.log("❌ Yeni rota bulunamadı, araç olduğu yerde kalacak.")
+
+    # ------------------------------------------------------
+    # ARKA PLANDAN GELEN ROTALAR
+    # ------------------------------------------------------
+    def apply_planned_routes(self):
+        """
+        Servisin teslim ettiği rotaları araçlara yükler. Araç istekten sonra
+        yer değiştirdiyse (rota artık onun karesinden başlamıyorsa) sonuç
+        atılır; hâlâ engelliyse bir sonraki adımda yeniden ister.
+        """
+        fleet = self.fleet
+        for owners, path, stats in self.planner.poll(self.tick_count):
+            kind = PLAN_REPLAN if MAIN_CAR in owners else PLAN_FLEET
+            self.metrics.record_plan(kind, stats)
+            start = tuple(path[0]) if path else None
+            for owner in owners:
+                if owner == MAIN_CAR:
+                    if start is None or start == (self.car.row, self.car.col):
+                        self.apply_replan(path)
+                elif fleet is not None and owner < fleet.count:
+                    if start == (int(fleet.row[owner]), int(fleet.col[owner])):
+                        fleet.set_path(owner, path)
+
+    # ------------------------------------------------------
+    # TEK ADIM
+    # ------------------------------------------------------
+    @property
+    def finished(self):
+        if self.metrics is None or not self.metrics.finished:
+            return False
+        return self.fleet is None or self.fleet.all_arrived()
+
+    def step(self):
+        """Simülasyonu sabit dt kadar ilerletir."""
+        dt = self.dt
+        self.tick_count += 1
+        self.time_in_game += dt
+
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+
+        for tl in self.traffic_lights:
+            tl.update(dt)
+
+        if prof is not None:
+            t = prof.lap("sim.lights", t)
+
+        if not self.car:
+            return
+
+        if self.planner is not None and len(self.planner):
+            self.apply_planned_routes()
+            if prof is not None:
+                t = prof.lap("sim.plan_results", t)
+
+        if self.metrics:
+            self.metrics.update(self.car, dt)
+
+        self.maybe_spawn_obstacle_after_delay()
+
+        must_replan = self.car.update(
+            self.map, self.occupancy, self.dynamic_obstacles
+        )
+
+        if prof is not None:
+            t = prof.lap("sim.car_update", t)
+
+        if must_replan:
+            self.recalculate_path_after_obstacle()
+            if prof is not None:
+                t = prof.lap("sim.replan", t)
+
+        if self.fleet is not None:
+            self.step_fleet()
+            if prof is not None:
+                t = prof.lap("sim.fleet", t)
+
+        if self.metrics and self.car.path and self.car.path_index >= len(self.car.path):
+            self.metrics.finish(self.verbose)
+
+        if self.recorder is not None:
+            self.recorder.record()
+
+    def run(self, max_ticks=100000):
+        """
+        Araç hedefe varana kadar (veya max_ticks dolana kadar) ekransız koşturur.
+        Koşu metriklerini döndürür.
+        """
+        prof = self.profiler
+        while not self.finished and self.tick_count < max_ticks:
+            if prof is not None:
+                prof.frame_begin()
+                self.step()
+                prof.frame_end()
+            else:
+                self.step()
+        return self.metrics
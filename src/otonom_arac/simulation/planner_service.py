@@ -0,0 +1,230 @@
+# Dosya: src/otonom_arac/simulation/planner_service.py
+#
+# Arka planda rota planlama servisi.
+# Engel sonrası yeniden rota hesapları simülasyon adımının içinde yapılmaz:
+# istek bir işçi havuzuna (iş parçacığı ya da süreç) gönderilir, sonuç
+# sonraki bir adımda poll() ile teslim alınır. Bu arada araç olduğu yerde
+# bekler (Car.update engelli kareye girmez).
+#
+# Aynı sahip (ana araç ya da filo aracı) yeni bir rota isterse eski isteği
+# geçersiz olur (birleştirme); aynı (algoritma, başlangıç, hedef, engeller)
+# için yürüyen bir arama varsa yenisi açılmaz, sonuç paylaşılır (tekilleştirme).
+# Böylece art arda gelen engel olayları kuyruğu gereksiz aramayla doldurmaz.
+#
+# Teslim zamanlaması:
+#   fixed_delay=None : arama bittiği ilk adımda (en erken min_delay adım sonra);
+#                      kare hiç beklemez ama teslim adımı işçi hızına bağlıdır.
+#   fixed_delay=k    : istekten tam k adım sonra; arama bitmediyse o adımda
+#                      beklenir. Koşu tekrarlanabilir kalır (kayıt/--verify için).
+#
+# İşçiler haritayı salt okunur paylaşır: iş parçacıkları aynı harita nesnesini
+# ve verilen pathfinder'ın derlenmiş komşuluk tablosunu (yoksa bir kez
+# derlenir), süreçler başlangıçta bir kez gönderilen kopyasını kullanır. Her
+# işçinin rota önbelleği ve planlayıcıları ayrıdır.
+# Süreçler "spawn" ile açılır; çekirdek pygame içe aktarmadığı için hızlı başlar.
+# start() her işçiye boş bir iş gönderip bitmesini bekler: işçiler (ve
+# PathFinder'ları) ilk yeniden rotadan önce hazır olur, açılış maliyeti
+# koşunun ortasındaki bir kareye binmez.
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from otonom_arac.algorithms.pathfinding import PathFinder, SearchStats
+
+
+# ------------------------------------------------------
+# Süreç işçileri (modül düzeyinde olmalı: spawn ile içe aktarılır)
+# ------------------------------------------------------
+_process_finder = None
+
+
+def _init_process(game_map):
+    global _process_finder
+    _process_finder = PathFinder(game_map)
+
+
+def _process_ready():
+    return True
+
+
+def _process_search(algorithm, start, goal, obstacles):
+    stats = SearchStats()
+    path = _process_finder.search(algorithm, start, goal, obstacles, stats)
+    return path, stats
+
+
+class PlanJob:
+    def __init__(self, future, tick, owners):
+        self.future = future
+        self.tick = tick          # isteğin yapıldığı adım
+        self.owners = owners      # sonucu bekleyen sahipler (ekleme sırasıyla)
+
+
+class PlanningService:
+    def __init__(self, game_map, workers=2, processes=False, min_delay=1, fixed_delay=None,
+                 pathfinder=None):
+        self.map = game_map
+        self.pathfinder = pathfinder   # iş parçacıklarının paylaştığı derlenmiş harita
+        self.workers = workers
+        self.processes = processes
+        self.min_delay = max(1, min_delay)
+        self.fixed_delay = fixed_delay
+        self.executor = None
+        self.local = threading.local()
+
+        self.jobs = {}       # anahtar -> PlanJob (istek sırasıyla)
+        self.wanted = {}     # sahip -> istediği anahtar
+        self.requested = 0   # gelen istek
+        self.submitted = 0   # gerçekten başlatılan arama
+        self.delivered = 0
+
+    def describe(self):
+        """Kayıt başlığı için ayarlar (replay.verify aynı servisi kurar)."""
+        return {"workers": self.workers, "processes": self.processes,
+                "min_delay": self.min_delay, "fixed_delay": self.fixed_delay}
+
+    # ------------------------------------------------------
+    # İşçi havuzu
+    # ------------------------------------------------------
+    def start(self):
+        if self.executor is not None:
+            return
+        if self.processes:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process, initargs=(self.map,),
+            )
+        else:
+            if self.pathfinder is None:
+                self.pathfinder = PathFinder(self.map, route_cache_size=0)
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="planner"
+            )
+        self.warm_up()
+
+    def warm_up(self):
+        """Her işçiye boş bir iş gönderir ve hepsi bitene kadar bekler."""
+        if self.processes:
+            futures = [self.executor.submit(_process_ready) for _ in range(self.workers)]
+        else:
+            # Engel (barrier) her işin ayrı bir iş parçacığında koşmasını sağlar
+            barrier = threading.Barrier(self.workers)
+            futures = [self.executor.submit(self.thread_ready, barrier)
+                       for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def thread_finder(self):
+        finder = getattr(self.local, "finder", None)
+        if finder is None:
+            finder = self.local.finder = PathFinder(self.map, compiled=self.pathfinder)
+        return finder
+
+    def thread_ready(self, barrier):
+        self.thread_finder()
+        barrier.wait()
+        return True
+
+    def thread_search(self, algorithm, start, goal, obstacles):
+        stats = SearchStats()
+        path = self.thread_finder().search(algorithm, start, goal, obstacles, stats)
+        return path, stats
+
+    def shutdown(self):
+        self.cancel_all()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    # ------------------------------------------------------
+    # İstek
+    # ------------------------------------------------------
+    def request(self, owner, algorithm, start, goal, occupancy, tick):
+        """
+        owner için start -> goal rotası ister; engeller occupancy'nin o anki
+        kopyasıdır. owner için yeni bir istekse True, owner aynı rotayı zaten
+        bekliyorsa False döner. Aynı arama başka bir sahip için yürüyorsa
+        yenisi açılmaz, sonuç paylaşılır.
+        """
+        self.requested += 1
+        obstacles = frozenset(occupancy)
+        key = (algorithm, tuple(start), tuple(goal), obstacles)
+
+        previous = self.wanted.get(owner)
+        if previous == key:
+            return False
+        if previous is not None:
+            self.drop_owner(owner, previous)
+        self.wanted[owner] = key
+
+        job = self.jobs.get(key)
+        if job is not None:
+            job.owners.append(owner)
+            return True
+
+        self.start()
+        if self.processes:
+            future = self.executor.submit(_process_search, algorithm, key[1], key[2], obstacles)
+        else:
+            future = self.executor.submit(self.thread_search, algorithm, key[1], key[2], obstacles)
+        self.jobs[key] = PlanJob(future, tick, [owner])
+        self.submitted += 1
+        return True
+
+    def drop_owner(self, owner, key):
+        """Sahibin eski isteğini bırakır; kimse beklemiyorsa arama iptal edilir."""
+        job = self.jobs.get(key)
+        if job is None:
+            return
+        if owner in job.owners:
+            job.owners.remove(owner)
+        if not job.owners and job.future.cancel():
+            del self.jobs[key]
+
+    def pending(self, owner):
+        return owner in self.wanted
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def cancel_all(self):
+        for job in self.jobs.values():
+            job.future.cancel()
+        self.jobs = {}
+        self.wanted = {}
+
+    # ------------------------------------------------------
+    # Teslim
+    # ------------------------------------------------------
+    def poll(self, tick):
+        """
+        Teslim zamanı gelen sonuçlar: [(sahipler, rota, SearchStats), ...],
+        istek sırasıyla. Sahipsiz kalmış (birleştirilip geçersizleşmiş)
+        aramaların sonucu atılır.
+        """
+        results = []
+        for key, job in list(self.jobs.items()):
+            age = tick - job.tick
+            if self.fixed_delay is not None:
+                if age < self.fixed_delay:
+                    continue
+            elif age < self.min_delay or not job.future.done():
+                continue
+
+            del self.jobs[key]
+            if job.future.cancelled():
+                continue
+            try:
+                path, stats = job.future.result()   # fixed_delay: gerekirse bekler
+            except Exception as e:
+                print("Rota hesaplanamadı:", e)
+                path, stats = (), SearchStats()
+            owners = [o for o in job.owners if self.wanted.get(o) == key]
+            for owner in owners:
+                del self.wanted[owner]
+            if owners:
+                results.append((owners, path, stats))
+                self.delivered += 1
+        return results
@@ -0,0 +1,118 @@
+# Dosya: src/otonom_arac/simulation/profiler.py
+#
+# Kare evresi (phase) profilleyici.
+# Döngünün her evresi (ışıklar, araç güncelleme, yeniden rota, harita çizimi,
+# paneller ...) perf_counter_ns ile ölçülür. Bir evre bir karede birden çok
+# kez çalışabilir (ör. bir karede birkaç simülasyon adımı); kare bitince
+# evrenin o karedeki toplamı, son `window` kareyi tutan halka tampona yazılır.
+# Yüzdelikler (p50/p95/p99) istenince bu pencereden hesaplanır.
+#
+# Kullanım:
+#   prof.frame_begin()
+#   t = prof.clock()
+#   ... işler ...
+#   t = prof.lap("evre", t)      # t'den bu yana geçeni "evre"ye ekler, şimdiyi döndürür
+#   prof.frame_end()
+#
+# pygame gerektirmez; ekranlı ve ekransız koşularda aynı şekilde kullanılır.
+
+import json
+import time
+from array import array
+
+FRAME = "frame"   # karenin tamamı (frame_begin -> frame_end)
+
+
+class FrameProfiler:
+    def __init__(self, window=600):
+        self.window = window
+        self.clock = time.perf_counter_ns
+        self.phases = {}       # evre -> bu karedeki toplam (ns)
+        self.samples = {}      # evre -> array('q') halka tampon
+        self.order = []        # evrelerin ilk görülme sırası (rapor sırası)
+        self.frames = 0
+        self.frame_started = None
+
+    # ------------------------------------------------------
+    # Ölçüm
+    # ------------------------------------------------------
+    def frame_begin(self):
+        self.frame_started = self.clock()
+
+    def lap(self, phase, started):
+        now = self.clock()
+        phases = self.phases
+        if phase in phases:
+            phases[phase] += now - started
+        else:
+            self.add_phase(phase)
+            phases[phase] = now - started
+        return now
+
+    def add_phase(self, phase):
+        self.phases[phase] = 0
+        self.samples[phase] = array("q", bytes(8 * self.window))
+        self.order.append(phase)
+
+    def frame_end(self):
+        if self.frame_started is None:
+            return
+        self.lap(FRAME, self.frame_started)
+        self.frame_started = None
+
+        i = self.frames % self.window
+        samples = self.samples
+        phases = self.phases
+        for phase, total in phases.items():
+            samples[phase][i] = total
+            phases[phase] = 0
+        self.frames += 1
+
+    def reset(self):
+        self.phases = {}
+        self.samples = {}
+        self.order = []
+        self.frames = 0
+        self.frame_started = None
+
+    # ------------------------------------------------------
+    # İstatistik
+    # ------------------------------------------------------
+    def percentiles(self, phase, points=(0.50, 0.95, 0.99)):
+        """Son pencere içindeki kare sürelerinin yüzdelikleri (milisaniye)."""
+        n = min(self.frames, self.window)
+        if n == 0 or phase not in self.samples:
+            return [0.0 for _ in points]
+        values = sorted(self.samples[phase][:n])
+        return [values[min(n - 1, int(p * n))] / 1e6 for p in points]
+
+    def summary(self):
+        """Evre başına {p50, p95, p99, mean} (ms); kare sırası korunur."""
+        n = min(self.frames, self.window)
+        rows = {}
+        for phase in self.order:
+            p50, p95, p99 = self.percentiles(phase)
+            mean = sum(self.samples[phase][:n]) / n / 1e6 if n else 0.0
+            rows[phase] = {"p50": p50, "p95": p95, "p99": p99, "mean": mean}
+        return rows
+
+    def format_summary(self):
+        lines = [
+            f"=== PROFİL (son {min(self.frames, self.window)} / {self.frames} kare, ms) ===",
+            f"{'evre':>22} {'ort.':>8} {'p50':>8} {'p95':>8} {'p99':>8}",
+        ]
+        for phase, row in self.summary().items():
+            lines.append(
+                f"{phase:>22} {row['mean']:8.3f} {row['p50']:8.3f} {row['p95']:8.3f} {row['p99']:8.3f}"
+            )
+        return "\n".join(lines)
+
+    def print_summary(self):
+        if self.frames:
+            print("\n" + self.format_summary() + "\n")
+
+    def dump(self, path):
+        """Özeti JSON olarak yazar."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"frames": self.frames, "window": self.window, "phases": self.summary()},
+                      f, indent=2, ensure_ascii=False)
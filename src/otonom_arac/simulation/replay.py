@@ -0,0 +1,503 @@
+# Dosya: src/otonom_arac/simulation/replay.py
+#
+# Koşu kaydı ve tekrar oynatma.
+# Simülasyon sabit adımlı olduğu için aynı girdiler (harita, algoritma, tohum,
+# filo büyüklüğü, engel ayarları, FPS) her zaman aynı koşuyu üretir. Kayıt bu
+# girdileri ve her adımda DEĞİŞEN durumu (ışık fazları, engeller, rota, ana
+# aracın ve filo araçlarının konumu) küçük bir ikili dosyaya yazar.
+#
+# Dosya düzeni (little-endian):
+#   b"OARP", sürüm (u16), ayrılmış (u16)
+#   u32 + JSON başlık (girdiler), u32 + zlib ile sıkıştırılmış harita kareleri
+#   kareler: her adım için bir bayrak baytı + bayraktaki bölümler
+#       LIGHTS    : u16 n, n x (u16 ışık, u8 kırmızı mı)
+#       OBSTACLES : u16 n, n x u32 eklenen; u16 m, m x u32 kaldırılan (hücre id)
+#       PATH      : u32 n, n x u32 hücre id
+#       CAR       : ana aracın durumu (CAR_STATE)
+#       FLEET     : u32 araç sayısı, u32 k, k x u32 araç, sonra k'lık
+#                   pixel_x (f64), pixel_y (f64), row (i32), col (i32), angle (i16)
+#       KEYFRAME  : durum sıfırlanır, bölümler tam durumu taşır
+#   dizin: b"OARX", u32 adım sayısı, u32 n, n x (u32 adım, u64 konum),
+#          sonda u64 dizin konumu + b"OARX"
+#
+# Değişmeyen bir adım tek bayttır. Her snapshot_every adımda bir tam kare
+# (keyframe) yazılır; ileri/geri sarma en yakın önceki tam kareden başlar.
+#
+# Kullanım (src klasöründen):
+#   python -m otonom_arac.main --headless --algo A* --record ../runs/a_star.oarp
+#   python -m otonom_arac.simulation.replay ../runs/a_star.oarp              # en hızlı oynat
+#   python -m otonom_arac.simulation.replay ../runs/a_star.oarp --verify     # yeniden simüle et, karşılaştır
+#   python -m otonom_arac.main --replay ../runs/a_star.oarp      # pencerede izle
+
+import argparse
+import json
+import struct
+import sys
+import time
+import zlib
+from bisect import bisect_right
+
+import numpy as np
+
+from otonom_arac.car.car_manager import Car
+from otonom_arac.car.fleet import Fleet
+from otonom_arac.map.tilemap import from_bytes
+
+MAGIC = b"OARP"
+INDEX_MAGIC = b"OARX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+U8 = struct.Struct("<B")
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+TRAILER = struct.Struct("<Q4s")
+INDEX_ENTRY = struct.Struct("<IQ")
+
+# pixel_x, pixel_y, row, col, angle, path_index, kırmızıda mı, anlık hız
+CAR_STATE = struct.Struct("<ddiihiBd")
+
+LIGHTS = 1
+OBSTACLES = 2
+PATH = 4
+CAR = 8
+FLEET = 16
+KEYFRAME = 32
+
+FLEET_COLUMNS = (("pixel_x", np.float64), ("pixel_y", np.float64),
+                 ("row", np.int32), ("col", np.int32), ("angle", np.int16))
+
+
+# --------------------------------------------------------
+# Simülasyondan durum okuma (kayıt ve doğrulama ortak kullanır)
+# --------------------------------------------------------
+def light_states(sim):
+    return bytes(1 if tl.state == "RED" else 0 for tl in sim.traffic_lights)
+
+
+def car_state(car):
+    return (float(car.pixel_x), float(car.pixel_y), car.row, car.col, car.angle,
+            car.path_index, 1 if car.is_waiting_red else 0, float(car.current_speed))
+
+
+def path_ids(path, cols):
+    return tuple(r * cols + c for r, c in path)
+
+
+def fleet_arrays(fleet):
+    n = fleet.count
+    return {name: getattr(fleet, name)[:n].copy() for name, _ in FLEET_COLUMNS}
+
+
+def state_of(sim):
+    """Karşılaştırma için simülasyonun çizilen durumu (tuple)."""
+    fleet = b""
+    if sim.fleet is not None:
+        fleet = b"".join(a.tobytes() for a in fleet_arrays(sim.fleet).values())
+    return (
+        light_states(sim),
+        tuple(sorted(sim.occupancy.obstacle_ids)),
+        path_ids(sim.current_path, sim.cols),
+        car_state(sim.car) if sim.car else None,
+        fleet,
+    )
+
+
+# --------------------------------------------------------
+# KAYIT
+# --------------------------------------------------------
+class Recorder:
+    """
+    sim.reset() sonrası oluşturulur; sim.recorder olarak bağlanır ve
+    Simulation.step her adım sonunda record() çağırır.
+    """
+
+    def __init__(self, sim, path, snapshot_every=600):
+        self.sim = sim
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.cols = sim.cols
+        self.tick = 0
+        self.keyframes = []
+        self.file = open(path, "wb", buffering=1 << 20)
+
+        header = json.dumps({
+            "algorithm": sim.selected_algorithm,
+            "fps": round(1.0 / sim.dt),
+            "seed": sim.seed,
+            "fleet_size": sim.fleet_size,
+            "obstacle_delay": sim.obstacle_delay,
+            "obstacle_offset": sim.obstacle_offset,
+            "rows": sim.rows,
+            "cols": sim.cols,
+            "snapshot_every": snapshot_every,
+            "planner": sim.planner.describe() if sim.planner is not None else None,
+        }).encode("utf-8")
+        tiles = sim.map.tobytes() if hasattr(sim.map, "tobytes") else bytes(
+            v for row in sim.map for v in row
+        )
+        tiles = zlib.compress(tiles, 9)
+
+        f = self.file
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+        f.write(U32.pack(len(header)) + header)
+        f.write(U32.pack(len(tiles)) + tiles)
+
+        self.lights = None
+        self.obstacles = None
+        self.path_obj = None
+        self.car = None
+        self.fleet = None
+        self.write_frame(keyframe=True)
+        sim.recorder = self
+
+    def record(self):
+        self.tick += 1
+        self.write_frame(keyframe=self.tick % self.snapshot_every == 0)
+
+    def write_frame(self, keyframe=False):
+        sim = self.sim
+        if keyframe:
+            self.keyframes.append((self.tick, self.file.tell()))
+            self.lights = None
+            self.obstacles = set()
+            self.path_obj = None
+            self.car = None
+            self.fleet = None
+
+        flags = KEYFRAME if keyframe else 0
+        parts = []
+
+        lights = light_states(sim)
+        if lights != self.lights:
+            if self.lights is None:
+                changed = range(len(lights))
+            else:
+                changed = [i for i, (a, b) in enumerate(zip(lights, self.lights)) if a != b]
+            flags |= LIGHTS
+            parts.append(U16.pack(len(changed)))
+            parts.extend(struct.pack("<HB", i, lights[i]) for i in changed)
+            self.lights = lights
+
+        obstacles = set(sim.occupancy.obstacle_ids)
+        if obstacles != self.obstacles:
+            added = sorted(obstacles - self.obstacles)
+            removed = sorted(self.obstacles - obstacles)
+            flags |= OBSTACLES
+            parts.append(struct.pack(f"<H{len(added)}I", len(added), *added))
+            parts.append(struct.pack(f"<H{len(removed)}I", len(removed), *removed))
+            self.obstacles = obstacles
+
+        if sim.current_path is not self.path_obj:
+            cells = path_ids(sim.current_path, self.cols)
+            flags |= PATH
+            parts.append(struct.pack(f"<I{len(cells)}I", len(cells), *cells))
+            self.path_obj = sim.current_path
+
+        car = car_state(sim.car)
+        if car != self.car:
+            flags |= CAR
+            parts.append(CAR_STATE.pack(*car))
+            self.car = car
+
+        if sim.fleet is not None:
+            part = self.fleet_delta(sim.fleet)
+            if part is not None:
+                flags |= FLEET
+                parts.append(part)
+
+        self.file.write(U8.pack(flags))
+        self.file.write(b"".join(parts))
+
+    def fleet_delta(self, fleet):
+        current = fleet_arrays(fleet)
+        prev = self.fleet
+        n = fleet.count
+        if prev is None or len(prev["pixel_x"]) != n:
+            index = np.arange(n, dtype=np.uint32)
+        else:
+            changed = np.zeros(n, dtype=np.bool_)
+            for name, _ in FLEET_COLUMNS:
+                changed |= current[name] != prev[name]
+            index = np.flatnonzero(changed).astype(np.uint32)
+            if len(index) == 0:
+                return None
+        self.fleet = current
+        return b"".join(
+            [U32.pack(n), U32.pack(len(index)), index.tobytes()]
+            + [current[name][index].tobytes() for name, _ in FLEET_COLUMNS]
+        )
+
+    def close(self):
+        if self.file.closed:
+            return
+        f = self.file
+        index_offset = f.tell()
+        f.write(INDEX_MAGIC)
+        f.write(U32.pack(self.tick) + U32.pack(len(self.keyframes)))
+        for entry in self.keyframes:
+            f.write(INDEX_ENTRY.pack(*entry))
+        f.write(TRAILER.pack(index_offset, INDEX_MAGIC))
+        f.close()
+        if self.sim.recorder is self:
+            self.sim.recorder = None
+
+
+# --------------------------------------------------------
+# OYNATMA
+# --------------------------------------------------------
+class Replay:
+    """
+    Kaydı okuyup `sim` içindeki durumu adım adım yeniden kurar. sim gerçek bir
+    Simulation nesnesidir ama step() çağrılmaz; pygame görüntüleyicisi onu
+    canlı koşu gibi çizer.
+    """
+
+    def __init__(self, path):
+        from otonom_arac.simulation.engine import Simulation
+
+        with open(path, "rb") as f:
+            self.data = f.read()
+        data = self.data
+
+        magic, version, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Geçersiz kayıt dosyası: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+        pos = HEADER.size
+        (length,) = U32.unpack_from(data, pos)
+        self.header = json.loads(data[pos + 4:pos + 4 + length])
+        pos += 4 + length
+        (length,) = U32.unpack_from(data, pos)
+        h = self.header
+        tiles = zlib.decompress(data[pos + 4:pos + 4 + length])
+        self.game_map = from_bytes(h["rows"], h["cols"], tiles)
+        self.frames_start = pos + 4 + length
+
+        self.end, self.tick_count, self.keyframes = self.read_index()
+
+        sim = Simulation(
+            self.game_map, fps=h["fps"], obstacle_delay=h["obstacle_delay"], verbose=False,
+            fleet_size=h["fleet_size"], seed=h["seed"], obstacle_offset=h["obstacle_offset"],
+        )
+        sim.selected_algorithm = h["algorithm"]
+        sim.car = Car(0, 0)
+        self.sim = sim
+        self.cols = h["cols"]
+        self.seek(0)
+
+    def read_index(self):
+        """Dizin varsa okur; kayıt yarıda kaldıysa (dizin yok) kareleri tarayarak kurar."""
+        data = self.data
+        if len(data) >= self.frames_start + TRAILER.size:
+            index_offset, magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+            if magic == INDEX_MAGIC and data[index_offset:index_offset + 4] == INDEX_MAGIC:
+                ticks, count = struct.unpack_from("<II", data, index_offset + 4)
+                keyframes = [
+                    INDEX_ENTRY.unpack_from(data, index_offset + 12 + i * INDEX_ENTRY.size)
+                    for i in range(count)
+                ]
+                return index_offset, ticks, keyframes
+
+        keyframes = []
+        pos, tick = self.frames_start, 0
+        while pos < len(data):
+            try:
+                flags = data[pos]
+                end = self.apply_frame(pos, apply=False)
+            except (struct.error, IndexError, ValueError):
+                break   # yarım yazılmış son kare
+            if flags & KEYFRAME:
+                keyframes.append((tick, pos))
+            pos = end
+            tick += 1
+        return pos, tick - 1, keyframes
+
+    # ------------------------------------------------------
+    def apply_frame(self, pos, apply=True):
+        """pos'taki kareyi okur (apply ise sim'e uygular); sonraki karenin konumunu döndürür."""
+        data = self.data
+        sim = self.sim if apply else None
+        flags = data[pos]
+        pos += 1
+
+        if apply and flags & KEYFRAME:
+            sim.occupancy.clear_obstacles()
+
+        if flags & LIGHTS:
+            (n,) = U16.unpack_from(data, pos)
+            pos += 2
+            for _ in range(n):
+                i, red = struct.unpack_from("<HB", data, pos)
+                pos += 3
+                if apply:
+                    tl = sim.traffic_lights[i]
+                    tl.state = "RED" if red else "GREEN"
+
+        if flags & OBSTACLES:
+            (n,) = U16.unpack_from(data, pos)
+            added = struct.unpack_from(f"<{n}I", data, pos + 2)
+            pos += 2 + 4 * n
+            (m,) = U16.unpack_from(data, pos)
+            removed = struct.unpack_from(f"<{m}I", data, pos + 2)
+            pos += 2 + 4 * m
+            if apply:
+                for cid in removed:
+                    sim.occupancy.remove_obstacle(divmod(cid, self.cols))
+                for cid in added:
+                    sim.occupancy.add_obstacle(divmod(cid, self.cols))
+
+        if flags & PATH:
+            (n,) = U32.unpack_from(data, pos)
+            cells = struct.unpack_from(f"<{n}I", data, pos + 4)
+            pos += 4 + 4 * n
+            if apply:
+                path = tuple(divmod(cid, self.cols) for cid in cells)
+                sim.current_path = path
+                sim.car.path = path
+
+        if flags & CAR:
+            values = CAR_STATE.unpack_from(data, pos)
+            pos += CAR_STATE.size
+            if apply:
+                car = sim.car
+                (car.pixel_x, car.pixel_y, car.row, car.col, car.angle,
+                 car.path_index, waiting, car.current_speed) = values
+                car.is_waiting_red = bool(waiting)
+
+        if flags & FLEET:
+            n, k = struct.unpack_from("<II", data, pos)
+            pos += 8
+            index = np.frombuffer(data, dtype=np.uint32, count=k, offset=pos)
+            pos += 4 * k
+            fleet = self.ensure_fleet(n) if apply else None
+            for name, dtype in FLEET_COLUMNS:
+                values = np.frombuffer(data, dtype=dtype, count=k, offset=pos)
+                pos += values.nbytes
+                if apply:
+                    getattr(fleet, name)[index] = values
+
+        return pos
+
+    def ensure_fleet(self, count):
+        sim = self.sim
+        if sim.fleet is None or sim.fleet.count != count:
+            fleet = Fleet(self.game_map)
+            fleet.allocate(max(count, 1))
+            fleet.count = count
+            sim.fleet = fleet
+        return sim.fleet
+
+    # ------------------------------------------------------
+    # Gezinme
+    # ------------------------------------------------------
+    def seek(self, tick):
+        """tick adımındaki duruma gider (en yakın önceki tam kareden ileri sarar)."""
+        tick = max(0, min(tick, self.tick_count))
+        i = bisect_right(self.keyframes, (tick, float("inf"))) - 1
+        key_tick, pos = self.keyframes[max(i, 0)]
+
+        sim = self.sim
+        sim.fleet = None
+        self.tick = key_tick
+        self.pos = self.apply_frame(pos)
+        while self.tick < tick:
+            self.step()
+        self.sync_clock()
+
+    def step(self):
+        """Bir sonraki adımı uygular; kayıt bittiyse False."""
+        if self.tick >= self.tick_count or self.pos >= self.end:
+            return False
+        self.pos = self.apply_frame(self.pos)
+        self.tick += 1
+        self.sync_clock()
+        return True
+
+    def sync_clock(self):
+        sim = self.sim
+        sim.tick_count = self.tick
+        sim.time_in_game = self.tick * sim.dt
+
+    def run(self):
+        while self.step():
+            pass
+
+
+# --------------------------------------------------------
+# Doğrulama: girdilerden yeniden simüle et, her adımı karşılaştır
+# --------------------------------------------------------
+def verify(replay, max_ticks=None):
+    """Uyuşmayan ilk adımı döndürür; koşu birebir aynıysa None."""
+    from otonom_arac.simulation.engine import Simulation
+
+    h = replay.header
+    sim = Simulation(
+        replay.game_map, fps=h["fps"], obstacle_delay=h["obstacle_delay"], verbose=False,
+        fleet_size=h["fleet_size"], seed=h["seed"], obstacle_offset=h["obstacle_offset"],
+    )
+    planner = None
+    if h.get("planner"):
+        # Arka plan rotalarıyla alınmış kayıt: aynı teslim gecikmesiyle yeniden kurulur
+        from otonom_arac.simulation.planner_service import PlanningService
+
+        planner = PlanningService(replay.game_map, pathfinder=sim.pathfinder, **h["planner"])
+        planner.start()
+        sim.planner = planner
+    sim.reset(h["algorithm"])
+
+    replay.seek(0)
+    last = replay.tick_count if max_ticks is None else min(max_ticks, replay.tick_count)
+    try:
+        while True:
+            if state_of(sim) != state_of(replay.sim):
+                return replay.tick
+            if replay.tick >= last:
+                return None
+            sim.step()
+            replay.step()
+    finally:
+        if planner is not None:
+            planner.shutdown()
+
+
+# --------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıtlı koşuyu tekrar oynatır")
+    parser.add_argument("path")
+    parser.add_argument("--verify", action="store_true",
+                        help="Kayıttaki girdilerle yeniden simüle edip her adımı karşılaştırır")
+    parser.add_argument("--seek", type=int, default=None, help="Bu adıma atla ve durumu yazdır")
+    args = parser.parse_args(argv)
+
+    replay = Replay(args.path)
+    h = replay.header
+    print(f"{args.path}: {h['algorithm']}, {replay.tick_count} adım, "
+          f"{len(replay.keyframes)} tam kare, {len(replay.data)} bayt")
+
+    if args.verify:
+        planner = h.get("planner")
+        if planner and planner["fixed_delay"] is None:
+            print("⚠️ Kayıt sabit gecikmesiz arka plan rotalarıyla alınmış; "
+                  "teslim adımları işçi hızına bağlı olduğundan ayrışma beklenebilir.")
+        mismatch = verify(replay)
+        if mismatch is None:
+            print("✅ Yeniden simülasyon kayıtla birebir aynı.")
+            return 0
+        print(f"❌ {mismatch}. adımda ayrışma.")
+        return 1
+
+    started = time.perf_counter()
+    if args.seek is not None:
+        replay.seek(args.seek)
+    else:
+        replay.run()
+    elapsed = time.perf_counter() - started
+    car = replay.sim.car
+    print(f"Adım {replay.tick}: araç ({car.row}, {car.col}), "
+          f"engeller {list(replay.sim.occupancy)}  ({elapsed * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+# Dosya: src/otonom_arac/simulation/sweep.py
+#
+# Toplu senaryo koşucusu.
+# Algoritma x harita x engel gecikmesi x engel konumu x tohum x filo büyüklüğü
+# matrisinin her satırını ekransız Simulation ile koşturur. Senaryolar tüm
+# çekirdekleri kullanan bir süreç havuzuna dağıtılır; her biten senaryo
+# sonucu beklemeden CSV dosyasına yazılır (uzun gece koşularında yarıda
+# kalsa bile o ana kadarki sonuçlar kaybolmaz). Sonda algoritma/harita
+# başına özet tablo yazdırılır.
+#
+# Tohum yalnızca filo başlangıç konumlarını belirler; engel konumu ve gecikmesi
+# kendi eksenleridir. Filosuz (fleet_size=0) senaryolar bu yüzden tek tohumla
+# (--seeds'in ilki) koşturulur.
+#
+# Harita tanımları:
+#   campus            -> gömülü harita (map/maps/campus.map)
+#   city_200x200      -> map_generator ile üretilen şehir (tohum 0)
+#   city_200x200@3    -> aynı boyut, harita tohumu 3
+#   yol/harita.map    -> ikili harita dosyası
+#
+# Kullanım (src klasöründen):
+#   python -m otonom_arac.simulation.sweep --algos BFS A* --seeds 0 1 2 --output ../sweeps/run.csv
+#   python -m otonom_arac.simulation.sweep --maps campus city_200x200 --obstacle-delays none 3 6 \
+#       --obstacle-offsets 4 6 10 --fleet-sizes 0 100 --workers 32
+
+import argparse
+import csv
+import itertools
+import os
+import statistics
+import sys
+import time
+from multiprocessing import Pool
+
+from otonom_arac.algorithms.pathfinding import ALGORITHMS
+
+RESULT_FIELDS = [
+    "algorithm", "map", "obstacle_delay", "obstacle_offset", "seed", "fleet_size",
+    "found", "finished", "ticks", "sim_time", "wall_time", "path_length",
+    "replans", "red_wait_frames", "planner_ms", "nodes_expanded", "obstacle_cell", "fleet_count", "fleet_arrived", "error",
+]
+
+# Süreç başına yüklenmiş haritalar (aynı haritayı her senaryoda yeniden üretmemek için)
+_MAP_CACHE = {}
+
+
+def load_map_spec(spec):
+    game_map = _MAP_CACHE.get(spec)
+    if game_map is not None:
+        return game_map
+
+    from otonom_arac.map.tilemap import from_rows, load_builtin_map, load_map
+
+    if spec.endswith(".map"):
+        game_map = load_map(spec)
+    elif spec.startswith("city_"):
+        from otonom_arac.map.map_generator import generate_city_map
+
+        size, _, map_seed = spec[len("city_"):].partition("@")
+        cols, rows = (int(v) for v in size.lower().split("x"))
+        game_map = from_rows(generate_city_map(rows, cols, seed=int(map_seed or 0)))
+    else:
+        game_map = load_builtin_map(spec)
+
+    _MAP_CACHE[spec] = game_map
+    return game_map
+
+
+def parse_delay(text):
+    return None if text.lower() == "none" else float(text)
+
+
+def build_scenarios(algorithms, maps, delays, offsets, seeds, fleet_sizes):
+    """Matrisin bütün kombinasyonları (sözlük listesi)."""
+    scenarios = []
+    for algorithm, map_spec, delay, offset, seed, fleet_size in itertools.product(
+        algorithms, maps, delays, offsets, seeds, fleet_sizes
+    ):
+        # Engel yoksa konum anlamsız: tek bir satır yeter
+        if delay is None and offset != offsets[0]:
+            continue
+        # Tohum sadece filo başlangıçlarını belirler (engel konumu ve gecikmesi
+        # sabittir); filo yoksa tohumlar aynı koşuyu tekrarlar, ilki yeter
+        if fleet_size == 0 and seed != seeds[0]:
+            continue
+        scenarios.append({
+            "algorithm": algorithm,
+            "map": map_spec,
+            "obstacle_delay": delay,
+            "obstacle_offset": offset,
+            "seed": seed,
+            "fleet_size": fleet_size,
+        })
+    return scenarios
+
+
+# --------------------------------------------------------
+# Tek senaryo (işçi süreçte çalışır)
+# --------------------------------------------------------
+def run_scenario(scenario, max_ticks=100000):
+    from otonom_arac.simulation.engine import Simulation
+
+    result = dict.fromkeys(RESULT_FIELDS)
+    result.update(scenario)
+    started = time.perf_counter()
+    try:
+        sim = Simulation(
+            load_map_spec(scenario["map"]),
+            obstacle_delay=scenario["obstacle_delay"],
+            obstacle_offset=scenario["obstacle_offset"],
+            verbose=False,
+            fleet_size=scenario["fleet_size"],
+            seed=scenario["seed"],
+        )
+        result["found"] = sim.reset(scenario["algorithm"])
+        if result["found"]:
+            sim.run(max_ticks)
+            result["finished"] = sim.finished
+            result["ticks"] = sim.tick_count
+            result["sim_time"] = round(sim.time_in_game, 4)
+            result["path_length"] = sim.metrics.total_distance
+            result["replans"] = sim.replan_count
+            result["red_wait_frames"] = sim.metrics.red_wait_frames
+            result["planner_ms"] = round(sim.metrics.planner_time * 1000.0, 4)
+            result["nodes_expanded"] = sim.metrics.nodes_expanded
+            result["obstacle_cell"] = (
+                f"{sim.obstacle_cell[0]}:{sim.obstacle_cell[1]}" if sim.obstacle_cell else ""
+            )
+            if sim.fleet is not None:
+                result["fleet_count"] = sim.fleet.count
+                result["fleet_arrived"] = int(sim.fleet.arrived().sum())
+    except Exception as e:  # tek senaryonun hatası bütün koşuyu durdurmasın
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["wall_time"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def _run_scenario_args(args):
+    return run_scenario(*args)
+
+
+# --------------------------------------------------------
+# Havuz + CSV akışı
+# --------------------------------------------------------
+def run_sweep(scenarios, output, workers=None, max_ticks=100000, verbose=True):
+    """Senaryoları paralel koşturur, sonuçları bittikçe output'a yazar; sonuç listesini döndürür."""
+    workers = workers or os.cpu_count() or 1
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    results = []
+    started = time.perf_counter()
+    chunksize = max(1, len(scenarios) // (workers * 8))
+    jobs = [(scenario, max_ticks) for scenario in scenarios]
+
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+
+        with Pool(processes=workers) as pool:
+            for done, result in enumerate(
+                pool.imap_unordered(_run_scenario_args, jobs, chunksize=chunksize), 1
+            ):
+                writer.writerow(result)
+                f.flush()
+                results.append(result)
+                if verbose and (done % 50 == 0 or done == len(jobs)):
+                    elapsed = time.perf_counter() - started
+                    print(f"{done}/{len(jobs)} senaryo  ({elapsed:.1f} sn)")
+
+    return results
+
+
+def summarize(results):
+    """(algoritma, harita) başına ortalama değerler."""
+    groups = {}
+    for result in results:
+        groups.setdefault((result["algorithm"], result["map"]), []).append(result)
+
+    rows = []
+    for (algorithm, map_spec), group in sorted(groups.items()):
+        ok = [r for r in group if r["finished"]]
+        rows.append({
+            "algorithm": algorithm,
+            "map": map_spec,
+            "runs": len(group),
+            "finished": len(ok),
+            "errors": sum(1 for r in group if r["error"]),
+            "mean_ticks": statistics.mean(r["ticks"] for r in ok) if ok else None,
+            "mean_path_length": statistics.mean(r["path_length"] for r in ok) if ok else None,
+            "mean_replans": statistics.mean(r["replans"] for r in ok) if ok else None,
+            "mean_wall_time": statistics.mean(r["wall_time"] for r in group),
+        })
+    return rows
+
+
+def print_summary(rows):
+    print("\n=== ÖZET ===")
+    for row in rows:
+        ticks = f"{row['mean_ticks']:.1f}" if row["mean_ticks"] is not None else "-"
+        length = f"{row['mean_path_length']:.1f}" if row["mean_path_length"] is not None else "-"
+        print(
+            f"{row['algorithm']:>16} {row['map']:>16}"
+            f"  koşu={row['runs']:<5} biten={row['finished']:<5} hata={row['errors']:<3}"
+            f"  ort. kare={ticks:>9}  ort. yol={length:>8}"
+            f"  ort. süre={row['mean_wall_time']:.3f} sn"
+        )
+
+
+# --------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toplu senaryo koşucusu")
+    parser.add_argument("--algos", nargs="*", default=["BFS", "DFS", "A*"],
+                        choices=list(ALGORITHMS))
+    parser.add_argument("--maps", nargs="*", default=["campus"])
+    parser.add_argument("--obstacle-delays", nargs="*", type=parse_delay, default=[6.0],
+                        help="Engel gecikmeleri (saniye); 'none' = engelsiz koşu")
+    parser.add_argument("--obstacle-offsets", nargs="*", type=int, default=[6],
+                        help="Engelin aracın kaç kare önüne konacağı")
+    parser.add_argument("--seeds", nargs="*", type=int, default=[0])
+    parser.add_argument("--fleet-sizes", nargs="*", type=int, default=[0])
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Süreç sayısı (varsayılan: tüm çekirdekler)")
+    parser.add_argument("--max-ticks", type=int, default=100000)
+    parser.add_argument("--output", default="sweep_results.csv")
+    args = parser.parse_args(argv)
+
+    scenarios = build_scenarios(
+        args.algos, args.maps, args.obstacle_delays, args.obstacle_offsets,
+        args.seeds, args.fleet_sizes
+    )
+    print(f"{len(scenarios)} senaryo, çıktı: {args.output}")
+    results = run_sweep(scenarios, args.output, args.workers, args.max_ticks)
+    print_summary(summarize(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
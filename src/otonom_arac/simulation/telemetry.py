@@ -0,0 +1,162 @@
+# Dosya: src/otonom_arac/simulation/telemetry.py
+#
+# Kare başına telemetri.
+# Örnekler önceden ayrılmış numpy halka tamponlarına (ring buffer) yazılır:
+# kayıt sırasında bellek ayrılmaz, dosyaya yazılmaz. Tampon dolunca en eski
+# örneklerin üzerine yazılır. Dışa aktarma koşu sonunda tek seferde yapılır:
+#   - .jsonl : satır başına bir örnek (okunabilir, araçlarla kolay işlenir)
+#   - .npz   : sütun başına bir dizi (küçük, numpy/pandas ile hızlı açılır)
+#
+# İki tampon var:
+#   ticks : her simülasyon adımı (konum, hız, kırmızıda bekleme, rota ilerleyişi)
+#   plans : her rota hesabı (ilk rota, engel sonrası yeniden rota, filo rotaları)
+
+import json
+
+import numpy as np
+
+# Rota hesabı türleri (plans tamponundaki "kind" sütunu)
+PLAN_INITIAL = 0
+PLAN_REPLAN = 1
+PLAN_FLEET = 2
+PLAN_KINDS = ("initial", "replan", "fleet")
+
+TICK_FIELDS = (
+    ("tick", np.int32),
+    ("sim_time", np.float64),
+    ("row", np.int32),
+    ("col", np.int32),
+    ("pixel_x", np.float32),
+    ("pixel_y", np.float32),
+    ("speed", np.float32),
+    ("waiting_red", np.uint8),
+    ("path_index", np.int32),
+    ("replans", np.int32),
+)
+
+PLAN_FIELDS = (
+    ("tick", np.int32),
+    ("kind", np.uint8),
+    ("found", np.uint8),
+    ("cached", np.uint8),
+    ("elapsed_ms", np.float64),
+    ("nodes_expanded", np.int32),
+    ("pushes", np.int32),
+    ("peak_frontier", np.int32),
+    ("path_length", np.int32),
+)
+
+
+class RingBuffer:
+    """Sabit kapasiteli, sütun-öncelikli kayıt tamponu."""
+
+    def __init__(self, fields, capacity):
+        self.capacity = capacity
+        self.names = [name for name, _ in fields]
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields}
+        self.total = 0   # bugüne kadar yazılan örnek sayısı (düşenler dahil)
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def dropped(self):
+        return max(0, self.total - self.capacity)
+
+    def append(self, values):
+        """values: names ile aynı sırada değerler."""
+        i = self.total % self.capacity
+        columns = self.columns
+        for name, value in zip(self.names, values):
+            columns[name][i] = value
+        self.total += 1
+
+    def clear(self):
+        self.total = 0
+
+    def column(self, name):
+        """Sütunun eski -> yeni sıralı kopyası."""
+        data = self.columns[name]
+        if self.total <= self.capacity:
+            return data[:self.total].copy()
+        split = self.total % self.capacity
+        return np.concatenate((data[split:], data[:split]))
+
+    def as_columns(self):
+        return {name: self.column(name) for name in self.names}
+
+
+class Telemetry:
+    def __init__(self, tick_capacity=65536, plan_capacity=4096):
+        self.ticks = RingBuffer(TICK_FIELDS, tick_capacity)
+        self.plans = RingBuffer(PLAN_FIELDS, plan_capacity)
+        self.meta = {}
+
+    def clear(self, **meta):
+        self.ticks.clear()
+        self.plans.clear()
+        self.meta = meta
+
+    # ------------------------------------------------------
+    # Kayıt
+    # ------------------------------------------------------
+    def record_tick(self, tick, sim_time, car, replans):
+        self.ticks.append((
+            tick, sim_time, car.row, car.col, car.pixel_x, car.pixel_y,
+            car.current_speed, car.is_waiting_red, car.path_index, replans,
+        ))
+
+    def record_plan(self, tick, kind, stats):
+        self.plans.append((
+            tick, kind, stats.found, stats.cached, stats.elapsed * 1000.0,
+            stats.nodes_expanded, stats.pushes, stats.peak_frontier, stats.path_length,
+        ))
+
+    # ------------------------------------------------------
+    # Dışa aktarma (tek seferde)
+    # ------------------------------------------------------
+    def export(self, path):
+        """Uzantıya göre .jsonl veya .npz yazar."""
+        if path.endswith(".npz"):
+            self.export_npz(path)
+        else:
+            self.export_jsonl(path)
+
+    def export_npz(self, path):
+        arrays = {"tick_" + k: v for k, v in self.ticks.as_columns().items()}
+        arrays.update({"plan_" + k: v for k, v in self.plans.as_columns().items()})
+        meta = dict(self.meta, dropped_ticks=self.ticks.dropped, dropped_plans=self.plans.dropped)
+        arrays["meta"] = np.array(json.dumps(meta))
+        np.savez_compressed(path, **arrays)
+
+    def export_jsonl(self, path):
+        lines = [json.dumps(dict(
+            self.meta, type="meta",
+            dropped_ticks=self.ticks.dropped, dropped_plans=self.plans.dropped,
+        ))]
+        lines += self.rows("tick", self.ticks)
+        lines += self.rows("plan", self.plans)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def rows(kind, buffer):
+        columns = buffer.as_columns()
+        names = buffer.names
+        # tolist() numpy sayılarını Python sayılarına çevirir (json için)
+        values = zip(*(columns[name].tolist() for name in names))
+        if kind == "plan":
+            return [
+                json.dumps(dict(zip(names, row), type=kind, kind=PLAN_KINDS[row[1]]))
+                for row in values
+            ]
+        return [json.dumps(dict(zip(names, row), type=kind)) for row in values]
+
+
+def load_npz(path):
+    """export_npz çıktısını (ticks, plans, meta) sözlükleri olarak açar."""
+    with np.load(path) as data:
+        ticks = {k[5:]: data[k] for k in data.files if k.startswith("tick_")}
+        plans = {k[5:]: data[k] for k in data.files if k.startswith("plan_")}
+        meta = json.loads(str(data["meta"]))
+    return ticks, plans, meta
@@ -0,0 +1,3 @@
+# Dosya: src/otonom_arac/ui/__init__.py
+# pygame ile çizim katmanı (pencere, menü, harita/araç çizimi, görseller).
+# İsteğe bağlıdır: pip install ".[viewer]"
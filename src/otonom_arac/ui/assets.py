@@ -0,0 +1,195 @@
+# Dosya: src/otonom_arac/ui/assets.py
+#
+# Görsel ve ses yükleme.
+# Bütün kare görselleri (yollar, duvar, su, başlangıç/hedef, yaya geçidi,
+# ışık direği, engel) TILE_SIZE'a ölçeklenip tek bir dokuya (atlas) dizilir.
+# Atlas diske önbelleğe yazılır; dosya adı, kaynak PNG'lerin içerik özetini
+# (hash) ve kare boyutunu içerir. Görseller değişmedikçe açılışta ~20 PNG
+# yerine tek bir PNG okunur. Atlas ekran biçimine bir kez çevrilir:
+# saydam karesi olmayan görseller convert(), olanlar convert_alpha() ile;
+# her kare atlasın bir alt yüzeyidir (subsurface), blit sırasında biçim
+# dönüşümü yapılmaz.
+#
+# Müzik ve menü arka planı gibi ilk karede gerekmeyen dosyalar arka planda
+# (iş parçacığında) yüklenir; pencere onları beklemeden açılır.
+
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from otonom_arac.simulation.settings import TILE_SIZE
+
+# src/assets: çalışma klasöründen bağımsız (kurulu pakette de aynı yerde)
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+ATLAS_VERSION = 1
+
+# Atlas anahtarı -> dosya adı (anahtarlar map_layer ve Game'in kullandığı adlar)
+TILE_ASSETS = {
+    "v": "road_v.png", "h": "road_h.png",
+    "ur": "road_ur.png", "rd": "road_rd.png",
+    "dl": "road_dl.png", "lu": "road_lu.png",
+    "t_up": "road_t_up.png", "t_down": "road_t_down.png",
+    "t_left": "road_t_left.png", "t_right": "road_t_right.png",
+    "cross": "road_cross.png",
+    1: "wall.png", 2: "water.png",
+    3: "start.png", 4: "target.png",
+    7: "crosswalk.png",                      # Yaya geçidi ana zemini
+    "traffic_light_img": "traffic_light.png",  # Işık direği
+    "obstacle": "obstacle.png",
+}
+
+
+class AssetManager:
+    def __init__(self, assets_dir=ASSETS_DIR, tile_size=TILE_SIZE, cache_dir=None):
+        self.assets_dir = assets_dir
+        self.tile_size = tile_size
+        self.cache_dir = cache_dir or os.path.join(assets_dir, ".cache")
+        self.executor = None
+        self.pending = {}
+
+    # ------------------------------------------------------
+    # ATLAS
+    # ------------------------------------------------------
+    def present_assets(self):
+        """
+        Diskte bulunan (anahtar, dosya yolu) çiftleri, TILE_ASSETS sırasıyla.
+        create_assets.py bu kare boyutu için assets/<boyut>/ altına çizim
+        yaptıysa o dosyalar ölçeklenmeden kullanılır.
+        """
+        sized_dir = os.path.join(self.assets_dir, str(self.tile_size))
+        items = []
+        for key, filename in TILE_ASSETS.items():
+            for directory in (sized_dir, self.assets_dir):
+                path = os.path.join(directory, filename)
+                if os.path.exists(path):
+                    items.append((key, path))
+                    break
+        return items
+
+    def content_hash(self, items):
+        digest = hashlib.sha1(f"{ATLAS_VERSION}:{self.tile_size}".encode())
+        for key, path in items:
+            digest.update(f"{key!r}:{path}".encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    def atlas_paths(self, items):
+        name = f"atlas_{self.tile_size}_{self.content_hash(items)}"
+        base = os.path.join(self.cache_dir, name)
+        return base + ".png", base + ".json"
+
+    def load_tiles(self):
+        """{anahtar: Surface} sözlüğü; mümkünse diskteki atlastan."""
+        items = self.present_assets()
+        if not items:
+            return {}
+        image_path, layout_path = self.atlas_paths(items)
+
+        atlas = layout = None
+        if os.path.exists(image_path) and os.path.exists(layout_path):
+            try:
+                atlas = pygame.image.load(image_path)
+                with open(layout_path, encoding="utf-8") as f:
+                    layout = json.load(f)
+            except (pygame.error, OSError, ValueError):
+                atlas = layout = None
+
+        if atlas is None:
+            atlas, layout = self.build_atlas(items)
+            self.save_atlas(atlas, layout, image_path, layout_path)
+
+        return self.split_atlas(atlas, layout)
+
+    def build_atlas(self, items):
+        """PNG'leri kare boyutuna ölçekleyip tek bir RGBA yüzeye dizer."""
+        T = self.tile_size
+        columns = math.ceil(math.sqrt(len(items)))
+        rows = math.ceil(len(items) / columns)
+        atlas = pygame.Surface((columns * T, rows * T), pygame.SRCALPHA, 32)
+
+        layout = []
+        for i, (key, path) in enumerate(items):
+            image = pygame.transform.scale(pygame.image.load(path), (T, T))
+            x, y = (i % columns) * T, (i // columns) * T
+            # Boş (0) hedefe toplama: pikseller alfa karıştırılmadan aynen kopyalanır
+            atlas.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+            alpha = bool(image.get_flags() & pygame.SRCALPHA)
+            layout.append({"key": key, "x": x, "y": y, "alpha": alpha})
+        return atlas, layout
+
+    def save_atlas(self, atlas, layout, image_path, layout_path):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(atlas, image_path)
+            with open(layout_path, "w", encoding="utf-8") as f:
+                json.dump(layout, f)
+        except (pygame.error, OSError) as e:
+            print("Atlas önbelleğe yazılamadı:", e)
+
+    def split_atlas(self, atlas, layout):
+        T = self.tile_size
+        opaque = transparent = atlas
+        if pygame.display.get_surface() is not None:
+            opaque = atlas.convert()
+            transparent = atlas.convert_alpha()
+
+        tiles = {}
+        for entry in layout:
+            source = transparent if entry["alpha"] else opaque
+            tiles[entry["key"]] = source.subsurface((entry["x"], entry["y"], T, T))
+        return tiles
+
+    # ------------------------------------------------------
+    # ARKA PLAN YÜKLEME
+    # ------------------------------------------------------
+    def load_in_background(self, name, function, *args):
+        """function(*args) bir iş parçacığında çalışır; sonuç ready(name) ile alınır."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="assets")
+        self.pending[name] = self.executor.submit(function, *args)
+
+    def ready(self, name):
+        """Yükleme bittiyse sonucu (hata olduysa None) döndürür ve kaydı siler; bitmediyse None."""
+        future = self.pending.get(name)
+        if future is None or not future.done():
+            return None
+        del self.pending[name]
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"{name} yüklenemedi:", e)
+            return None
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ------------------------------------------------------
+# Arka planda çalışan yükleyiciler
+# ------------------------------------------------------
+def load_scaled_image(path, size):
+    """Görseli okuyup size boyutuna ölçekler (ekran biçimine çevirme ana iş parçacığında)."""
+    if not os.path.exists(path):
+        return None
+    return pygame.transform.scale(pygame.image.load(path), size)
+
+
+def start_music(path, volume=0.4):
+    """Mikseri başlatır ve müziği sonsuz döngüde çalar."""
+    try:
+        pygame.mixer.init()
+        if not os.path.exists(path):
+            print("Müzik dosyası bulunamadı:", path)
+            return False
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)  # 0.0 - 1.0 arası
+        pygame.mixer.music.play(-1)            # -1 = sonsuz döngü
+        return True
+    except Exception as e:
+        print("Müzik başlatılamadı:", e)
+        return False
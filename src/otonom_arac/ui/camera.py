@@ -0,0 +1,64 @@
+# Dosya: src/otonom_arac/ui/camera.py
+#
+# Kamera / görüş alanı.
+# Dünya (harita) piksel koordinatlarında, ekranın sol üst köşesinin
+# dünyadaki yerini tutar. Harita pencereden küçükse kamera (0, 0)'da kalır.
+
+
+class Camera:
+    def __init__(self, view_width, view_height, world_width, world_height):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = 0.0
+        self.y = 0.0
+        self.following = True  # False iken oklarla serbest gezinilir
+
+    # ------------------------------------------------------
+    @property
+    def offset(self):
+        """Dünya -> ekran dönüşümünde çıkarılacak tamsayı piksel kayması."""
+        return int(self.x), int(self.y)
+
+    def clamp(self):
+        self.x = min(max(self.x, 0.0), max(0, self.world_width - self.view_width))
+        self.y = min(max(self.y, 0.0), max(0, self.world_height - self.view_height))
+
+    def center_on(self, px, py):
+        self.x = px - self.view_width / 2
+        self.y = py - self.view_height / 2
+        self.clamp()
+
+    def follow(self, px, py, smoothing=0.2):
+        """(px, py) dünya noktasını ekran ortasına doğru yumuşakça çeker."""
+        target_x = px - self.view_width / 2
+        target_y = py - self.view_height / 2
+        self.x += (target_x - self.x) * smoothing
+        self.y += (target_y - self.y) * smoothing
+        self.clamp()
+
+    def pan(self, dx, dy):
+        self.x += dx
+        self.y += dy
+        self.clamp()
+
+    # ------------------------------------------------------
+    def world_to_screen(self, px, py):
+        ox, oy = self.offset
+        return px - ox, py - oy
+
+    def screen_to_world(self, sx, sy):
+        ox, oy = self.offset
+        return sx + ox, sy + oy
+
+    def visible_tiles(self, tile_size, margin=1):
+        """Ekrana giren kare aralığı: (ilk satır, son satır + 1, ilk sütun, son sütun + 1)."""
+        ox, oy = self.offset
+        rows = (self.world_height + tile_size - 1) // tile_size
+        cols = (self.world_width + tile_size - 1) // tile_size
+        r0 = max(0, oy // tile_size - margin)
+        c0 = max(0, ox // tile_size - margin)
+        r1 = min(rows, (oy + self.view_height) // tile_size + 1 + margin)
+        c1 = min(cols, (ox + self.view_width) // tile_size + 1 + margin)
+        return r0, r1, c0, c1
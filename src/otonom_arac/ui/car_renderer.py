@@ -0,0 +1,66 @@
+# Dosya: src/otonom_arac/ui/car_renderer.py
+import pygame
+import os
+from otonom_arac.simulation.settings import *
+from otonom_arac.ui.assets import ASSETS_DIR
+
+# Araç yalnızca bu açılara dönebilir (Car.update)
+HEADINGS = (0, 90, 180, -90)
+
+# (görsel yolu, kare boyutu) -> {açı: önceden döndürülmüş Surface}
+# Aynı görseli kullanan bütün araçlar aynı Surface'leri paylaşır.
+_SPRITE_CACHE = {}
+
+
+def load_car_image(asset_path, tile_size):
+    """Araç görselini yükler ve kare boyutuna ölçekler; yoksa kırmızı kare döner."""
+    try:
+        image = pygame.image.load(asset_path)
+    except FileNotFoundError:
+        image = pygame.Surface((tile_size, tile_size))
+        image.fill((255, 0, 0))
+
+    # Boyutlandır
+    image = pygame.transform.scale(image, (tile_size, tile_size))
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    return image
+
+
+def get_rotated_sprites(asset_path=None, tile_size=TILE_SIZE):
+    """Her yön için döndürülmüş araç görselleri; ilk çağrıda bir kez oluşturulur."""
+    if asset_path is None:
+        asset_path = os.path.join(ASSETS_DIR, "car.png")
+
+    key = (asset_path, tile_size)
+    sprites = _SPRITE_CACHE.get(key)
+    if sprites is None:
+        image = load_car_image(asset_path, tile_size)
+        sprites = {angle: pygame.transform.rotate(image, angle) for angle in HEADINGS}
+        _SPRITE_CACHE[key] = sprites
+    return sprites
+
+
+class CarRenderer:
+    """Car nesnesinin pygame ile çizimini yapar (araç mantığı car_manager.py'de)."""
+
+    def __init__(self, asset_path=None, tile_size=TILE_SIZE):
+        self.tile_size = tile_size
+        self.sprites = get_rotated_sprites(asset_path, tile_size)
+        self.original_image = self.sprites[0]
+
+    # ---------------------------------------------------------
+    def draw(self, screen, car, offset=(0, 0)):
+        """
+        Aracı ekran üzerine çizer; çizilen alanı (Rect) döndürür.
+        offset: kamera kayması (dünya pikselinden çıkarılır).
+        """
+        image = self.sprites[car.angle]
+
+        rect = image.get_rect(
+            center=(
+                car.pixel_x + self.tile_size // 2 - offset[0],
+                car.pixel_y + self.tile_size // 2 - offset[1],
+            )
+        )
+        return screen.blit(image, rect)  # bu fonksiyon ekrana çizmeyi yapar
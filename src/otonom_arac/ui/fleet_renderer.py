@@ -0,0 +1,47 @@
+# Dosya: src/otonom_arac/ui/fleet_renderer.py
+import numpy as np
+from otonom_arac.simulation.settings import *
+from otonom_arac.ui.car_renderer import get_rotated_sprites
+
+
+class FleetRenderer:
+    """Fleet dizilerindeki konum ve açılardan bütün araçları tek blits çağrısıyla çizer."""
+
+    def __init__(self, asset_path=None, tile_size=TILE_SIZE):
+        self.tile_size = tile_size
+        # CarRenderer ile aynı, paylaşılan döndürülmüş görseller
+        self.sprites = get_rotated_sprites(asset_path, tile_size)
+
+    # ---------------------------------------------------------
+    def draw(self, screen, fleet, offset=(0, 0)):
+        """
+        Araçları çizer; çizilen alanların (Rect) listesini döndürür.
+        offset: kamera kayması. Ekranın dışında kalan araçlar çizilmez.
+        """
+        n = fleet.count
+        if n == 0:
+            return []
+
+        sprites = self.sprites
+        half = self.tile_size // 2
+
+        # Araç merkezleri (Car çizimiyle aynı: kare ortası), ekran koordinatında
+        center_x = (fleet.pixel_x[:n] + half).astype(np.int64) - offset[0]
+        center_y = (fleet.pixel_y[:n] + half).astype(np.int64) - offset[1]
+
+        width, height = screen.get_size()
+        margin = self.tile_size
+        visible = (
+            (center_x > -margin) & (center_x < width + margin)
+            & (center_y > -margin) & (center_y < height + margin)
+        )
+        index = np.flatnonzero(visible)
+        angles = fleet.angle[index].tolist()
+
+        blit_list = []
+        for angle, x, y in zip(angles, center_x[index].tolist(), center_y[index].tolist()):
+            image = sprites[angle]
+            w, h = image.get_size()
+            blit_list.append((image, (x - w // 2, y - h // 2)))
+
+        return screen.blits(blit_list, doreturn=True)
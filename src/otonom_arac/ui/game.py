@@ -0,0 +1,693 @@
+# Dosya: src/otonom_arac/ui/game.py
+
+import pygame
+import sys
+import os
+from otonom_arac.simulation.settings import *
+from otonom_arac.algorithms.pathfinding import ALGORITHMS
+from otonom_arac.map.map_data import GAME_MAP
+from otonom_arac.ui.menu import Button
+from otonom_arac.ui.car_renderer import CarRenderer
+from otonom_arac.ui.fleet_renderer import FleetRenderer
+from otonom_arac.ui.map_layer import ChunkedMapLayer
+from otonom_arac.ui.camera import Camera
+from otonom_arac.simulation.engine import Simulation
+from otonom_arac.simulation.profiler import FRAME, FrameProfiler
+from otonom_arac.simulation.replay import Recorder
+from otonom_arac.simulation.planner_service import PlanningService
+from otonom_arac.ui.hud import HUD
+from otonom_arac.ui.assets import ASSETS_DIR, AssetManager, load_scaled_image, start_music
+
+
+# ------------------------------------------------------
+# ANA OYUN SINIFI
+# ------------------------------------------------------
+class Game:
+
+    def __init__(self, fleet_size=0, seed=0, profile=False, profile_out=None,
+                 record_path=None, replay=None, plan_workers=None, plan_processes=False,
+                 algorithm=None, game_map=None):
+        pygame.init()
+
+        # Görseller atlastan; müzik ve menü arka planı arka planda yüklenir
+        self.assets = AssetManager()
+
+        # --- MÜZİK AYARLARI ---
+        music_path = os.path.join(ASSETS_DIR, "menuMusic.mp3")  # dosya adını kendine göre ayarla
+        self.assets.load_in_background("music", start_music, music_path)
+
+        # Harita: tekrar oynatmada kayıttaki, yoksa verilen (--map) ya da gömülü harita
+        if replay is not None:
+            self.map = replay.game_map
+        else:
+            self.map = game_map if game_map is not None else GAME_MAP
+        self.rows = len(self.map)
+        self.cols = len(self.map[0])
+
+       # Ekran ayarları: pencere haritanın görünen kısmı kadar (en fazla VIEW_MAX_*)
+        self.world_width = self.cols * TILE_SIZE
+        self.world_height = self.rows * TILE_SIZE
+        self.width = min(self.world_width, VIEW_MAX_WIDTH)
+        self.height = min(self.world_height, VIEW_MAX_HEIGHT)
+        self.screen = pygame.display.set_mode((self.width, self.height))
+
+        # Kamera seçili aracı takip eder (harita pencereye sığıyorsa hiç kaymaz)
+        self.camera = Camera(self.width, self.height, self.world_width, self.world_height)
+        self.camera_offset = self.camera.offset
+        self.selected_vehicle = -1  # -1 = ana araç, 0.. = filo aracı
+
+        # --- PENCERE AYARLARI ---
+        pygame.display.set_caption("SAÜTONOM - Akıllı Araç Simülasyonu")
+        self.clock = pygame.time.Clock()  # FPS kontrolü için saat nesnesi
+        
+         # --- MENÜ ARKA PLANI --- (hazır olana kadar düz renk çizilir)
+        self.menu_bg = None
+        bg_path = os.path.join(ASSETS_DIR, "menuBackground.png")
+        self.assets.load_in_background(
+            "menu_bg", load_scaled_image, bg_path, (self.width, self.height)
+        )
+
+        # Yol/duvar/resim yükleme: hepsi tek atlastan (TILE_SIZE'a ölçekli, ekran biçiminde)
+        self.images = self.assets.load_tiles()
+
+        # Engel görseli (obstacle.png)
+        self.img_obstacle = self.images.pop("obstacle", None)
+        if self.img_obstacle is None:
+             self.img_obstacle = pygame.Surface((TILE_SIZE, TILE_SIZE))
+             self.img_obstacle.fill((200, 50, 50))
+
+        # Yaya geçidi zemini (Eğer crosswalk.png yoksa)
+        if 7 not in self.images:
+            s = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            s.fill((50, 50, 50)) 
+            self.images[7] = s
+
+        # Değişmeyen harita katmanı: parça parça, sadece görünen kısım çizilir
+        self.map_layer = ChunkedMapLayer(self.map, self.images)
+
+        # Kirli dikdörtgen çizimi: önceki karede çizilen hareketli öğelerin alanları
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.drawn_path = None
+        
+        # --- MENÜ TASARIM ÖGELERİ ---
+        # Yazı Tipleri (Fontlar)
+        self.title_font = pygame.font.SysFont("Verdana", 50, bold=True)
+        self.subtitle_font = pygame.font.SysFont("Verdana", 20)
+        self.ui_font = pygame.font.SysFont("Arial", 18, bold=True)
+        self.profile_font = pygame.font.SysFont("consolas,dejavusansmono,couriernew", 14)
+
+        # Oyun paneli (HUD): kalıcı panel yüzeyleri, yazılar değişince çizilir
+        self.hud = HUD(self.ui_font)
+        self.build_hud()
+
+        # Menüdeki Büyük Araba Logosu
+        car_path = os.path.join(ASSETS_DIR, "car.png")
+        self.menu_car_img = None
+        if os.path.exists(car_path):
+            img = pygame.image.load(car_path)
+
+            # Pencere İkonunu Ayarla (Sol üstteki küçük ikon)
+            icon_img = pygame.transform.scale(img, (32, 32))
+            pygame.display.set_icon(icon_img)
+
+            # Menü logosunu büyüt ve hafif döndür
+            img = pygame.transform.scale(img, (140, 140))
+            self.menu_car_img = pygame.transform.rotate(img, 45)
+
+        # --- OYUN DURUM DEĞİŞKENLERİ ---
+        self.state = "MENU"  # Başlangıç durumu (MENU veya GAME olabilir)
+
+        # Simülasyon çekirdeği (araç, ışıklar, engeller, rota) ekrandan bağımsız
+        # çalışır; Game sadece onu sabit adımlarla ilerletip çizer.
+        # Evre süreleri her zaman ölçülür (kare başına birkaç mikrosaniye);
+        # F3 ekrandaki tabloyu açar/kapatır, profile=True ise çıkışta özet yazılır.
+        self.profiler = FrameProfiler()
+        self.profile = profile
+        self.profile_out = profile_out
+        self.show_profile = False
+        self.profile_surface = None
+
+        self.sim = Simulation(self.map, fleet_size=fleet_size, seed=seed, profiler=self.profiler)
+
+        # Engel sonrası rotalar arka planda hesaplanır; kare araması beklemez.
+        # Kayıt alınırken teslim sabit gecikmelidir (kayıt yeniden üretilebilir kalsın).
+        # İş parçacıkları simülasyonun derlenmiş haritasını paylaşır.
+        if plan_workers is None:
+            plan_workers = PLAN_WORKERS
+        self.planner = None
+        if plan_workers > 0 and replay is None:
+            self.planner = PlanningService(
+                self.map, workers=plan_workers, processes=plan_processes,
+                fixed_delay=PLAN_RECORD_DELAY if record_path else None,
+                pathfinder=self.sim.pathfinder,
+            )
+            self.planner.start()
+            self.sim.planner = self.planner
+
+        # Kayıt: record_path verilirse her koşu bu dosyaya kaydedilir.
+        # Tekrar oynatma: sim yerine Replay'in yeniden kurduğu durum çizilir.
+        self.record_path = record_path
+        self.recorder = None
+        self.replay = replay
+        self.replay_paused = False
+        if replay is not None:
+            self.sim = replay.sim
+        self.sim_accumulator = 0.0
+        self.max_steps_per_frame = 5
+        self.car_renderer = CarRenderer()
+        self.fleet_renderer = FleetRenderer()
+
+       # --- BUTON GÖRSELLERİNİN YÜKLENMESİ ---
+        def load_button_images(base_filename, hover_filename):
+            base_img = hover_img = None
+            base_path = os.path.join(ASSETS_DIR, base_filename)
+            hover_path = os.path.join(ASSETS_DIR, hover_filename)
+
+            if os.path.exists(base_path):
+                base_img = pygame.image.load(base_path).convert_alpha()
+            if os.path.exists(hover_path):
+                hover_img = pygame.image.load(hover_path).convert_alpha()
+            return base_img, hover_img
+
+        bfs_img, bfs_hover = load_button_images("arayuzButton1.png", "arayuzButton1hover.png")
+        dfs_img, dfs_hover = load_button_images("arayuzButton2.png", "arayuzButton2hover.png")
+        astar_img, astar_hover = load_button_images("arayuzButton3.png", "arayuzButton3hover.png")
+
+        # Referans görsele göre konumlar (1280x720 tasarım)
+        # Tasarımda butonların kapladığı dikdörtgenler:
+        # x = 910, w ≈ 240
+        # y = 376 / 466 / 555, h ≈ 70
+        OFFSET_X = -60  # sola kaydırma miktarı
+        bfs_x, bfs_y   = 910 + OFFSET_X, 376
+        dfs_x, dfs_y   = 910 + OFFSET_X, 466
+        astar_x, astar_y = 910 + OFFSET_X, 555
+        btn_w, btn_h = 240, 70
+
+        # Algoritma Seçim Butonları (görsel tabanlı)py
+        # Button sınıfı image verilirse kendi rect'ini image boyutuna göre
+        # ayarlıyor ama topleft bu x,y değerlerinde kalıyor.
+        self.algo_buttons = [
+            ("BFS", Button(
+                bfs_x, bfs_y, btn_w, btn_h,
+                "", (0, 0, 0), (0, 0, 0),
+                image=bfs_img, hover_image=bfs_hover
+            )),
+            ("DFS", Button(
+                dfs_x, dfs_y, btn_w, btn_h,
+                "", (0, 0, 0), (0, 0, 0),
+                image=dfs_img, hover_image=dfs_hover
+            )),
+            ("A*", Button(
+                astar_x, astar_y, btn_w, btn_h,
+                "", (0, 0, 0), (0, 0, 0),
+                image=astar_img, hover_image=astar_hover
+            )),
+        ]
+
+        # Görseli olmayan algoritmalar: ALGORITHMS'ten üretilen yazılı butonlar,
+        # görsel butonların solunda iki sütun halinde
+        extra = [name for name in ALGORITHMS if name not in ("BFS", "DFS", "A*")]
+        small_w, small_h, gap = 200, 36, 8
+        rows = (len(extra) + 1) // 2
+        for i, name in enumerate(extra):
+            col, row = divmod(i, rows)
+            x = bfs_x - 2 * (small_w + gap) - gap + col * (small_w + gap)
+            y = bfs_y + row * (small_h + gap)
+            self.algo_buttons.append((name, Button(
+                x, y, small_w, small_h, name,
+                (40, 70, 120), (60, 100, 170), font_size=16
+            )))
+
+        # Oyun içi "GERİ DÖN" Butonu (Sağ Alt Köşe) - eski stil dikdörtgen
+        self.btn_back = Button(
+            self.width - 110, self.height - 50,
+            100, 40, "GERİ",
+            (200, 50, 50), (255, 80, 80)
+        )
+
+        if replay is not None:
+            self.start_replay()
+        elif algorithm is not None:
+            # --algo verildiyse menü atlanır, koşu doğrudan bu algoritmayla başlar
+            self.start_simulation(algorithm)
+
+    # ------------------------------------------------------
+    # HUD
+    # ------------------------------------------------------
+    def build_hud(self):
+        """Paneller ve göstergeler; konumlar pencere boyutuna göre bir kez hesaplanır."""
+        hud = self.hud
+
+        # Algoritma paneli (üst orta) ve hız paneli (alt orta)
+        top = hud.add_panel("top", 240, 45, offset_x=-70, margin=15, alpha=200)
+        top.add_widget(lambda: self.sim.selected_algorithm, "Algoritma: {}")
+        bottom = hud.add_panel("bottom", 240, 45, offset_x=-70, margin=5, alpha=220)
+        bottom.add_widget(self.active_speed, "Hız: {:.1f}")
+
+        # İstatistik paneli (sağ üst, F2): sık değişmeyen değerler seyrek okunur
+        stats = self.stats_panel = hud.add_panel("top_right", 220, 110, margin=15, alpha=200)
+        stats.add_widget(self.clock.get_fps, "FPS: {:.0f}", color=WHITE, every=15)
+        stats.add_widget(self.fleet_counts, "Filo: {0[0]} / {0[1]}", color=WHITE, every=10)
+        stats.add_widget(self.planner_latency, "Planlama: {:.2f} ms", color=WHITE, every=10)
+        stats.add_widget(self.pending_plans, "Bekleyen rota: {}", color=WHITE, every=5)
+        stats.visible = False
+
+        hud.layout(self.width, self.height)
+
+    def active_speed(self):
+        car = self.sim.car
+        return car.current_speed if car else 0
+
+    def fleet_counts(self):
+        """(varan, toplam) filo aracı."""
+        fleet = self.sim.fleet
+        if fleet is None:
+            return (0, 0)
+        return (int(fleet.arrived().sum()), fleet.count)
+
+    def planner_latency(self):
+        """Rota hesabı başına ortalama süre (ms)."""
+        metrics = self.sim.metrics
+        if metrics is None or metrics.plan_count == 0:
+            return 0.0
+        return metrics.planner_time / metrics.plan_count * 1000.0
+
+    def pending_plans(self):
+        return len(self.planner) if self.planner is not None else 0
+
+    # ------------------------------------------------------
+    # SİMÜLASYONU BAŞLAT
+    # ------------------------------------------------------
+    def start_simulation(self, algo_name):
+        self.state = "GAME"
+        self.sim_accumulator = 0.0
+        self.full_redraw = True
+        self.sim.reset(algo_name)
+        self.hud.reset()
+
+        if self.record_path:
+            self.stop_recording()
+            self.recorder = Recorder(self.sim, self.record_path)
+            print(f"⏺️ Kayıt: {self.record_path}")
+
+        self.reset_view()
+
+    def reset_view(self):
+        self.selected_vehicle = -1
+        self.camera.following = True
+        target = self.selected_vehicle_px()
+        if target:
+            self.camera.center_on(*target)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    # ------------------------------------------------------
+    # TEKRAR OYNATMA
+    # ------------------------------------------------------
+    def start_replay(self):
+        self.state = "GAME"
+        self.sim_accumulator = 0.0
+        self.replay.seek(0)
+        self.full_redraw = True
+        self.reset_view()
+
+    def seek_replay(self, tick):
+        """Kayıtta tick adımına atlar; rota ve tüm ekran yeniden çizilir."""
+        self.replay.seek(tick)
+        self.sim_accumulator = 0.0
+        self.full_redraw = True
+
+    def handle_replay_key(self, key):
+        """SPACE duraklat, PAGE UP/DOWN 10 sn geri/ileri, HOME/END başa/sona."""
+        replay = self.replay
+        jump = 10 * FPS
+        if key == pygame.K_SPACE:
+            self.replay_paused = not self.replay_paused
+        elif key == pygame.K_PAGEUP:
+            self.seek_replay(replay.tick - jump)
+        elif key == pygame.K_PAGEDOWN:
+            self.seek_replay(replay.tick + jump)
+        elif key == pygame.K_HOME:
+            self.seek_replay(0)
+        elif key == pygame.K_END:
+            self.seek_replay(replay.tick_count)
+
+    # ------------------------------------------------------
+    # KAMERA
+    # ------------------------------------------------------
+    def selected_vehicle_px(self):
+        """Takip edilen aracın merkezinin dünya pikseli; araç yoksa None."""
+        half = TILE_SIZE // 2
+        fleet = self.sim.fleet
+        if self.selected_vehicle >= 0 and fleet is not None and self.selected_vehicle < fleet.count:
+            i = self.selected_vehicle
+            return float(fleet.pixel_x[i]) + half, float(fleet.pixel_y[i]) + half
+        car = self.sim.car
+        if car:
+            return car.pixel_x + half, car.pixel_y + half
+        return None
+
+    def select_next_vehicle(self):
+        """TAB: ana araç -> filo araçları -> ana araç."""
+        count = self.sim.fleet.count if self.sim.fleet is not None else 0
+        self.selected_vehicle += 1
+        if self.selected_vehicle >= count:
+            self.selected_vehicle = -1
+        self.camera.following = True
+
+    def update_camera(self, dt):
+        """Oklarla kaydırma ya da seçili aracı takip; kamera kaydıysa tam çizim."""
+        keys = pygame.key.get_pressed()
+        dx = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * CAMERA_PAN_SPEED * dt
+        dy = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * CAMERA_PAN_SPEED * dt
+        if dx or dy:
+            self.camera.following = False
+            self.camera.pan(dx, dy)
+        elif self.camera.following:
+            target = self.selected_vehicle_px()
+            if target:
+                self.camera.follow(*target)
+
+        offset = self.camera.offset
+        if offset != self.camera_offset:
+            self.camera_offset = offset
+            self.full_redraw = True
+
+    # ------------------------------------------------------
+    # GAME LOOP
+    # ------------------------------------------------------
+    def run(self):
+        while True:
+            mouse_pos = pygame.mouse.get_pos()
+            events = pygame.event.get()
+
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.assets.shutdown()
+                    if self.planner is not None:
+                        self.planner.shutdown()
+                    self.stop_recording()
+                    self.finish_profile()
+                    pygame.quit()
+                    sys.exit()
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.show_profile = not self.show_profile
+                    self.profile_surface = None
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                    self.stats_panel.visible = not self.stats_panel.visible
+
+                if self.state == "MENU":
+                    for name, button in self.algo_buttons:
+                        if button.is_clicked(event):
+                            self.start_simulation(name)
+                            break
+
+                elif self.state == "GAME":
+                    if self.btn_back.is_clicked(event):
+                        if self.replay is not None:
+                            self.seek_replay(0)   # tekrar oynatmada menü yok: başa sar
+                        else:
+                            self.stop_recording()
+                            self.state = "MENU"
+                    elif event.type == pygame.KEYDOWN:
+                        if self.replay is not None:
+                            self.handle_replay_key(event.key)
+                        if event.key == pygame.K_TAB:
+                            self.select_next_vehicle()
+                        elif event.key == pygame.K_f:
+                            self.camera.following = True
+
+            dt = self.clock.tick(FPS) / 1000.0
+
+            # Kare süresi bekleme (clock.tick) sonrasından ölçülür
+            prof = self.profiler
+            prof.frame_begin()
+            t = prof.clock()
+
+            if self.state == "GAME":
+                self.advance_simulation(dt)
+                t = prof.lap("sim", t)
+                self.update_camera(dt)
+                t = prof.lap("camera", t)
+
+            self.render_frame(mouse_pos)
+            prof.frame_end()
+
+    def finish_profile(self):
+        """Çıkışta profil özetini yazdırır (profile açıksa)."""
+        if not self.profile:
+            return
+        self.profiler.print_summary()
+        if self.profile_out:
+            self.profiler.dump(self.profile_out)
+
+    # ------------------------------------------------------
+    def render_frame(self, mouse_pos):
+        """
+        Menüde tüm ekran çizilip flip edilir. Oyunda sadece değişen
+        bölgeler display.update(rects) ile ekrana gönderilir.
+        """
+        prof = self.profiler
+        if self.state == "MENU":
+            t = prof.clock()
+            self.screen.fill(BLACK)
+            self.draw_menu(mouse_pos)
+            pygame.display.flip()
+            prof.lap("menu", t)
+            self.full_redraw = True
+            return
+
+        rects = self.draw_game(mouse_pos)
+        t = prof.clock()
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        prof.lap("present", t)
+
+    # ------------------------------------------------------
+    def advance_simulation(self, dt):
+        """
+        Geçen gerçek süreyi sabit simülasyon adımlarına böler.
+        Kare yavaşlarsa en fazla max_steps_per_frame adım telafi edilir.
+        """
+        if self.replay is not None:
+            if self.replay_paused:
+                return
+            step = self.replay.step
+        else:
+            step = self.sim.step
+
+        self.sim_accumulator += dt
+        steps = 0
+        while self.sim_accumulator >= self.sim.dt and steps < self.max_steps_per_frame:
+            step()
+            self.sim_accumulator -= self.sim.dt
+            steps += 1
+
+        if steps == self.max_steps_per_frame:
+            self.sim_accumulator = 0.0
+
+    # ------------------------------------------------------
+    # MENÜ ÇİZİMİ
+    # ------------------------------------------------------
+    def draw_menu(self, mouse_pos):
+        """Menü ekranını çizer (Arkaplan, Başlık, Butonlar)"""
+        if self.menu_bg is None:
+            bg_img = self.assets.ready("menu_bg")
+            if bg_img is not None:
+                self.menu_bg = bg_img.convert()
+
+        # Yeni arka plan
+        if self.menu_bg:
+            self.screen.blit(self.menu_bg, (0, 0))
+        else:
+            self.screen.fill((25, 30, 40))  # Yedek Koyu Gri/Lacivert
+
+        for _, button in self.algo_buttons:
+            button.check_hover(mouse_pos)
+            button.draw(self.screen)
+
+    # ------------------------------------------------------
+    # OYUN ÇİZİMİ
+    # ------------------------------------------------------
+    def draw_game(self, mouse_pos):
+        """
+        Oyun ekranını çizer. Tam çizim yapıldıysa None, yoksa ekrana
+        gönderilmesi gereken kirli dikdörtgenlerin listesini döndürür.
+
+        Her karede önce bir önceki karede hareketli öğelerin (araç, ışıklar,
+        engeller, paneller) kapladığı alanlar harita katmanından geri yüklenir,
+        sonra bu öğeler yeniden çizilir. Rota çizgisi opak olduğu için her karede
+        aynı piksellere yeniden çizilmesi sorun değildir; rota değiştiğinde
+        (yeniden planlama) eski çizgiyi silmek için tam çizim yapılır.
+        """
+        if self.sim.current_path is not self.drawn_path:
+            self.full_redraw = True
+            self.drawn_path = self.sim.current_path
+
+        prof = self.profiler
+        t = prof.clock()
+
+        full = self.full_redraw
+        restored = self.dirty_rects
+        if full:
+            self.draw_map()
+        else:
+            for rect in restored:
+                self.map_layer.draw(self.screen, self.camera, rect)
+        t = prof.lap("draw_map", t)
+
+        ox, oy = self.camera.offset
+        rects = self.draw_traffic_lights()
+        t = prof.lap("draw_traffic_lights", t)
+
+        # Araba çizimi (hareket simülasyon adımında yapıldı)
+        car = self.sim.car
+        if car:
+            rects.append(self.car_renderer.draw(self.screen, car, (ox, oy)))
+
+        # Filo araçları (dizilerden tek seferde, sadece ekrandakiler)
+        if self.sim.fleet is not None:
+            rects.extend(self.fleet_renderer.draw(self.screen, self.sim.fleet, (ox, oy)))
+
+        # Dinamik engelleri çiz
+        for (r, c) in self.sim.dynamic_obstacles:
+            x = c * TILE_SIZE - ox
+            y = r * TILE_SIZE - oy
+            if -TILE_SIZE < x < self.width and -TILE_SIZE < y < self.height:
+                rects.append(self.screen.blit(self.img_obstacle, (x, y)))
+        t = prof.lap("draw_vehicles", t)
+
+        self.draw_path()
+        t = prof.lap("draw_path", t)
+
+        # Paneller (algoritma, hız, F2 ile istatistikler)
+        rects.extend(self.hud.draw(self.screen))
+
+        # "Geri Dön" Butonunu Çiz
+        self.btn_back.check_hover(mouse_pos)
+        self.btn_back.draw(self.screen)
+        rects.append(self.btn_back.rect.union(self.btn_back.shadow_rect))
+        t = prof.lap("hud", t)
+
+        if self.show_profile:
+            rects.append(self.draw_profile_overlay())
+            prof.lap("profile_overlay", t)
+
+        self.dirty_rects = rects
+        self.full_redraw = False
+        if full:
+            return None
+        return restored + rects
+
+    # ------------------------------------------------------
+    def draw_map(self):
+        """Kameranın gördüğü harita parçalarını (önbellekten) ekrana kopyalar."""
+        self.map_layer.sync(self.sim.pathfinder.map_version)
+        self.map_layer.draw(self.screen, self.camera)
+
+    def visible_traffic_lights(self):
+        """Sadece görünen karelerdeki ışıklar (satır-öncelikli sırayla)."""
+        r0, r1, c0, c1 = self.camera.visible_tiles(TILE_SIZE)
+        light_at = self.sim.occupancy.light_at
+        lights = []
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                tl = light_at(r, c)
+                if tl is not None:
+                    lights.append(tl)
+        return lights
+
+    # ------------------------------------------------------
+    def draw_traffic_lights(self):
+        """Görünen ışıkları çizer; her ışığın kapladığı alanların listesini döndürür."""
+        ox, oy = self.camera.offset
+        rects = []
+        for tl in self.visible_traffic_lights():
+            x = tl.col * TILE_SIZE - ox
+            y = tl.row * TILE_SIZE - oy
+            
+            # 1. Önce "Sönük" Trafik Işığı Resmini Çiz (Direk ve Kutu)
+            if "traffic_light_img" in self.images:
+                 img = self.images.get("traffic_light_img")
+                 # Resmi olduğu gibi karenin üzerine oturt
+                 self.screen.blit(img, (x, y))
+            
+            # 2. Şimdi YANAN ışığı (parlak daireyi) resmin üzerine çiz
+            # create_assets.py'de hesaplanan: Merkez X=20, Kırmızı Y=10, Yeşil Y=30
+            # x, y karenin sol üst köşesidir. Merkezler buna göre kaydırılır.
+            
+            light_x = x + 20 
+            
+            if tl.state == "RED":
+                # Kırmızı Işık (Üst - y+10)
+                # Parlama efekti için önce biraz büyük şeffaf, sonra küçük parlak
+                glow = pygame.draw.circle(self.screen, (255, 0, 0), (light_x, y + 10), 5)
+                # Orta noktaya beyazımsı parlaklık
+                pygame.draw.circle(self.screen, (255, 100, 100), (light_x, y + 10), 2)
+            else:
+                # Yeşil Işık (Alt - y+30)
+                glow = pygame.draw.circle(self.screen, (0, 255, 0), (light_x, y + 30), 5)
+                # Orta noktaya beyazımsı parlaklık
+                pygame.draw.circle(self.screen, (100, 255, 100), (light_x, y + 30), 2)
+
+            rects.append(pygame.Rect(x, y, TILE_SIZE, TILE_SIZE).union(glow))
+
+        return rects
+
+    # ------------------------------------------------------
+    def draw_profile_overlay(self):
+        """
+        Sol üstte evre başına p50/p95/p99 (ms) tablosu. Yüzdelikler her karede
+        sıralama gerektirdiği için tablo 15 karede bir yeniden oluşturulur.
+        """
+        prof = self.profiler
+        if self.profile_surface is None or prof.frames % 15 == 0:
+            rows = [("evre", "p50", "p95", "p99")]
+            order = [p for p in prof.order if p != FRAME] + [FRAME]
+            for phase in order:
+                if phase in prof.samples:
+                    rows.append((phase,) + tuple(f"{v:.2f}" for v in prof.percentiles(phase)))
+
+            # Yazı tipi eş aralıklı olmayabilir: her sütun ayrı, sayılar sağa yaslı
+            font = self.profile_font
+            line_h = font.get_linesize()
+            rendered = [[font.render(cell, True, WHITE) for cell in row] for row in rows]
+            name_w = max(row[0].get_width() for row in rendered) + 12
+            num_w = max(cell.get_width() for row in rendered for cell in row[1:]) + 12
+            surface = pygame.Surface((name_w + 3 * num_w + 12, line_h * len(rows) + 10))
+            surface.set_alpha(210)
+            surface.fill((20, 20, 20))
+            for i, row in enumerate(rendered):
+                y = 5 + i * line_h
+                surface.blit(row[0], (6, y))
+                for j, cell in enumerate(row[1:], 1):
+                    surface.blit(cell, (6 + name_w + j * num_w - cell.get_width(), y))
+            self.profile_surface = surface
+
+        return self.screen.blit(self.profile_surface, (10, 10))
+
+    # ------------------------------------------------------
+    def draw_path(self):
+        if len(self.sim.current_path) < 2:
+            return
+
+        ox, oy = self.camera.offset
+        pts = []
+        for (r, c) in self.sim.current_path:
+            x = c * TILE_SIZE + TILE_SIZE // 2 - ox
+            y = r * TILE_SIZE + TILE_SIZE // 2 - oy
+            pts.append((x, y))
+
+        if len(pts) >= 2:
+            # Beyaz dış çizgi (gölge)
+            pygame.draw.lines(self.screen, (255, 255, 255), False, pts, 2)
+            # Sarı/Turuncu iç çizgi (rota)
+            pygame.draw.lines(self.screen, (255, 215, 0), False, pts, 4)
\ No newline at end of file
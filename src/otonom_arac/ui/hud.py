@@ -0,0 +1,175 @@
+# Dosya: src/otonom_arac/ui/hud.py
+#
+# Oyun ekranı panelleri (HUD).
+# Her panelin yarı saydam zemini, çerçevesi ve yazıları tek bir kalıcı
+# yüzeyde (SRCALPHA) birleştirilir; karede panel başına tek blit yapılır.
+# Bir gösterge (widget) değeri değişmedikçe yazısı yeniden çizilmez, panel
+# yüzeyi de yeniden birleştirilmez. Konumlar pencere boyutuna göre bir kez
+# hesaplanır (layout).
+#
+# Kullanım:
+#   hud = HUD(font)
+#   panel = hud.add_panel("top", 240, 45, offset_x=-70, margin=15)
+#   panel.add_widget(lambda: game.sim.selected_algorithm, "Algoritma: {}")
+#   hud.layout(width, height)
+#   rects = hud.draw(screen)      # her kare
+
+import pygame
+from otonom_arac.simulation.settings import ORANGE, WHITE
+
+
+class TextCache:
+    """(yazı, renk) -> Surface. Aynı yazı ikinci kez çizilmez."""
+
+    def __init__(self, font, max_items=512):
+        self.font = font
+        self.max_items = max_items
+        self.surfaces = {}
+        self.renders = 0
+
+    def render(self, text, color):
+        key = (text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if len(self.surfaces) >= self.max_items:
+                self.surfaces.clear()   # sık değişen sayılar (FPS) sınırsız büyümesin
+            surface = self.surfaces[key] = self.font.render(text, True, color)
+            self.renders += 1
+        return surface
+
+
+class Widget:
+    """
+    getter() değerini fmt ile yazıya çevirir. every > 1 ise değer sadece
+    every karede bir okunur (FPS gibi her karede okunması gerekmeyenler).
+    """
+
+    def __init__(self, getter, fmt="{}", color=ORANGE, every=1):
+        self.getter = getter
+        self.fmt = fmt
+        self.color = color
+        self.every = every
+        self.value = None
+        self.text = None
+        self.surface = None
+
+    def poll(self, frame, text_cache):
+        """Yazı değiştiyse True."""
+        if self.surface is not None and frame % self.every:
+            return False
+        value = self.getter()
+        if value == self.value and self.surface is not None:
+            return False
+        self.value = value
+        text = self.fmt.format(value)
+        if text == self.text:
+            return False
+        self.text = text
+        self.surface = text_cache.render(text, self.color)
+        return True
+
+
+class Panel:
+    """
+    anchor: "top" / "bottom" (yatayda ortalı, offset_x kadar kaydırılmış),
+    "top_right" ya da "top_left". Göstergeler alt alta ortalanır.
+    """
+
+    def __init__(self, anchor, width, height, offset_x=0, margin=15, alpha=200,
+                 background=(20, 20, 20), border=WHITE, border_width=2):
+        self.anchor = anchor
+        self.width = width
+        self.height = height
+        self.offset_x = offset_x
+        self.margin = margin
+        self.alpha = alpha
+        self.background = background
+        self.border = border
+        self.border_width = border_width
+        self.widgets = []
+        self.visible = True
+        self.pos = (0, 0)
+        self.base = None       # zemin + çerçeve (bir kez çizilir)
+        self.surface = None    # zemin + çerçeve + yazılar
+
+    def add_widget(self, getter, fmt="{}", color=ORANGE, every=1):
+        widget = Widget(getter, fmt, color, every)
+        self.widgets.append(widget)
+        self.surface = None
+        return widget
+
+    def layout(self, screen_w, screen_h):
+        w, h, m = self.width, self.height, self.margin
+        if self.anchor == "top":
+            self.pos = ((screen_w - w) // 2 + self.offset_x, m)
+        elif self.anchor == "bottom":
+            self.pos = ((screen_w - w) // 2 + self.offset_x, screen_h - h - m)
+        elif self.anchor == "top_right":
+            self.pos = (screen_w - w - m, m)
+        else:
+            self.pos = (m, m)
+
+        base = pygame.Surface((w, h), pygame.SRCALPHA)
+        base.fill(self.background + (self.alpha,))
+        if self.border_width:
+            pygame.draw.rect(base, self.border, base.get_rect(), self.border_width)
+        self.base = base
+        self.surface = None
+
+    def update(self, frame, text_cache):
+        changed = False
+        for widget in self.widgets:
+            if widget.poll(frame, text_cache):
+                changed = True
+        if changed or self.surface is None:
+            self.compose()
+
+    def compose(self):
+        surface = self.base.copy()
+        count = len(self.widgets)
+        step = self.height / count if count else 0
+        for i, widget in enumerate(self.widgets):
+            if widget.surface is None:
+                continue
+            center = (self.width // 2, int(step * i + step / 2))
+            surface.blit(widget.surface, widget.surface.get_rect(center=center))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()   # blit sırasında biçim dönüşümü olmasın
+        self.surface = surface
+
+    def draw(self, screen):
+        return screen.blit(self.surface, self.pos)
+
+
+class HUD:
+    def __init__(self, font):
+        self.text_cache = TextCache(font)
+        self.panels = []
+        self.frame = 0
+
+    def add_panel(self, anchor, width, height, **options):
+        panel = Panel(anchor, width, height, **options)
+        self.panels.append(panel)
+        return panel
+
+    def layout(self, screen_w, screen_h):
+        """Pencere boyutu değişmedikçe bir kez çağrılır."""
+        for panel in self.panels:
+            panel.layout(screen_w, screen_h)
+
+    def reset(self):
+        """Yeni koşuda göstergeler baştan okunsun."""
+        for panel in self.panels:
+            for widget in panel.widgets:
+                widget.value = widget.text = widget.surface = None
+            panel.surface = None
+
+    def draw(self, screen):
+        """Görünür panelleri çizer; kirli dikdörtgenleri döndürür."""
+        self.frame += 1
+        rects = []
+        for panel in self.panels:
+            if panel.visible:
+                panel.update(self.frame, self.text_cache)
+                rects.append(panel.draw(screen))
+        return rects
@@ -0,0 +1,164 @@
+# Dosya: src/otonom_arac/ui/map_layer.py
+import pygame
+from collections import OrderedDict
+from otonom_arac.simulation.settings import *
+
+# Yol karesinin 4 komşu maskesi -> yol görseli anahtarı
+# (yukarı = 1, sağ = 2, aşağı = 4, sol = 8)
+ROAD_MASK_KEYS = {
+    5: "v", 1: "v", 4: "v",
+    10: "h", 2: "h", 8: "h",
+    3: "ur", 6: "rd", 12: "dl",
+    9: "lu", 14: "t_down", 11: "t_up",
+    7: "t_right", 13: "t_left", 15: "cross"
+}
+
+ROAD_TILES = (0, 3, 4, 5, 6, 7)
+
+
+class ChunkedMapLayer:
+    """
+    Haritanın hiç değişmeyen kısmı (yol otomatik döşemesi, duvar, su,
+    başlangıç/hedef, yaya geçidi çizgileri). Harita chunk_tiles x chunk_tiles
+    karelik parçalara bölünür, sadece görünen parçalar çizilip önbelleğe
+    alınır. Önbellek en son kullanılana göre (LRU) tutulur ve toplam Surface
+    belleği budget_bytes'ı aşınca en eski parçalar atılır; harita sürümü
+    değişince bütün parçalar atılır.
+    """
+
+    def __init__(self, game_map, images, chunk_tiles=CHUNK_TILES,
+                 budget_bytes=CHUNK_CACHE_MB * 1024 * 1024):
+        self.map = game_map
+        self.images = images
+        self.rows = len(game_map)
+        self.cols = len(game_map[0])
+        self.map_version = None
+        self.chunk_tiles = chunk_tiles
+        self.budget_bytes = budget_bytes
+        self.chunks = OrderedDict()   # (parça satırı, parça sütunu) -> Surface
+        self.memory_used = 0
+        self.loads = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------
+    def is_road(self, r, c):
+        # Yaya geçidi (7) de yol sayılır
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return self.map[r][c] in ROAD_TILES
+        return False
+
+    def road_mask(self, r, c):
+        mask = 0
+        if self.is_road(r - 1, c): mask += 1
+        if self.is_road(r, c + 1): mask += 2
+        if self.is_road(r + 1, c): mask += 4
+        if self.is_road(r, c - 1): mask += 8
+        return mask
+
+    # ------------------------------------------------------
+    def draw_area(self, surface, r0, r1, c0, c1):
+        """[r0, r1) x [c0, c1) karelerini surface'in sol üst köşesinden başlayarak çizer."""
+        surface.fill(BLACK)
+
+        images = self.images
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                cell = self.map[r][c]
+
+                # YOL, KAVŞAK, IŞIK veya YAYA GEÇİDİ için yol çiz
+                if cell in (0, 5, 6, 7):
+                    # Yaya Geçidi (7) için zemin yolunu seç, diğerleri için normal maske
+                    if cell == 7:
+                        img = images.get(7)  # Yaya geçidi zemini
+                    else:
+                        img = images.get(ROAD_MASK_KEYS.get(self.road_mask(r, c), "h"))
+                else:
+                    img = images.get(cell)
+
+                if img:
+                    surface.blit(img, ((c - c0) * TILE_SIZE, (r - r0) * TILE_SIZE))
+
+        # Yaya geçitlerinin çizgilerini en üstte çiz (Yolun üzerine)
+        self.draw_crosswalk_lines(surface, r0, r1, c0, c1)
+
+    def draw_crosswalk_lines(self, surface, r0=0, r1=None, c0=0, c1=None):
+        """Yaya geçitlerinin beyaz çizgilerini haritanın üzerine çizer."""
+        r1 = self.rows if r1 is None else r1
+        c1 = self.cols if c1 is None else c1
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                if self.map[r][c] == 7:
+                    x = (c - c0) * TILE_SIZE
+                    y = (r - r0) * TILE_SIZE
+
+                    # Yolun yatay mı dikey mi olduğunu kontrol et
+                    is_horizontal = self.is_road(r, c - 1) or self.is_road(r, c + 1)
+
+                    if is_horizontal:
+                        # Yatay yol üzerinde DİKEY çizgiler çiz (Klasik yaya geçidi)
+                        for i in range(5, TILE_SIZE, 8):
+                            pygame.draw.rect(surface, WHITE, (x, y + i, TILE_SIZE, 4))
+                    else:
+                        # Dikey yol üzerinde YATAY çizgiler çiz
+                        for i in range(5, TILE_SIZE, 8):
+                            pygame.draw.rect(surface, WHITE, (x + i, y, 4, TILE_SIZE))
+
+    # ------------------------------------------------------
+    def invalidate(self):
+        self.chunks.clear()
+        self.memory_used = 0
+
+    def sync(self, map_version):
+        """Harita sürümü değiştiyse bütün parçaları atar."""
+        if map_version != self.map_version:
+            self.invalidate()
+            self.map_version = map_version
+
+    def get_chunk(self, cr, cc):
+        key = (cr, cc)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        size = self.chunk_tiles
+        r0, c0 = cr * size, cc * size
+        r1, c1 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+        chunk = pygame.Surface(((c1 - c0) * TILE_SIZE, (r1 - r0) * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        self.draw_area(chunk, r0, r1, c0, c1)
+
+        self.chunks[key] = chunk
+        self.memory_used += chunk.get_bytesize() * chunk.get_width() * chunk.get_height()
+        self.loads += 1
+
+        # Bütçe aşıldıysa en eski parçaları at (az önce eklenen hariç)
+        while self.memory_used > self.budget_bytes and len(self.chunks) > 1:
+            _, old = self.chunks.popitem(last=False)
+            self.memory_used -= old.get_bytesize() * old.get_width() * old.get_height()
+            self.evictions += 1
+        return chunk
+
+    # ------------------------------------------------------
+    def draw(self, screen, camera, area=None):
+        """
+        Kameranın gördüğü parçaları ekrana çizer. area (ekran koordinatlı Rect)
+        verilirse sadece o bölge yenilenir.
+        """
+        if area is None:
+            area = pygame.Rect(0, 0, camera.view_width, camera.view_height)
+        ox, oy = camera.offset
+        chunk_px = self.chunk_tiles * TILE_SIZE
+
+        first_cc = max(0, (area.left + ox) // chunk_px)
+        last_cc = min((self.cols - 1) // self.chunk_tiles, (area.right - 1 + ox) // chunk_px)
+        first_cr = max(0, (area.top + oy) // chunk_px)
+        last_cr = min((self.rows - 1) // self.chunk_tiles, (area.bottom - 1 + oy) // chunk_px)
+
+        old_clip = screen.get_clip()
+        screen.set_clip(area)
+        for cr in range(first_cr, last_cr + 1):
+            for cc in range(first_cc, last_cc + 1):
+                screen.blit(self.get_chunk(cr, cc), (cc * chunk_px - ox, cr * chunk_px - oy))
+        screen.set_clip(old_clip)
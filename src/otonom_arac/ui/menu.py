@@ -2,14 +2,14 @@ import pygame
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color,
-                 image=None, hover_image=None):
+                 image=None, hover_image=None, font_size=24):
         # Temel dikdörtgen yapısı
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text if text is not None else ""
         self.base_color = color
         self.hover_color = hover_color
         self.current_color = color
-        self.font = pygame.font.SysFont("Verdana", 24, bold=True)
+        self.font = pygame.font.SysFont("Verdana", font_size, bold=True)
         self.is_hovered = False
 
         # Gölge rect'i
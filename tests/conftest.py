@@ -0,0 +1,7 @@
+# Dosya: tests/conftest.py
+# Testler paket kurulmadan da (depo kökünden "python -m pytest") çalışsın diye
+# src klasörü içe aktarma yoluna eklenir.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -28,3 +28,190 @@
 
 #Yol sonunda araç durduğu halde hız göstergesi 4 olrak kalıyor.
 #Algoritma A* ile BFS aynı engeller ve aynı yolu kullanıyor. Engeller çıktığında da aynı rotayı tercih ediyor.
+
+
+# ==============================================================
+# Otomatik testler (python -m pytest)
+# ==============================================================
+import gc
+import random
+import weakref
+
+from otonom_arac.algorithms.pathfinding import ALGORITHMS, APPROXIMATE_ALGORITHMS, PathFinder
+from otonom_arac.map.occupancy import OccupancyGrid
+
+
+def random_open_map(size, seed, density=0.75):
+    """Geniş açık alanlı rastgele harita (0: yol, 1: duvar)."""
+    rng = random.Random(seed)
+    return [[0 if rng.random() < density else 1 for _ in range(size)] for _ in range(size)]
+
+
+def road_cells(game_map):
+    return [(r, c) for r, row in enumerate(game_map) for c, v in enumerate(row) if v == 0]
+
+
+def assert_valid_path(game_map, path, start, goal, blocked):
+    """Rota start'tan goal'a komşu, duvarsız ve engelsiz karelerden geçmeli."""
+    assert path[0] == start and path[-1] == goal
+    for (r0, c0), (r1, c1) in zip(path, path[1:]):
+        assert abs(r0 - r1) + abs(c0 - c1) == 1
+    for r, c in path:
+        assert game_map[r][c] == 0 and (r, c) not in blocked
+
+
+def assert_matches_bfs(algorithm, game_map, path, bfs, start, goal, blocked):
+    """En kısa rotayı bulanlar BFS ile aynı uzunlukta; DFS/HPA* en az o kadar."""
+    assert bool(path) == bool(bfs), (algorithm, start, goal)
+    if not bfs:
+        return
+    assert_valid_path(game_map, path, start, goal, blocked)
+    if algorithm in APPROXIMATE_ALGORITHMS:
+        assert len(path) >= len(bfs), (algorithm, start, goal)
+    else:
+        assert len(path) == len(bfs), (algorithm, start, goal)
+
+
+def test_planners_match_bfs_on_random_maps():
+    for seed in range(4):
+        rng = random.Random(seed)
+        game_map = random_open_map(40, seed)
+        finder = PathFinder(game_map, route_cache_size=0)
+        roads = road_cells(game_map)
+        for _ in range(25):
+            start, goal = rng.choice(roads), rng.choice(roads)
+            bfs = finder.search("BFS", start, goal)
+            for algorithm in ALGORITHMS:
+                path = finder.search(algorithm, start, goal)
+                assert_matches_bfs(algorithm, game_map, path, bfs, start, goal, ())
+
+
+def test_planners_match_bfs_with_dynamic_obstacles():
+    for seed in range(4):
+        rng = random.Random(100 + seed)
+        game_map = random_open_map(40, seed)
+        finder = PathFinder(game_map, route_cache_size=0)
+        roads = road_cells(game_map)
+        for _ in range(25):
+            grid = OccupancyGrid(40, 40)
+            for cell in rng.sample(roads, 40):
+                grid.add_obstacle(cell)
+            start, goal = rng.choice(roads), rng.choice(roads)
+            if start in grid or goal in grid:
+                continue
+            bfs = finder.search("BFS", start, goal, grid)
+            for algorithm in ALGORITHMS:
+                path = finder.search(algorithm, start, goal, grid)
+                assert_matches_bfs(algorithm, game_map, path, bfs, start, goal, grid)
+
+
+def test_incremental_planners_and_route_cache_follow_obstacle_changes():
+    """
+    Aynı PathFinder ve aynı OccupancyGrid üzerinde rastgele engel ekleyip
+    kaldırırken D* Lite, Distance Field ve önbellekli aramalar her adımda
+    önbelleksiz, sıfırdan bir BFS ile aynı sonucu vermeli.
+    """
+    for seed in range(3):
+        rng = random.Random(200 + seed)
+        game_map = random_open_map(40, seed)
+        finder = PathFinder(game_map)
+        reference = PathFinder(game_map, route_cache_size=0)
+        grid = OccupancyGrid(40, 40)
+        roads = road_cells(game_map)
+        queries = [(rng.choice(roads), rng.choice(roads)) for _ in range(6)]
+        endpoints = {cell for query in queries for cell in query}
+        free = [cell for cell in roads if cell not in endpoints]
+
+        for _ in range(60):
+            if grid and rng.random() < 0.4:
+                grid.remove_obstacle(rng.choice(list(grid)))
+            else:
+                grid.add_obstacle(rng.choice(free))
+            for start, goal in queries:
+                bfs = reference.search("BFS", start, goal, set(grid))
+                for algorithm in ("D* Lite", "Distance Field", "BFS", "A*", "HPA*"):
+                    path = finder.search(algorithm, start, goal, grid)
+                    assert_matches_bfs(algorithm, game_map, path, bfs, start, goal, grid)
+        assert finder.route_cache.hits > 0
+
+
+def test_hpa_star_rebuilds_entrance_when_obstacle_splits_border():
+    """
+    İki küme arasındaki tek geçiş, 5 karelik açık bir sınır aralığıdır; geçit
+    aralığın ortasındadır. Ortaya engel düşünce aralık ikiye bölünür ve her
+    parça için yeni geçit açılmalıdır (BFS hâlâ karşıya ulaşır).
+    """
+    game_map = [[0] * 32 for _ in range(32)]
+    for r in range(32):
+        if not 2 <= r <= 6:
+            game_map[r][16] = 1
+    finder = PathFinder(game_map, route_cache_size=0)
+    grid = OccupancyGrid(32, 32)
+
+    assert finder.search("HPA*", (0, 0), (0, 31), grid)
+    grid.add_obstacle((4, 16))
+    bfs = finder.search("BFS", (0, 0), (0, 31), grid)
+    hpa = finder.search("HPA*", (0, 0), (0, 31), grid)
+    assert bfs and hpa and len(hpa) >= len(bfs)
+    assert (4, 16) not in hpa
+
+    # Engel kalkınca ilk durumdaki geçit geri gelir
+    grid.remove_obstacle((4, 16))
+    assert (4, 16) in finder.search("HPA*", (0, 0), (0, 31), grid)
+
+
+def test_hpa_star_entrance_obstacles_match_bfs_reachability():
+    """
+    Engel bir geçide düşünce ya da açık bir sınır aralığını bölünce HPA*
+    geçitleri yeniden kurmalı: BFS'in ulaştığı her hedefe o da ulaşmalı.
+    """
+    for seed in range(6):
+        rng = random.Random(seed)
+        game_map = random_open_map(48, seed)
+        finder = PathFinder(game_map, route_cache_size=0)
+        entrances = sorted(finder.get_hierarchical().inter_edges)
+        roads = road_cells(game_map)
+        for _ in range(150):
+            grid = OccupancyGrid(48, 48)
+            for cell in rng.sample(entrances, 3):
+                grid.add_obstacle(divmod(cell, 48))
+            start, goal = rng.choice(roads), rng.choice(roads)
+            if start in grid or goal in grid:
+                continue
+            hpa = finder.search("HPA*", start, goal, grid)
+            bfs = finder.search("BFS", start, goal, grid)
+            assert bool(hpa) == bool(bfs), (seed, start, goal, list(grid))
+            if bfs:
+                assert len(hpa) >= len(bfs)
+
+
+def test_route_cache_releases_and_detaches_grids():
+    """
+    Önbellek ızgarayı canlı tutmamalı; silinen ızgaranın kayıtları yeni bir
+    ızgaraya (id'si aynı çıksa bile) isabet olarak dönmemeli. detach()
+    dinleyiciyi söker ve ızgaranın kayıtlarını atar.
+    """
+    game_map = [[0] * 12 for _ in range(3)]
+    finder = PathFinder(game_map)
+    cache = finder.route_cache
+
+    grid = OccupancyGrid(3, 12)
+    grid.add_obstacle((1, 6))
+    blocked = finder.search("BFS", (1, 0), (1, 11), grid)
+    assert (1, 6) not in blocked and cache.grids
+    ref = weakref.ref(grid)
+    del grid
+    gc.collect()
+    assert ref() is None
+    assert not cache.grids and () not in cache.buckets and not cache.entries
+
+    # Aynı sürümde, başka bir karede engeli olan yeni ızgara: eski rota dönmemeli
+    other = OccupancyGrid(3, 12)
+    other.add_obstacle((0, 6))
+    path = finder.search("BFS", (1, 0), (1, 11), other)
+    assert len(path) == 12 and (0, 6) not in path
+
+    cache.detach(other)
+    assert other.listeners == [] and not cache.grids and not cache.entries
+    other.add_obstacle((1, 3))
+    assert (1, 3) not in finder.search("BFS", (1, 0), (1, 11), other)
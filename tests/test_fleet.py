@@ -0,0 +1,83 @@
+# Dosya: tests/test_fleet.py
+# Vektörel Fleet.step, tek tek Car.update kurallarıyla aynı sonucu vermeli:
+# kırmızı ışıkta bekleyen, yaya geçidinden geçen ve engele takılan küçük bir
+# filo N kare boyunca Car nesneleriyle yan yana koşturulur.
+import random
+
+import numpy as np
+
+from otonom_arac.car.car_manager import Car
+from otonom_arac.car.fleet import Fleet
+from otonom_arac.simulation.engine import Simulation, TrafficLight
+from otonom_arac.simulation.settings import FPS
+
+TICKS = 900
+
+
+def build_routes(sim, count, seed):
+    """Işıklı (kırmızıda başlar) ve yaya geçidi karelerinden hedeflere seed'e bağlı rotalar."""
+    rng = random.Random(seed)
+    starts = (sim.find_all(6), sim.find_all(7))
+    goals = sim.find_all(4)
+    routes = []
+    while len(routes) < count:
+        start = rng.choice(starts[len(routes) % 2])
+        path = list(sim.pathfinder.search("A*", start, rng.choice(goals)) or ())
+        if path and len(path) > 1:
+            routes.append((path, path[-1]))
+    return routes
+
+
+def test_fleet_step_matches_car_update():
+    sim = Simulation(verbose=False)
+    routes = build_routes(sim, count=8, seed=3)
+
+    # Her iki taraf kendi ışık nesnelerini alır, aynı zamanlamayla ilerletilir
+    car_lights = [TrafficLight(r, c) for r, c in sim.find_all(6)]
+    fleet_lights = [TrafficLight(r, c) for r, c in sim.find_all(6)]
+
+    fleet = Fleet(sim.map, capacity=4)   # kapasite büyütmesi de denensin
+    fleet.set_traffic_lights(fleet_lights)
+    cars = []
+    for path, goal in routes:
+        fleet.add_vehicle(path, goal)
+        car = Car(*path[0])
+        car.set_path(path)
+        cars.append(car)
+
+    # Bir aracın rotasına engel: o araç iki tarafta da aynı karede durmalı
+    blocked_path = routes[0][0]
+    obstacles = {blocked_path[len(blocked_path) // 2]}
+
+    dt = 1.0 / FPS
+    car_waits = [0] * len(cars)
+    fleet_waits = np.zeros(len(cars), dtype=np.int64)
+    seen_crosswalk = False
+    for tick in range(TICKS):
+        for tl in car_lights + fleet_lights:
+            tl.update(dt)
+
+        car_replan = []
+        for i, car in enumerate(cars):
+            if car.update(sim.map, car_lights, obstacles):
+                car_replan.append(i)
+            car_waits[i] += car.is_waiting_red
+        fleet_replan = fleet.step(fleet_lights, obstacles).tolist()
+        fleet_waits += fleet.is_waiting_red[:fleet.count]
+        seen_crosswalk |= any(c.crosswalk_cooldown for c in cars)
+
+        assert fleet_replan == car_replan, tick
+        assert fleet.is_waiting_red[:fleet.count].tolist() == [c.is_waiting_red for c in cars], tick
+        assert fleet_waits.tolist() == car_waits, tick
+        assert fleet.path_index[:fleet.count].tolist() == [c.path_index for c in cars], tick
+        assert fleet.crosswalk_cooldown[:fleet.count].tolist() == [c.crosswalk_cooldown for c in cars], tick
+        assert fleet.row[:fleet.count].tolist() == [c.row for c in cars], tick
+        assert fleet.col[:fleet.count].tolist() == [c.col for c in cars], tick
+        np.testing.assert_allclose(fleet.pixel_x[:fleet.count], [c.pixel_x for c in cars], atol=1e-9)
+        np.testing.assert_allclose(fleet.pixel_y[:fleet.count], [c.pixel_y for c in cars], atol=1e-9)
+
+    # Senaryo gerçekten ışıkta bekleme, yaya geçidi, engel ve varış içermeli
+    assert min(car_waits) > 0
+    assert 0 in car_replan
+    assert fleet.arrived().sum() > 0
+    assert seen_crosswalk
@@ -0,0 +1,76 @@
+# Dosya: tests/test_replay.py
+# Kayıt/oynatma (simulation/replay.py): filolu ve engelli kısa bir ekransız
+# koşu kaydedilir; verify birebir aynı olmalı, seek(n) n. adımın durumunu vermeli.
+import random
+
+import pytest
+
+from otonom_arac.simulation.engine import Simulation
+from otonom_arac.simulation.planner_service import PlanningService
+from otonom_arac.simulation.replay import Recorder, Replay, state_of, verify
+from otonom_arac.simulation.settings import PLAN_RECORD_DELAY
+
+TICKS = 500
+
+
+def record_run(path, plan_workers=0):
+    sim = Simulation(fleet_size=12, seed=5, obstacle_delay=2.0, verbose=False)
+    if plan_workers:
+        sim.planner = PlanningService(sim.map, workers=plan_workers,
+                                      fixed_delay=PLAN_RECORD_DELAY, pathfinder=sim.pathfinder)
+        sim.planner.start()
+    assert sim.reset("A*")
+    recorder = Recorder(sim, str(path), snapshot_every=64)
+
+    states = [state_of(sim)]
+    for _ in range(TICKS):
+        sim.step()
+        states.append(state_of(sim))
+    recorder.close()
+    if sim.planner is not None:
+        sim.planner.shutdown()
+
+    # Koşuda engel düşmüş ve filo hareket etmiş olmalı
+    assert sim.obstacle_placed and sim.fleet is not None and sim.fleet.count == 12
+    assert states[0] != states[-1]
+    return states
+
+
+@pytest.mark.parametrize("plan_workers", [0, 2])
+def test_verify_reports_bit_exact_replay(tmp_path, plan_workers):
+    path = tmp_path / "run.oarp"
+    record_run(path, plan_workers)
+
+    replay = Replay(str(path))
+    assert replay.tick_count == TICKS
+    assert replay.header["fleet_size"] == 12
+    assert verify(replay) is None
+
+
+def test_seek_reproduces_recorded_state(tmp_path):
+    path = tmp_path / "run.oarp"
+    states = record_run(path)
+
+    replay = Replay(str(path))
+    ticks = [0, 1, 63, 64, 65, 200, TICKS - 1, TICKS] + random.Random(0).sample(range(TICKS), 10)
+    random.Random(1).shuffle(ticks)
+    for tick in ticks:
+        replay.seek(tick)
+        assert replay.tick == tick
+        assert state_of(replay.sim) == states[tick], tick
+
+    # Baştan adım adım oynatma da aynı durumlardan geçer
+    replay.seek(0)
+    for tick in range(1, TICKS + 1):
+        assert replay.step()
+        assert state_of(replay.sim) == states[tick], tick
+    assert not replay.step()
+
+
+def test_verify_detects_divergence(tmp_path):
+    path = tmp_path / "run.oarp"
+    record_run(path)
+
+    replay = Replay(str(path))
+    replay.header["seed"] += 1   # filo başka konumlardan başlar
+    assert verify(replay) == 0
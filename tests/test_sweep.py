@@ -0,0 +1,58 @@
+# Dosya: tests/test_sweep.py
+# Senaryo matrisi (simulation/sweep.py): aynı koşuyu tekrarlayan satırlar atılmalı
+from otonom_arac.simulation.sweep import build_scenarios, run_scenario
+
+
+def keys(scenarios):
+    return sorted(
+        (s["obstacle_delay"] is None, s["obstacle_delay"] or 0.0, s["obstacle_offset"], s["seed"], s["fleet_size"])
+        for s in scenarios
+    )
+
+
+def test_fleetless_scenarios_use_first_seed_only():
+    scenarios = build_scenarios(["A*"], ["campus"], [6.0], [4], [0, 1, 2], [0, 50])
+    assert keys(scenarios) == [
+        (False, 6.0, 4, 0, 0),
+        (False, 6.0, 4, 0, 50), (False, 6.0, 4, 1, 50), (False, 6.0, 4, 2, 50),
+    ]
+    # İlk tohum listedeki sıraya göre seçilir
+    assert {s["seed"] for s in build_scenarios(["A*"], ["campus"], [6.0], [4], [7, 3], [0])} == {7}
+
+
+def test_obstacle_free_scenarios_use_first_offset_only():
+    scenarios = build_scenarios(["A*"], ["campus"], [None, 6.0], [4, 6], [0], [0])
+    assert keys(scenarios) == [(False, 6.0, 4, 0, 0), (False, 6.0, 6, 0, 0), (True, 0.0, 4, 0, 0)]
+
+
+def test_scenario_matrix_counts():
+    algorithms, maps = ["BFS", "A*"], ["campus", "city_40x40"]
+    base = (algorithms, maps, [None, 3.0, 6.0], [4, 6], [0, 1, 2])
+    per_pair = len(algorithms) * len(maps)
+    # Engelsiz: 1 konum, engelli: 2 gecikme x 2 konum; filosuz: 1 tohum
+    assert len(build_scenarios(*base, [0])) == per_pair * (1 + 2 * 2)
+    # Filo varsa bütün tohumlar kalır
+    assert len(build_scenarios(*base, [0, 10])) == per_pair * (1 + 2 * 2) * (1 + 3)
+
+
+def test_dropped_rows_repeat_the_kept_run():
+    # Atılan satırlar gerçekten aynı sonucu verir (tohum filosuz koşuyu, konum engelsiz koşuyu değiştirmez)
+    ignored = ("seed", "obstacle_offset", "wall_time", "planner_ms")
+    kept, *dropped = [
+        run_scenario(dict(algorithm="A*", map="campus", obstacle_delay=delay,
+                          obstacle_offset=offset, seed=seed, fleet_size=0), max_ticks=2000)
+        for delay, offset, seed in ((None, 4, 0), (None, 6, 0), (None, 4, 1))
+    ]
+    assert kept["error"] is None and kept["finished"]
+    for result in dropped:
+        assert {k: v for k, v in result.items() if k not in ignored} == \
+            {k: v for k, v in kept.items() if k not in ignored}
+
+    with_obstacle = [
+        run_scenario(dict(algorithm="A*", map="campus", obstacle_delay=1.0,
+                          obstacle_offset=6, seed=seed, fleet_size=0), max_ticks=2000)
+        for seed in (0, 1)
+    ]
+    assert with_obstacle[0]["obstacle_cell"]
+    assert {k: v for k, v in with_obstacle[0].items() if k not in ignored} == \
+        {k: v for k, v in with_obstacle[1].items() if k not in ignored}
@@ -0,0 +1,81 @@
+# Dosya: tests/test_telemetry.py
+# Telemetri halka tamponu ve dışa aktarma (simulation/telemetry.py)
+import json
+
+import numpy as np
+import pytest
+
+from otonom_arac.simulation.engine import Simulation
+from otonom_arac.simulation.telemetry import (
+    PLAN_FIELDS, PLAN_KINDS, TICK_FIELDS, RingBuffer, Telemetry, load_npz,
+)
+
+
+def test_ring_buffer_keeps_newest_in_order():
+    buf = RingBuffer(PLAN_FIELDS, 8)
+    for i in range(5):
+        buf.append((i, 0, 1, 0, i * 0.5, i, i, i, i))
+    assert len(buf) == 5 and buf.dropped == 0
+    assert buf.column("tick").tolist() == [0, 1, 2, 3, 4]
+
+    # Taşırınca en eski örnekler düşer, sıra eski -> yeni kalır
+    for i in range(5, 21):
+        buf.append((i, 0, 1, 0, i * 0.5, i, i, i, i))
+    assert len(buf) == 8 and buf.total == 21 and buf.dropped == 13
+    assert buf.column("tick").tolist() == list(range(13, 21))
+    assert buf.column("elapsed_ms").tolist() == [i * 0.5 for i in range(13, 21)]
+
+    # Tam kapasitenin katında da sıra bozulmaz
+    for i in range(21, 24):
+        buf.append((i, 0, 1, 0, i * 0.5, i, i, i, i))
+    assert buf.total % buf.capacity == 0
+    assert buf.column("tick").tolist() == list(range(16, 24))
+
+    buf.clear()
+    assert len(buf) == 0 and buf.column("tick").tolist() == []
+
+
+def recorded_telemetry():
+    # Küçük tick tamponu: koşu boyunca taşar, düşen örnek sayısı da aktarılmalı
+    telemetry = Telemetry(tick_capacity=64, plan_capacity=16)
+    sim = Simulation(fleet_size=4, seed=2, obstacle_delay=1.0, verbose=False, telemetry=telemetry)
+    assert sim.reset("A*")
+    sim.run(max_ticks=200)
+    assert telemetry.ticks.dropped > 0 and len(telemetry.plans) > 0
+    return telemetry
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".npz"])
+def test_export_round_trip(tmp_path, suffix):
+    telemetry = recorded_telemetry()
+    path = str(tmp_path / ("run" + suffix))
+    telemetry.export(path)
+
+    if suffix == ".npz":
+        ticks, plans, meta = load_npz(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        meta, rows = rows[0], rows[1:]
+        assert meta.pop("type") == "meta"
+        tick_rows = [r for r in rows if r["type"] == "tick"]
+        plan_rows = [r for r in rows if r["type"] == "plan"]
+        assert len(rows) == len(tick_rows) + len(plan_rows)
+        for r in plan_rows:
+            r["kind"] = PLAN_KINDS.index(r["kind"])
+        ticks = {name: np.array([r[name] for r in tick_rows]) for name, _ in TICK_FIELDS}
+        plans = {name: np.array([r[name] for r in plan_rows]) for name, _ in PLAN_FIELDS}
+
+    assert meta == {
+        "algorithm": "A*",
+        "dropped_ticks": telemetry.ticks.dropped,
+        "dropped_plans": telemetry.plans.dropped,
+    }
+    for buffer, exported in ((telemetry.ticks, ticks), (telemetry.plans, plans)):
+        assert sorted(exported) == sorted(buffer.names)
+        for name in buffer.names:
+            # float32 sütunlar json'da float64 olarak yazılır; değer aynı kalmalı
+            np.testing.assert_array_equal(
+                exported[name].astype(buffer.columns[name].dtype), buffer.column(name), err_msg=name,
+            )
+    assert ticks["tick"].tolist() == sorted(ticks["tick"].tolist())
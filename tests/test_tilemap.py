@@ -0,0 +1,102 @@
+# Dosya: tests/test_tilemap.py
+# İkili harita biçimi (map/tilemap.py): yazma/okuma, başlık doğrulaması ve
+# gömülü kampüs haritasının eski liste listesiyle aynı olması.
+import pytest
+
+from otonom_arac.map.map_data import GAME_MAP
+from otonom_arac.map.tilemap import (
+    FORMAT_VERSION, HEADER, MAGIC, TileMap, from_bytes, from_rows, load_map, save_map,
+)
+
+# map_data.py'nin ikili biçimden önceki GAME_MAP listesi (satır başına 40 kare)
+OLD_GAME_MAP = [
+    "1405005111111222222222111111111111111111",
+    "1110110111111222222222006500006500000001",
+    "1505005005005222222222011011111011111101",
+    "1011110110110222222222011011111011111101",
+    "1000076005005000000000670000700600000051",
+    "1011010110110222222222011011111011111101",
+    "1011010110110222222222011011111011111101",
+    "1011010110110222222222011011111011111101",
+    "1011010110110222222222570500000500000051",
+    "1011010110110222222222011011111011111101",
+    "1011010110110222222222011011111011111101",
+    "1500500005005222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1011000065005000000000670000000000000051",
+    "1011011110110222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1500500005005222222222507000000500000051",
+    "1011011110110222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1011011110110222222222011011111011111101",
+    "1500506705005000000000670500000500000051",
+    "1111111111111222222222111111111111311111",
+    "1111111111111222222222111111111111011111",
+]
+
+
+def old_rows():
+    return [[int(v) for v in row] for row in OLD_GAME_MAP]
+
+
+def test_game_map_matches_old_rows():
+    assert isinstance(GAME_MAP, TileMap)
+    assert (len(GAME_MAP), len(GAME_MAP[0])) == (25, 40)
+    assert [list(row) for row in GAME_MAP] == old_rows()
+    assert GAME_MAP.to_lists() == old_rows()
+    assert GAME_MAP[23][34] == 3 and GAME_MAP.find_all(4) == [(0, 1)]
+
+
+def test_save_load_round_trip(tmp_path):
+    rows = old_rows()
+    path = tmp_path / "campus.map"
+    save_map(str(path), rows)
+
+    data = path.read_bytes()
+    assert data[:HEADER.size] == HEADER.pack(MAGIC, FORMAT_VERSION, 0, 25, 40)
+    assert len(data) == HEADER.size + 25 * 40
+
+    loaded = load_map(str(path))
+    assert loaded.source == str(path)
+    assert loaded.to_lists() == rows
+    assert loaded.grid[4, 22] == rows[4][22]
+
+    # from_rows ve from_bytes aynı bellek içi haritayı verir; TileMap de yazılabilir
+    in_memory = from_rows(rows)
+    assert from_bytes(25, 40, in_memory.tobytes()).to_lists() == rows
+    assert from_rows(loaded).tobytes() == loaded.tobytes()
+    again = tmp_path / "again.map"
+    save_map(str(again), loaded)
+    assert again.read_bytes() == data
+    loaded.close()
+
+
+def test_from_rows_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        from_rows([[0, 0, 0], [0, 0]])
+
+
+def test_short_data_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        from_bytes(3, 3, bytes(8))
+
+    # Başlık 4x4 diyor, veri 15 bayt
+    path = tmp_path / "short.map"
+    path.write_bytes(HEADER.pack(MAGIC, FORMAT_VERSION, 0, 4, 4) + bytes(15))
+    with pytest.raises(ValueError):
+        load_map(str(path))
+
+
+@pytest.mark.parametrize("data", [
+    b"OAM",                                                      # başlıktan kısa
+    HEADER.pack(b"XXXX", FORMAT_VERSION, 0, 1, 1) + bytes(1),    # sihirli sözcük yanlış
+    HEADER.pack(MAGIC, FORMAT_VERSION + 1, 0, 1, 1) + bytes(1),  # bilinmeyen sürüm
+])
+def test_bad_header_is_rejected(tmp_path, data):
+    path = tmp_path / "bad.map"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        load_map(str(path))